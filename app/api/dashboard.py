@@ -18,6 +18,10 @@ from models.ImageTable import ImageTable
 from models.folder_status import FolderStatus
 from vector.realtime_vector import get_qdrant_client
 from vector.collection_manager import resolve_collection_name
+from vector.embedding_cache import embedding_cache_stats
+from services.utils.file_hash import file_hash_cache_stats
+from services.ocr_executor import ocr_stats
+from services.dedup import dedup_stats
 
 logger = logging.getLogger("dashboard")
 
@@ -241,3 +245,16 @@ async def get_folder_status(db: Session = Depends(get_db)):
         )
 
     return {"folders": folder_items}
+
+
+@router.get("/cache")
+async def get_cache_status():
+    """
+    캐시 적중/미스 통계 (임베딩 / 파일 해시 / OCR / 근접 중복 chunk)
+    """
+    return {
+        "embedding": embedding_cache_stats(),
+        "file_hash": file_hash_cache_stats(),
+        "ocr": ocr_stats(),
+        "dedup": dedup_stats(),
+    }
@@ -2,6 +2,7 @@ from fastapi import APIRouter
 from datetime import datetime
 
 from pipeline import state
+from services.image_ocr_queue import image_ocr_metrics
 from pipeline.runner import (
     start_pipeline,
     stop_pipeline,
@@ -28,6 +29,8 @@ def pipeline_status():
         "observer_alive": alive,
         "started_at": state.started_at,
         "uptime_seconds": uptime,
+        "workers": state.handler.pool.metrics() if state.handler else None,
+        "image_ocr": image_ocr_metrics(),
     }
 
 
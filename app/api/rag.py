@@ -9,9 +9,10 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 
+from app.blocking import run_blocking
 from vector.embedding import embed_text
 from vector.realtime_vector import get_qdrant_client
-from vector.collection_manager import resolve_collection_name
+from vector.collection_manager import build_search_params, resolve_collection_name
 from config.runtime_settings import runtime_settings
 
 logger = logging.getLogger("rag")
@@ -75,6 +76,13 @@ def _call_gemini(prompt: str, model: str = "gemini-1.5-flash") -> str:
     return response.text
 
 
+_LLM_CALLS = {
+    "openai": _call_openai,
+    "ollama": _call_ollama,
+    "gemini": _call_gemini,
+}
+
+
 # =================================================
 # Request / Response Models
 # =================================================
@@ -87,6 +95,13 @@ class RAGRequest(BaseModel):
         default=None, description="LLM 제공자 (openai, ollama, gemini)"
     )
     llm_model: Optional[str] = Field(default=None, description="LLM 모델명")
+    oversampling: Optional[float] = Field(
+        default=None, ge=1.0, le=10.0,
+        description="양자화 검색 후보 배수 (기본: 임베딩 모델 설정)",
+    )
+    rescore: Optional[bool] = Field(
+        default=None, description="양자화 후보를 원본 벡터로 재채점 (기본: 임베딩 모델 설정)"
+    )
 
 
 class SourceDocument(BaseModel):
@@ -140,7 +155,7 @@ async def rag_chat(req: RAGRequest):
     # 2️⃣ 벡터 검색
     # -------------------------------------------------
     try:
-        query_vector = embed_text(req.question, model_key)
+        query_vector = await run_blocking(embed_text, req.question, model_key)
     except Exception as e:
         logger.error(f"[RAG] embedding failed: {e}")
         raise HTTPException(status_code=500, detail=f"임베딩 실패: {str(e)}")
@@ -158,10 +173,14 @@ async def rag_chat(req: RAGRequest):
 
     try:
         # qdrant-client 1.8+ uses query_points method
-        search_response = client.query_points(
+        search_response = await run_blocking(
+            client.query_points,
             collection_name=collection_name,
             query=query_vector,
             limit=req.top_k,
+            search_params=build_search_params(
+                model_key, oversampling=req.oversampling, rescore=req.rescore
+            ),
             with_payload=True,
         )
         search_result = search_response.points
@@ -222,17 +241,15 @@ async def rag_chat(req: RAGRequest):
 위 문서 내용을 바탕으로 질문에 답변해주세요. 문서에 없는 내용은 "문서에서 관련 정보를 찾을 수 없습니다"라고 말씀해주세요.
 내용이 없을 시 참고 문서는 표시하지 마세요 """
 
+    call_llm = _LLM_CALLS.get(llm_provider)
+    if call_llm is None:
+        raise HTTPException(
+            status_code=400, detail=f"지원하지 않는 LLM 제공자: {llm_provider}"
+        )
+
     try:
-        if llm_provider == "openai":
-            answer = _call_openai(prompt, llm_model)
-        elif llm_provider == "ollama":
-            answer = _call_ollama(prompt, llm_model)
-        elif llm_provider == "gemini":
-            answer = _call_gemini(prompt, llm_model)
-        else:
-            raise HTTPException(
-                status_code=400, detail=f"지원하지 않는 LLM 제공자: {llm_provider}"
-            )
+        # blocking SDK 호출 → 전용 스레드 풀 (이벤트 루프 비차단)
+        answer = await run_blocking(call_llm, prompt, llm_model)
 
     except Exception as e:
         logger.error(f"[RAG] LLM call failed: {e}")
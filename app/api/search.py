@@ -9,9 +9,10 @@ from pydantic import BaseModel, Field
 
 from qdrant_client.models import Filter, FieldCondition, MatchValue
 
+from app.blocking import run_blocking
 from vector.embedding import embed_text
 from vector.realtime_vector import get_qdrant_client
-from vector.collection_manager import resolve_collection_name
+from vector.collection_manager import build_search_params, resolve_collection_name
 
 logger = logging.getLogger("search")
 
@@ -32,6 +33,13 @@ class SearchRequest(BaseModel):
     score_threshold: Optional[float] = Field(
         default=None, ge=0.0, le=1.0, description="최소 유사도 점수"
     )
+    oversampling: Optional[float] = Field(
+        default=None, ge=1.0, le=10.0,
+        description="양자화 검색 후보 배수 (기본: 임베딩 모델 설정)",
+    )
+    rescore: Optional[bool] = Field(
+        default=None, description="양자화 후보를 원본 벡터로 재채점 (기본: 임베딩 모델 설정)"
+    )
 
 
 class SearchResult(BaseModel):
@@ -68,6 +76,7 @@ async def search_documents(req: SearchRequest):
     - folder_name: 특정 폴더 내 검색 (선택)
     - file_type: 특정 파일타입 필터 (선택)
     - score_threshold: 최소 유사도 점수 (선택)
+    - oversampling / rescore: 양자화 컬렉션 검색 정확도 조절 (선택)
     """
 
     # -------------------------------------------------
@@ -85,7 +94,7 @@ async def search_documents(req: SearchRequest):
     # 2️⃣ 쿼리 임베딩
     # -------------------------------------------------
     try:
-        query_vector = embed_text(req.query, model_key)
+        query_vector = await run_blocking(embed_text, req.query, model_key)
     except Exception as e:
         logger.error(f"[SEARCH] embedding failed: {e}")
         raise HTTPException(status_code=500, detail=f"임베딩 실패: {str(e)}")
@@ -119,12 +128,16 @@ async def search_documents(req: SearchRequest):
 
     try:
         # qdrant-client 1.16+ uses query_points instead of search
-        search_result = client.query_points(
+        search_result = await run_blocking(
+            client.query_points,
             collection_name=collection_name,
             query=query_vector,
             limit=req.top_k,
             query_filter=query_filter,
             score_threshold=req.score_threshold,
+            search_params=build_search_params(
+                model_key, oversampling=req.oversampling, rescore=req.rescore
+            ),
             with_payload=True,
         )
         # query_points returns QueryResponse with .points attribute
@@ -172,7 +185,7 @@ async def list_collections():
     """
     try:
         client = get_qdrant_client()
-        collections = client.get_collections()
+        collections = await run_blocking(client.get_collections)
         return {"collections": [c.name for c in collections.collections]}
     except Exception as e:
         logger.error(f"[SEARCH] list collections failed: {e}")
@@ -186,7 +199,7 @@ async def get_collection_info(collection_name: str):
     """
     try:
         client = cast(Any, get_qdrant_client())
-        info = client.get_collection(collection_name)
+        info = await run_blocking(client.get_collection, collection_name)
 
         # qdrant-client 1.16+ API compatibility
         vectors_config = info.config.params.vectors
@@ -1,8 +1,8 @@
 import os
-import shutil
 import uuid
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from services.utils.file_ops import resolve_duplicate_filename
+from services.utils.file_hash import save_stream_with_sha1
 
 from pipeline import status_store
 
@@ -29,8 +29,8 @@ async def upload_file(file: UploadFile = File(...)):
     dest_path = os.path.join(INCOMING_DIR, safe_filename)
 
     try:
-        with open(dest_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # 저장과 동시에 해시 계산 (watcher 에서 재해시 생략)
+        save_stream_with_sha1(file.file, dest_path)
     finally:
         await file.close()
 
@@ -1,11 +1,11 @@
 import os
-import shutil
 from pathlib import Path
 from typing import List
 
 from fastapi import APIRouter, UploadFile, File, Header, HTTPException
 
 from pipeline import status_store
+from services.utils.file_hash import save_stream_with_sha1
 
 BASE_DIR = "watch_dir"
 INCOMING_DIR = Path(BASE_DIR) / "incoming"
@@ -44,8 +44,8 @@ async def upload_folder_raw(
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(dest_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            # 저장과 동시에 해시 계산 (watcher 에서 재해시 생략)
+            save_stream_with_sha1(file.file, str(dest_path))
         finally:
             await file.close()
 
@@ -0,0 +1,35 @@
+# app/blocking.py
+"""
+async 엔드포인트에서 blocking 호출(임베딩 SDK, 동기 Qdrant client, LLM SDK)을
+이벤트 루프 밖의 전용 스레드 풀에서 실행
+
+- 풀 크기 = 동시에 진행 가능한 blocking 호출 수 상한 (BLOCKING_IO_WORKERS)
+- 느린 LLM 응답 1건이 같은 uvicorn worker 의 다른 요청을 막지 않음
+"""
+
+import os
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+BLOCKING_IO_WORKERS = int(os.getenv("BLOCKING_IO_WORKERS", "16"))
+
+_executor = ThreadPoolExecutor(
+    max_workers=BLOCKING_IO_WORKERS,
+    thread_name_prefix="blocking-io",
+)
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _executor,
+        functools.partial(fn, *args, **kwargs),
+    )
+
+
+def shutdown_blocking_executor():
+    _executor.shutdown(wait=False, cancel_futures=True)
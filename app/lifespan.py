@@ -1,7 +1,10 @@
 from contextlib import asynccontextmanager
 import logging
 
+from app.blocking import shutdown_blocking_executor
 from pipeline.runner import start_pipeline, stop_pipeline
+from services.loaders.pdf_loader import shutdown_pdf_pool
+from services.ocr_executor import shutdown_ocr_executor
 
 logger = logging.getLogger("lifespan")
 
@@ -15,3 +18,6 @@ async def lifespan(app):
 
     logger.info("🛑 FastAPI shutdown")
     stop_pipeline()
+    shutdown_blocking_executor()
+    shutdown_pdf_pool()
+    shutdown_ocr_executor()
@@ -4,17 +4,17 @@ import os
 from watcher.file_watcher import IngestHandler, SUPPORTED_EXT
 
 
-def batch_ingest_folder(root_dir: str):
+def batch_ingest_folder(root_dir: str, handler: IngestHandler | None = None):
     """
     서버 시작 시 incoming 디렉터리 초기 스캔
     - 폴더 → IngestHandler._handle_directory
-    - 파일 → IngestHandler._handle_file
+    - 파일 → IngestHandler worker pool (병렬), 전체 완료까지 대기
     ⚠ ingest 로직은 절대 여기서 구현하지 않는다
     """
 
     print(f"[BATCH] scanning existing contents: {root_dir}")
 
-    handler = IngestHandler()
+    handler = handler or IngestHandler()
     root = Path(root_dir)
 
     if not root.exists():
@@ -28,9 +28,16 @@ def batch_ingest_folder(root_dir: str):
             handler._handle_directory(str(entry))
 
     # 2️⃣ incoming 루트에 바로 있는 파일 처리
+    futures = []
     for entry in sorted(root.iterdir()):
         if entry.is_file() and entry.suffix.lower() in SUPPORTED_EXT:
             print(f"[BATCH] found file: {entry}")
-            handler._handle_file(str(entry))
+            futures.append(handler.submit_file(str(entry)))
+
+    for future in futures:
+        try:
+            future.result()
+        except Exception:
+            pass   # _handle_file 에서 error 폴더 이동 + 로그 처리됨
 
     print("[BATCH] initial scan completed")
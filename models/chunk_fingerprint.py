@@ -0,0 +1,50 @@
+# models/chunk_fingerprint.py
+"""
+content_table chunk SimHash 지문 (근접 중복 chunk 탐지용)
+
+- simhash : 64bit SimHash (signed BIGINT 로 저장)
+- band0~3 : simhash 를 16bit 씩 4등분 → 해밍 거리 3 이하인 두 지문은
+            최소 1개 band 가 반드시 일치 (band 인덱스로 후보 조회)
+- 원본(실제 임베딩된) chunk 만 등록, 문서 삭제 시 CASCADE
+
+CREATE TABLE chunk_fingerprint (
+    content_id INT NOT NULL,
+    doc_id INT NOT NULL,
+    simhash BIGINT NOT NULL,
+    band0 INT NOT NULL,
+    band1 INT NOT NULL,
+    band2 INT NOT NULL,
+    band3 INT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (content_id),
+    KEY idx_fp_band0 (band0),
+    KEY idx_fp_band1 (band1),
+    KEY idx_fp_band2 (band2),
+    KEY idx_fp_band3 (band3),
+    CONSTRAINT fk_fp_content FOREIGN KEY (content_id) REFERENCES content_table (content_id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, BigInteger, DateTime, ForeignKey
+from config.db import Base
+
+
+class ChunkFingerprint(Base):
+    __tablename__ = "chunk_fingerprint"
+
+    content_id = Column(
+        Integer,
+        ForeignKey("content_table.content_id", ondelete="CASCADE"),
+        primary_key=True,
+        autoincrement=False,
+    )
+    doc_id = Column(Integer, nullable=False)
+
+    simhash = Column(BigInteger, nullable=False)
+    band0 = Column(Integer, nullable=False, index=True)
+    band1 = Column(Integer, nullable=False, index=True)
+    band2 = Column(Integer, nullable=False, index=True)
+    band3 = Column(Integer, nullable=False, index=True)
+
+    created_at = Column(DateTime, default=datetime.now)
@@ -3,6 +3,8 @@ import logging
 from datetime import datetime
 
 from batch.folder_batch import batch_ingest_folder
+from services.image_ocr_queue import start_image_ocr_queue, stop_image_ocr_queue
+from services.ingest import BASE_COLLECTION, get_collection_name
 from watcher.file_watcher import IngestHandler
 from pipeline import state
 from watchdog.observers import Observer   # ✅
@@ -25,6 +27,25 @@ def ensure_directories():
         os.makedirs(d, exist_ok=True)
 
 
+def _start_image_ocr():
+    """
+    이미지 OCR 큐 시작 (collection 확인 실패 시 backlog 회수 없이 시작)
+    """
+    model_key = os.getenv("MODEL_KEY")
+    collection_name = None
+
+    if model_key:
+        try:
+            collection_name = get_collection_name(
+                base_collection=BASE_COLLECTION,
+                model_key=model_key,
+            )
+        except Exception as e:
+            logger.warning(f"[IMAGE OCR] backlog disabled (collection unavailable): {e}")
+
+    start_image_ocr_queue(collection_name=collection_name, model_key=model_key)
+
+
 def start_pipeline():
     if state.observer:
         logger.warning("Pipeline already running")
@@ -34,17 +55,25 @@ def start_pipeline():
 
     ensure_directories()
 
-    logger.info("📂 Batch ingest existing files/folders...")
-    batch_ingest_folder(INCOMING_DIR)
+    _start_image_ocr()
+
+    # batch 스캔과 watcher 가 같은 worker pool 공유
+    handler = IngestHandler()
+
+    logger.info(
+        f"📂 Batch ingest existing files/folders... "
+        f"(workers={handler.pool.max_workers})"
+    )
+    batch_ingest_folder(INCOMING_DIR, handler=handler)
 
     logger.info("👀 Starting file watcher...")
     observer = Observer()
-    handler = IngestHandler()
 
     observer.schedule(handler, INCOMING_DIR, recursive=True)
     observer.start()
 
     state.observer = observer
+    state.handler = handler
     state.started_at = datetime.now()
 
     logger.info("✅ Pipeline running")
@@ -59,7 +88,15 @@ def stop_pipeline():
     state.observer.stop()
     state.observer.join()
 
+    # 처리 중인 파일은 완료까지 대기, 대기 중 job 은 취소 (다음 시작 시 재스캔)
+    if state.handler:
+        state.handler.shutdown(wait=True)
+
+    # 텍스트 ingest 종료 후 (마지막 문서의 enqueue 까지 받은 뒤) 중지
+    stop_image_ocr_queue(wait=True)
+
     state.observer = None
+    state.handler = None
     state.started_at = None
 
     logger.info("✅ Pipeline stopped cleanly")
@@ -1,8 +1,13 @@
 # pipeline/state.py
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from watchdog.observers import Observer   # ✅ 유일한 정답
 from datetime import datetime
 
+if TYPE_CHECKING:
+    from watcher.file_watcher import IngestHandler
+
 observer: Observer | None = None
 started_at: datetime | None = None
+handler: IngestHandler | None = None   # worker pool 보유 (watcher.file_watcher)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+ExcelLoader 메모리/처리량 비교 스크립트
+
+합성 .xlsx (기본 1,000,000 행)를 만들고
+pandas 경로(시트 전체 DataFrame 로드)와 openpyxl read_only 스트리밍 경로의
+peak RSS 와 rows/s 를 비교한다.
+(측정은 모드별 별도 프로세스에서 실행 → peak RSS 가 서로 섞이지 않음)
+
+사용법:
+    python scripts/bench_excel_loader.py --rows 1000000
+    python scripts/bench_excel_loader.py --file /path/to/export.xlsx
+"""
+
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+import json
+import time
+import argparse
+import resource
+import subprocess
+import tempfile
+
+MODES = ("pandas", "streaming")
+
+
+def _make_workbook(path: str, rows: int, cols: int):
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("data")
+    ws.append([f"col_{c}" for c in range(cols)])
+    for r in range(rows):
+        ws.append([r] + [f"value {r}-{c}" for c in range(1, cols)])
+    wb.save(path)
+
+
+def _peak_rss_mb() -> float:
+    # linux: KB 단위
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _worker(mode: str, path: str):
+    from services.loaders.excel_loader import ExcelLoader
+
+    loader = ExcelLoader()
+    load = loader._load_pandas if mode == "pandas" else loader._load_streaming
+
+    base_rss = _peak_rss_mb()
+    started = time.perf_counter()
+    rows = sum(1 for _ in load(path))
+    elapsed = time.perf_counter() - started
+
+    print(json.dumps({
+        "mode": mode,
+        "rows": rows,
+        "elapsed": elapsed,
+        "peak_rss_mb": _peak_rss_mb(),
+        "base_rss_mb": base_rss,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ExcelLoader peak RSS / rows/s 비교")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--cols", type=int, default=6)
+    parser.add_argument("--file", type=str, help="기존 .xlsx 사용 (미지정 시 합성 파일 생성)")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        _worker(args.mode, args.file)
+        return
+
+    path = args.file
+    tmpdir = None
+    if not path:
+        tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(tmpdir.name, "bench.xlsx")
+        started = time.perf_counter()
+        _make_workbook(path, args.rows, args.cols)
+        print(
+            f"generated {args.rows:,} rows x {args.cols} cols "
+            f"({os.path.getsize(path) / 1024 / 1024:.1f} MB) "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+
+    try:
+        for mode in MODES:
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--mode", mode, "--file", path],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            r = json.loads(out.strip().splitlines()[-1])
+            print(
+                f"{r['mode']:<10} rows={r['rows']:<9,} elapsed={r['elapsed']:.1f}s "
+                f"rows/s={r['rows'] / r['elapsed']:,.0f} "
+                f"peak_rss={r['peak_rss_mb']:.0f}MB (+{r['peak_rss_mb'] - r['base_rss_mb']:.0f}MB)"
+            )
+    finally:
+        if tmpdir:
+            tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""
+Ollama 임베딩 keep-alive 연결 풀 효과 확인 스크립트
+
+요청마다 HTTPConnection 을 새로 여는 방식(before)과
+OllamaConnectionPool 재사용(after)의 처리량(chunks/s)을 비교한다.
+
+사용법:
+    # 로컬 stand-in 서버 (/api/embed, /api/embeddings 흉내, 연결 수립 지연 포함)
+    python scripts/bench_ollama_pool.py --requests 400 --threads 4 --connect-delay 0.005
+
+    # 실행 중인 Ollama 대상
+    python scripts/bench_ollama_pool.py --host localhost --port 11434 --model nomic-embed-text
+"""
+
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+import json
+import time
+import socket
+import argparse
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from vector.ollama_pool import OllamaConnectionPool
+
+
+# =================================================
+# stand-in server
+# =================================================
+def _start_stub_server(dim: int, connect_delay: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"   # keep-alive
+
+        def setup(self):
+            # TCP handshake / TLS / proxy 등 연결 수립 비용 흉내
+            time.sleep(connect_delay)
+            super().setup()
+            # Ollama(Go net/http) 와 동일하게 TCP_NODELAY
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            req = json.loads(self.rfile.read(length))
+
+            if self.path == "/api/embed":
+                texts = req["input"] if isinstance(req["input"], list) else [req["input"]]
+                body = {"embeddings": [[0.1] * dim for _ in texts]}
+            else:
+                body = {"embedding": [0.1] * dim}
+
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# =================================================
+# clients
+# =================================================
+def _post_new_connection(host: str, port: int, path: str, payload: dict) -> dict:
+    """기존 방식: 요청마다 연결 생성/종료"""
+    conn = http.client.HTTPConnection(host, port, timeout=120)
+    try:
+        conn.request("POST", path, json.dumps(payload), {"Content-Type": "application/json"})
+        res = conn.getresponse()
+        data = res.read().decode("utf-8")
+        if res.status != 200:
+            raise RuntimeError(f"Ollama error {res.status}: {data}")
+        return json.loads(data)
+    finally:
+        conn.close()
+
+
+def _run(label: str, post, args) -> None:
+    batch = max(1, args.batch)
+    calls = (args.requests + batch - 1) // batch
+    texts = [f"benchmark chunk {i}" for i in range(batch)]
+
+    def one(_):
+        if batch == 1:
+            post("/api/embeddings", {"model": args.model, "prompt": texts[0]})
+        else:
+            post("/api/embed", {"model": args.model, "input": texts})
+
+    one(0)   # warmup
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as ex:
+        list(ex.map(one, range(calls)))
+    elapsed = time.perf_counter() - started
+
+    chunks = calls * batch
+    print(
+        f"{label:<8} calls={calls:<5} chunks={chunks:<6} "
+        f"elapsed={elapsed:.3f}s chunks/s={chunks / elapsed:,.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ollama keep-alive 연결 풀 처리량 비교")
+    parser.add_argument("--requests", type=int, default=400, help="임베딩할 chunk 수")
+    parser.add_argument("--batch", type=int, default=1, help="요청당 chunk 수 (1 = /api/embeddings)")
+    parser.add_argument("--threads", type=int, default=4, help="동시 요청 스레드 수")
+    parser.add_argument("--model", type=str, default="nomic-embed-text")
+    parser.add_argument("--host", type=str, help="Ollama host (미지정 시 로컬 stand-in 서버)")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--dim", type=int, default=768, help="(stand-in) 벡터 차원")
+    parser.add_argument("--connect-delay", type=float, default=0.005, help="(stand-in) 연결 수립 지연(초)")
+    args = parser.parse_args()
+
+    server = None
+    if args.host:
+        host, port = args.host, args.port
+    else:
+        server = _start_stub_server(args.dim, args.connect_delay)
+        host, port = server.server_address
+
+    pool = OllamaConnectionPool(host, port, size=args.threads)
+
+    try:
+        _run("before", lambda p, b: _post_new_connection(host, port, p, b), args)
+        _run("after", pool.post_json, args)
+        print(f"pool: {pool.stats()}")
+    finally:
+        pool.close()
+        if server:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
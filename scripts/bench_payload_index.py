@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+"""
+Qdrant payload index 유무에 따른 필터 검색 지연 비교
+
+임시 컬렉션에 N 개 point (payload 구조는 _build_payload 와 동일) 를 넣고
+1) index 없이 2) ensure_payload_indexes() 후 같은 필터 검색을 반복해 p50/p95 비교
+
+사용법:
+    # 실행 중인 Qdrant 대상 (QDRANT_HOST / QDRANT_PORT 또는 --host/--port)
+    python scripts/bench_payload_index.py --points 1000000 --dim 128
+
+    # 스크립트 동작 확인용 (로컬 모드는 payload index 를 지원하지 않음 → 차이 없음)
+    python scripts/bench_payload_index.py --memory --points 20000
+"""
+
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+import time
+import argparse
+import statistics
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchValue,
+    PointStruct,
+    VectorParams,
+)
+
+from vector.collection_manager import ensure_payload_indexes
+
+COLLECTION = "bench_payload_index"
+FILE_TYPES = ["pdf", "docx", "xlsx", "csv", "txt", "png"]
+SOURCES = ["watcher", "upload", "api"]
+
+
+def _payload(i: int, folders: int, chunks_per_doc: int) -> dict:
+    doc_id = i // chunks_per_doc + 1
+    return {
+        "content": f"chunk {i}",
+        "metadata": {
+            "content_id": i + 1,
+            "doc_id": doc_id,
+            "page_no": 1,
+            "chunk_no": i % chunks_per_doc + 1,
+            "folder_name": f"folder_{doc_id % folders}",
+            "file_type": FILE_TYPES[doc_id % len(FILE_TYPES)],
+            "source": SOURCES[doc_id % len(SOURCES)],
+        },
+    }
+
+
+def _load(client: QdrantClient, args):
+    if client.collection_exists(COLLECTION):
+        client.delete_collection(COLLECTION)
+    client.create_collection(
+        COLLECTION,
+        vectors_config=VectorParams(size=args.dim, distance=Distance.COSINE),
+    )
+
+    rng = np.random.default_rng(0)
+    started = time.perf_counter()
+    for start in range(0, args.points, args.batch):
+        end = min(start + args.batch, args.points)
+        vectors = rng.random((end - start, args.dim), dtype=np.float32)
+        client.upsert(
+            COLLECTION,
+            points=[
+                PointStruct(id=i + 1, vector=vectors[i - start].tolist(),
+                            payload=_payload(i, args.folders, args.chunks_per_doc))
+                for i in range(start, end)
+            ],
+            wait=end == args.points,
+        )
+        print(f"\rloaded {end:,}/{args.points:,}", end="", flush=True)
+    print(f"  ({time.perf_counter() - started:.1f}s)")
+
+
+def _wait_green(client: QdrantClient, timeout: float = 1800):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = getattr(client.get_collection(COLLECTION).status, "value", "green")
+        if status == "green":
+            return
+        time.sleep(1)
+
+
+def _filters(args) -> dict[str, Filter]:
+    def match(key, value):
+        return FieldCondition(key=key, match=MatchValue(value=value))
+
+    doc_count = max(1, args.points // args.chunks_per_doc)
+    return {
+        "folder_name": Filter(must=[match("metadata.folder_name", "folder_7")]),
+        "file_type": Filter(must=[match("metadata.file_type", "xlsx")]),
+        "doc_id": Filter(must=[match("metadata.doc_id", doc_count // 2)]),
+        "folder+type": Filter(must=[
+            match("metadata.folder_name", "folder_7"),
+            match("metadata.file_type", FILE_TYPES[7 % len(FILE_TYPES)]),
+        ]),
+    }
+
+
+def _measure(client: QdrantClient, args) -> dict[str, tuple[float, float]]:
+    rng = np.random.default_rng(1)
+    queries = rng.random((args.queries, args.dim), dtype=np.float32)
+
+    results = {}
+    for name, flt in _filters(args).items():
+        latencies = []
+        for q in queries:
+            started = time.perf_counter()
+            client.query_points(COLLECTION, query=q.tolist(), query_filter=flt, limit=10)
+            latencies.append((time.perf_counter() - started) * 1000)
+        latencies.sort()
+        results[name] = (
+            statistics.median(latencies),
+            latencies[int(len(latencies) * 0.95) - 1],
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default=os.getenv("QDRANT_HOST", "localhost"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("QDRANT_PORT", "6333")))
+    parser.add_argument("--memory", action="store_true", help="로컬 in-memory 모드")
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--folders", type=int, default=1000)
+    parser.add_argument("--chunks-per-doc", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=2000)
+    parser.add_argument("--keep", action="store_true", help="종료 후 컬렉션 유지")
+    args = parser.parse_args()
+
+    client = (
+        QdrantClient(":memory:") if args.memory
+        else QdrantClient(host=args.host, port=args.port, timeout=300)
+    )
+
+    _load(client, args)
+    _wait_green(client)
+    before = _measure(client, args)
+
+    started = time.perf_counter()
+    ensure_payload_indexes(client, COLLECTION, {})
+    _wait_green(client)
+    print(f"payload index build: {time.perf_counter() - started:.1f}s")
+    after = _measure(client, args)
+
+    print(f"\npoints={args.points:,} dim={args.dim} queries={args.queries} (ms)")
+    print(f"{'filter':<12} {'p50 before':>11} {'p95 before':>11} {'p50 after':>10} {'p95 after':>10} {'speedup':>8}")
+    for name in before:
+        (p50_b, p95_b), (p50_a, p95_a) = before[name], after[name]
+        print(
+            f"{name:<12} {p50_b:>11.2f} {p95_b:>11.2f} {p50_a:>10.2f} {p95_a:>10.2f} "
+            f"{p50_b / p50_a:>7.1f}x"
+        )
+
+    if not args.keep:
+        client.delete_collection(COLLECTION)
+
+
+if __name__ == "__main__":
+    main()
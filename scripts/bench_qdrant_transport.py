@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+Qdrant REST(HTTP) vs gRPC 처리량 비교
+
+transport 별로 임시 컬렉션을 만들어
+- batch upsert (VectorWriter 와 같은 batch 크기, payload 구조는 _build_payload 와 동일)
+- 단건 query_points (검색 / RAG 와 같은 호출)
+의 처리량을 측정한다.
+
+사용법:
+    # 로컬 Qdrant (예: docker run -p 6333:6333 -p 6334:6334 qdrant/qdrant)
+    python scripts/bench_qdrant_transport.py --points 20000 --dim 3072
+
+    python scripts/bench_qdrant_transport.py --host 192.168.50.32 --batch 256 --queries 500
+"""
+
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+import time
+import argparse
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from vector.realtime_vector import VECTOR_WRITE_BATCH
+
+COLLECTION = "bench_qdrant_transport"
+
+
+def _payload(i: int) -> dict:
+    return {
+        "content": "벤치마크 chunk 본문 " * 40,
+        "metadata": {
+            "content_id": i,
+            "doc_id": i // 20 + 1,
+            "page_no": 1,
+            "chunk_no": i % 20 + 1,
+            "model_key": "bench",
+            "folder_name": f"folder_{i % 100}",
+            "title": f"doc_{i // 20}.pdf",
+            "file_type": "pdf",
+            "source": "bench",
+        },
+    }
+
+
+def _run(label: str, client: QdrantClient, args, vectors: np.ndarray, queries: np.ndarray):
+    if client.collection_exists(COLLECTION):
+        client.delete_collection(COLLECTION)
+    client.create_collection(
+        COLLECTION,
+        vectors_config=VectorParams(size=args.dim, distance=Distance.COSINE),
+    )
+
+    try:
+        # 벡터는 list 로 미리 변환 (변환 비용은 transport 와 무관)
+        batches = []
+        for start in range(0, args.points, args.batch):
+            end = min(start + args.batch, args.points)
+            batches.append([
+                PointStruct(id=i + 1, vector=vectors[i].tolist(), payload=_payload(i + 1))
+                for i in range(start, end)
+            ])
+
+        started = time.perf_counter()
+        for points in batches:
+            client.upsert(COLLECTION, points=points, wait=True)
+        upsert_sec = time.perf_counter() - started
+
+        query_lists = [q.tolist() for q in queries]
+        started = time.perf_counter()
+        for q in query_lists:
+            client.query_points(COLLECTION, query=q, limit=args.top_k, with_payload=True)
+        query_sec = time.perf_counter() - started
+    finally:
+        client.delete_collection(COLLECTION)
+
+    print(
+        f"{label:<6} upsert {args.points / upsert_sec:>9.0f} points/s ({upsert_sec:.2f}s) | "
+        f"query {len(queries) / query_sec:>7.1f} qps "
+        f"({query_sec / len(queries) * 1000:.2f} ms avg)"
+    )
+    return args.points / upsert_sec, len(queries) / query_sec
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default=os.getenv("QDRANT_HOST") or "localhost")
+    parser.add_argument("--port", type=int, default=int(os.getenv("QDRANT_PORT", "6333")))
+    parser.add_argument("--grpc-port", type=int, default=int(os.getenv("QDRANT_GRPC_PORT", "6334")))
+    parser.add_argument("--points", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=3072)
+    parser.add_argument("--batch", type=int, default=VECTOR_WRITE_BATCH)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = rng.random((args.points, args.dim), dtype=np.float32)
+    queries = rng.random((args.queries, args.dim), dtype=np.float32)
+
+    print(f"points={args.points:,} dim={args.dim} batch={args.batch} queries={args.queries}")
+
+    results = {}
+    for label, prefer_grpc in (("rest", False), ("grpc", True)):
+        client = QdrantClient(
+            host=args.host,
+            port=args.port,
+            grpc_port=args.grpc_port,
+            prefer_grpc=prefer_grpc,
+            timeout=300,
+        )
+        results[label] = _run(label, client, args, vectors, queries)
+        client.close()
+
+    (rest_up, rest_q), (grpc_up, grpc_q) = results["rest"], results["grpc"]
+    print(f"grpc/rest  upsert {grpc_up / rest_up:.2f}x | query {grpc_q / rest_q:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+"""
+/search 동시성 확인 스크립트
+
+N 개의 /search 요청을 동시에 보내 전체 소요 시간(wall)과
+요청별 지연의 합(serial)을 비교한다. overlap = serial / wall
+(1 에 가까우면 직렬 처리, N 에 가까우면 완전히 겹쳐 실행)
+
+사용법:
+    # in-process: 임베딩 지연을 흉내내고, 기존 방식(이벤트 루프에서 blocking 호출)과 비교
+    python scripts/bench_search_concurrency.py --requests 16 --latency 0.2
+
+    # 실행 중인 서버 대상
+    python scripts/bench_search_concurrency.py --url http://localhost:8000 --requests 16
+"""
+
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+import time
+import asyncio
+import argparse
+
+import httpx
+
+
+async def _fire(client: httpx.AsyncClient, n: int, query: str) -> tuple[float, float]:
+    async def one(i: int) -> float:
+        started = time.perf_counter()
+        res = await client.post("/search", json={"query": f"{query} {i}", "top_k": 3})
+        res.raise_for_status()
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(one(i) for i in range(n)))
+    return time.perf_counter() - started, sum(latencies)
+
+
+def _report(label: str, n: int, wall: float, serial: float):
+    print(
+        f"{label:<10} requests={n:<4} wall={wall:.3f}s "
+        f"sum_latency={serial:.3f}s overlap={serial / wall:.1f}x"
+    )
+
+
+# =================================================
+# in-process (simulated latency)
+# =================================================
+def _build_apps(latency: float, model_key: str):
+    from fastapi import FastAPI
+    from qdrant_client import QdrantClient
+    from qdrant_client.models import PointStruct, VectorParams
+
+    import app.api.search as search_api
+    import vector.realtime_vector as realtime_vector
+    from vector.collection_manager import resolve_collection_name
+    from vector.embedding_models import get_embedding_config
+
+    os.environ["MODEL_KEY"] = model_key
+    cfg = get_embedding_config(model_key)
+
+    # 로컬(in-memory) Qdrant + 샘플 point
+    client = QdrantClient(":memory:")
+    collection = resolve_collection_name(
+        os.getenv("BASE_COLLECTION", "documents"), model_key
+    )
+    client.create_collection(
+        collection,
+        vectors_config=VectorParams(size=cfg.vector_size, distance=cfg.distance),
+    )
+    client.upsert(
+        collection,
+        points=[
+            PointStruct(
+                id=i,
+                vector=[((i * 31 + j) % 97) / 97 for j in range(cfg.vector_size)],
+                payload={"content": f"doc {i}", "metadata": {"content_id": i}},
+            )
+            for i in range(1, 101)
+        ],
+    )
+    realtime_vector._qdrant_client = client
+
+    def slow_embed(text: str, key: str) -> list[float]:
+        time.sleep(latency)   # 원격 임베딩 API 지연 흉내 (blocking)
+        return [0.5] * cfg.vector_size
+
+    search_api.embed_text = slow_embed
+
+    current = FastAPI()
+    current.include_router(search_api.router)
+
+    # 기존 방식: async 핸들러에서 blocking 호출 직접 실행
+    legacy = FastAPI()
+
+    @legacy.post("/search")
+    async def legacy_search(req: search_api.SearchRequest):
+        vector = slow_embed(req.query, model_key)
+        res = client.query_points(collection, query=vector, limit=req.top_k)
+        return {"total": len(res.points)}
+
+    return current, legacy
+
+
+async def _run_in_process(n: int, latency: float, model_key: str):
+    current, legacy = _build_apps(latency, model_key)
+
+    for label, app in (("blocking", legacy), ("executor", current)):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await _fire(client, 1, "warmup")
+            wall, serial = await _fire(client, n, "concurrency")
+        _report(label, n, wall, serial)
+
+
+async def _run_remote(url: str, n: int):
+    async with httpx.AsyncClient(base_url=url, timeout=120) as client:
+        wall, serial = await _fire(client, n, "concurrency")
+    _report("server", n, wall, serial)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/search 동시 요청 겹침 확인")
+    parser.add_argument("--requests", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--latency", type=float, default=0.2, help="(in-process) 임베딩 지연(초)")
+    parser.add_argument("--model-key", type=str, default="nomic")
+    parser.add_argument("--url", type=str, help="실행 중인 서버 주소 (지정 시 실서버 대상)")
+    args = parser.parse_args()
+
+    if args.url:
+        asyncio.run(_run_remote(args.url, args.requests))
+    else:
+        asyncio.run(_run_in_process(args.requests, args.latency, args.model_key))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+normalize_for_embedding 성능 비교 스크립트
+
+기존 구현(NFKC + re.sub 5회)과 현재 구현(비 ASCII 만 NFKC + zero-width str.replace
++ regex 1회 + split/join 공백 압축)의 출력 동일성을 확인하고 처리 시간을 비교한다. (한/영 혼합 합성 corpus)
+
+사용법:
+    python scripts/bench_text_normalizer.py --texts 20000 --repeat 3
+"""
+
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+import re
+import time
+import random
+import argparse
+import unicodedata
+
+from services.text_normalizer import normalize_for_embedding, normalize_many
+
+
+def legacy_normalize(text: str) -> str:
+    """기존 구현 (비교 기준)"""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text)
+    text = text.replace("\r", " ").replace("\n", " ").replace("\t", " ")
+    text = re.sub(r"[\x00-\x1f\x7f]", " ", text)
+    text = re.sub(r"[\u200b\u200c\u200d\uFEFF]", "", text)
+    text = re.sub(r"[-_=]{3,}", " ", text)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+
+_WORDS = [
+    "계약서", "제1조(목적)", "본 계약은", "갑과 을", "의 권리와 의무를", "정한다.",
+    "Section", "Purpose", "the Parties", "agree", "as follows:", "Invoice No.",
+    "ＡＢＣ", "１２３", "㈜한국", "㎏", "ﬁle", "①", "Ⅱ", "a-b", "x_y", "--",
+]
+# 구분선 / 제어문자 / zero-width (실제 문서처럼 드물게 등장)
+_NOISE = [
+    "----", "====", "___", "-=_",
+    "\n", "\r\n", "\t", "  ", "　", "\x0b", "\x7f",
+    "\u200b", "\ufeff", "\u200d",
+]
+
+
+def _make_corpus(n: int, seed: int = 42, noise: float = 0.05) -> list[str]:
+    rnd = random.Random(seed)
+    corpus = []
+    for _ in range(n):
+        words = [
+            rnd.choice(_NOISE) if rnd.random() < noise else rnd.choice(_WORDS)
+            for _ in range(rnd.randint(60, 250))
+        ]
+        corpus.append("".join(w if rnd.random() < 0.3 else w + " " for w in words))
+    return corpus
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="text normalizer 출력 동일성 + 속도 비교")
+    parser.add_argument("--texts", type=int, default=20000, help="corpus 텍스트 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--noise", type=float, default=0.05, help="구분선/제어문자 토큰 비율")
+    args = parser.parse_args()
+
+    corpus = _make_corpus(args.texts, noise=args.noise)
+    chars = sum(len(t) for t in corpus)
+
+    expected = [legacy_normalize(t) for t in corpus]
+    fused = [normalize_for_embedding(t) for t in corpus]
+    batch = normalize_many(corpus)
+
+    mismatch = sum(1 for a, b in zip(expected, fused) if a != b)
+    mismatch += sum(1 for a, b in zip(expected, batch) if a != b)
+    print(f"corpus: texts={len(corpus):,} chars={chars:,} mismatches={mismatch}")
+    if mismatch:
+        sys.exit(1)
+
+    legacy_sec = _time(lambda: [legacy_normalize(t) for t in corpus], args.repeat)
+    fused_sec = _time(lambda: [normalize_for_embedding(t) for t in corpus], args.repeat)
+    batch_sec = _time(lambda: normalize_many(corpus), args.repeat)
+
+    for label, sec in (("legacy", legacy_sec), ("fused", fused_sec), ("batch", batch_sec)):
+        print(
+            f"{label:<8} {sec:.3f}s  {chars / sec / 1e6:6.1f} Mchar/s  "
+            f"speedup={legacy_sec / sec:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -35,7 +35,8 @@ from models.meta import MetaTable
 from models.content import ContentTable
 
 from vector.collection_manager import ensure_collection
-from vector.realtime_vector import insert_vector, get_qdrant_client
+from vector.embedding_models import get_embedding_config
+from vector.realtime_vector import VectorRecord, insert_vectors, get_qdrant_client
 from services.text_normalizer import normalize_for_embedding
 
 
@@ -129,10 +130,12 @@ def rebuild_vectors(
         
         logger.info(f"[REBUILD] Processing {len(metas)} documents, {total_chunks} chunks")
         
-        # 4. 재적재 실행
+        # 4. 재적재 실행 (모델별 max_batch_size 단위 batch 임베딩)
         success_count = 0
         failed_count = 0
         current_chunk = 0
+        embed_cfg = get_embedding_config(model_key)
+        batch_size = embed_cfg.max_batch_size
         
         for meta in metas:
             logger.info(f"[REBUILD] Document: doc_id={meta.seq_id}, title={meta.title}")
@@ -144,40 +147,52 @@ def rebuild_vectors(
                 .all()
             )
             
-            for content in contents:
+            pending: list[VectorRecord] = []
+            
+            for i, content in enumerate(contents, start=1):
                 current_chunk += 1
                 
-                try:
-                    text = normalize_for_embedding(content.content)
-                    
-                    if not text.strip():
-                        continue
-                    
-                    insert_vector(
-                        collection_name=collection_name,
-                        model_key=model_key,
-                        content_id=content.content_id,
-                        doc_id=meta.seq_id,
-                        page_no=content.page_no,
-                        chunk_no=content.chunk_no,
-                        text=text[:1500],
-                        folder_name=meta.folder_name,
-                        title=meta.title,
-                        file_type=meta.file_type,
-                        source=meta.source
+                text = normalize_for_embedding(content.content)
+                
+                if text.strip():
+                    pending.append(
+                        VectorRecord(
+                            content_id=content.content_id,
+                            doc_id=meta.seq_id,
+                            page_no=content.page_no,
+                            chunk_no=content.chunk_no,
+                            text=text[:embed_cfg.max_input_chars],
+                            folder_name=meta.folder_name,
+                            title=meta.title,
+                            file_type=meta.file_type,
+                            source=meta.source
+                        )
                     )
+                
+                if len(pending) < batch_size and i < len(contents):
+                    continue
+                
+                if pending:
+                    try:
+                        failures = insert_vectors(
+                            collection_name=collection_name,
+                            model_key=model_key,
+                            records=pending,
+                        )
+                        success_count += len(pending) - len(failures)
+                        failed_count += len(failures)
+                        
+                    except Exception as e:
+                        failed_count += len(pending)
+                        logger.error(
+                            f"[REBUILD FAIL] doc_id={meta.seq_id}, "
+                            f"content_ids={pending[0].content_id}..{pending[-1].content_id}: {e}"
+                        )
                     
-                    success_count += 1
-                    
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(
-                        f"[REBUILD FAIL] doc_id={meta.seq_id}, "
-                        f"content_id={content.content_id}: {e}"
-                    )
+                    pending = []
                 
-                # 진행상황 콜백
-                if progress_callback and current_chunk % 10 == 0:
+                # 진행상황 콜백 (batch 단위)
+                if progress_callback:
                     progress_callback(
                         current_chunk, 
                         total_chunks,
@@ -0,0 +1,103 @@
+# services/bulk_insert.py
+"""
+content_table / images bulk INSERT (ORM 미사용, SQLAlchemy Core)
+
+- chunk 마다 db.add() + db.flush() 로 content_id 를 받던 방식 대신
+  batch 단위 executemany (pymysql → multi-row INSERT) 1회
+- 생성된 content_id 는 문서 단위로 1회 SELECT 하여 일괄 확보
+  (content_id 는 Qdrant point id 로 그대로 사용)
+"""
+
+from typing import Any, Dict, List
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from models.content import ContentTable
+from models.ImageTable import ImageTable
+
+
+_content_table = ContentTable.__table__
+_image_table = ImageTable.__table__
+
+
+class ContentBulkInserter:
+    """
+    한 문서(doc_id)의 chunk 를 batch 로 INSERT 하고 content_id 를 돌려준다.
+
+    - 같은 doc_id 의 row 는 이 인스턴스(=하나의 ingest job)만 INSERT 한다는 전제
+    - AUTO_INCREMENT 는 같은 세션의 연속 INSERT 에서 단조 증가하므로
+      "content_id > 직전 batch 마지막 id" 를 id 순으로 읽으면 입력 순서와 일치
+      (innodb_autoinc_lock_mode 와 무관하게 안전, 연속 구간일 필요 없음)
+    - 이미 row 가 있는 문서에 추가하는 경우(예: 이미지 OCR chunk)를 위해
+      시작 기준 id 는 첫 insert 때 해당 문서의 MAX(content_id) 로 잡음
+
+    사용법:
+        inserter = ContentBulkInserter(db, doc_id)
+        ids = inserter.insert([
+            {"page_no": 1, "chunk_no": 1, "content": "..."},
+            ...
+        ])
+    """
+
+    def __init__(self, db: Session, doc_id: int):
+        self.db = db
+        self.doc_id = doc_id
+        self.inserted = 0
+        self._last_id: int | None = None
+
+    def insert(self, rows: List[Dict[str, Any]]) -> List[int]:
+        if not rows:
+            return []
+
+        if self._last_id is None:
+            self._last_id = self.db.execute(
+                select(func.coalesce(func.max(_content_table.c.content_id), 0))
+                .where(_content_table.c.doc_id == self.doc_id)
+            ).scalar_one()
+
+        self.db.execute(
+            insert(_content_table),
+            [
+                {
+                    "doc_id": self.doc_id,
+                    "page_no": r["page_no"],
+                    "chunk_no": r["chunk_no"],
+                    "content": r["content"],
+                }
+                for r in rows
+            ],
+        )
+
+        ids = list(
+            self.db.execute(
+                select(_content_table.c.content_id)
+                .where(_content_table.c.doc_id == self.doc_id)
+                .where(_content_table.c.content_id > self._last_id)
+                .order_by(_content_table.c.content_id)
+                .limit(len(rows))
+            ).scalars()
+        )
+
+        if len(ids) != len(rows):
+            raise RuntimeError(
+                f"[BULK INSERT] content_id mismatch | doc_id={self.doc_id} "
+                f"expected={len(rows)} got={len(ids)}"
+            )
+
+        self._last_id = ids[-1]
+        self.inserted += len(ids)
+        return ids
+
+
+def bulk_insert_images(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    images 테이블 executemany INSERT
+
+    rows: doc_id, page_no, image_no, image_path, image_name, image_ext, ocr_text
+    """
+    if not rows:
+        return 0
+
+    db.execute(insert(_image_table), rows)
+    return len(rows)
@@ -1,42 +1,182 @@
-def chunk_text(
-    text: str,
-    size: int = 500,
-    overlap: int = 100,
-    max_chunks: int = 200
-):
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from services.loaders.row_packer import ROW_LINE
+
+CHUNK_SIZE = 500
+CHUNK_OVERLAP = 100
+
+
+@dataclass
+class Chunk:
+    page_no: int              # chunk 시작 unit
+    page_end: int             # chunk 끝 unit (unit 경계를 넘으면 page_no 보다 큼)
+    chunk_no: int             # page_no 내 순번
+    text: str
+    meta: Optional[dict] = None   # meta 가 있는 unit 의 meta (예: 실제 포함 행 row_start ~ row_end)
+
+
+def _split_lines(text: str, size: int) -> Iterator[str]:
     """
-    안전한 청크 분할
-    - 무한 루프 방지
-    - 대용량 텍스트 보호
+    size 를 넘는 unit → 줄 경계에서 size 이하 조각
+    (한 줄이 size 보다 길면 그 줄만 size 단위로 절단)
     """
-    if not text:
-        return []
+    piece: list[str] = []
+    length = 0
 
-    n = len(text)
+    for line in text.split("\n"):
+        while len(line) > size:
+            if piece:
+                yield "\n".join(piece)
+                piece, length = [], 0
+            yield line[:size]
+            line = line[size:]
 
-    # 짧은 텍스트는 그대로 하나로
-    if n <= size:
-        return [text.strip()]
+        if piece and length + 1 + len(line) > size:
+            yield "\n".join(piece)
+            piece, length = [], 0
 
-    # 방어 로직
-    overlap = min(overlap, size // 2)
+        length += len(line) + (1 if piece else 0)
+        piece.append(line)
 
-    chunks = []
-    start = 0
+    if piece:
+        yield "\n".join(piece)
+
+
+def _split_packed(text: str, size: int) -> Iterator[str]:
+    """
+    size 를 넘는 meta unit → 줄 경계 조각, row_packer 헤더(첫 줄)는 조각마다 반복
+    (헤더가 size 절반 이상이면 반복 없이 분할)
+    """
+    header, _, body = text.partition("\n")
+    if not body or ROW_LINE.match(header) or len(header) + 1 > size // 2:
+        yield from _split_lines(text, size)
+        return
+
+    for piece in _split_lines(body, size - len(header) - 1):
+        yield f"{header}\n{piece}"
+
+
+def _piece_meta(piece: str, meta: dict) -> dict:
+    """
+    조각에 실제로 포함된 행 기준 row_start / row_end (행 줄이 없으면 unit meta 그대로)
+    """
+    rows = [int(n) for n in ROW_LINE.findall(piece)]
+    if not rows or "row_start" not in meta:
+        return dict(meta)
+    return {**meta, "row_start": rows[0], "row_end": rows[-1]}
+
+
+def iter_chunks(
+    units: Iterable[tuple],
+    size: int = CHUNK_SIZE,
+    overlap: int = CHUNK_OVERLAP,
+) -> Iterator[Chunk]:
+    """
+    loader 출력 (unit_no, text[, meta]) 스트림 → Chunk 스트림
+
+    - meta 없는 unit: 다음 unit 과 이어 붙여 size 까지 채움 (unit 경계 = 줄바꿈, overlap 적용)
+    - meta 있는 unit (row_packer 묶음 등): 이어 붙이지 않고 단독 chunk
+      (size 초과 시 줄 경계에서 나누고 헤더 줄 반복, row_start / row_end 는 조각 내 행 기준)
+    - 긴 unit 은 size 단위로 나눠 버퍼에 넣음 → 메모리는 O(size)
+    - 개수 제한/절단 없음 (마지막 잔여분까지 모두 yield)
+    """
+    overlap = min(overlap, size // 2)
     step = size - overlap
-    count = 0
 
-    while start < n:
-        end = min(start + size, n)
-        chunk = text[start:end].strip()
+    buf = ""
+    spans: list[list] = []   # [buf 내 시작 offset, unit_no]
+    carried = 0              # buf 앞부분 중 이미 이전 chunk 에 포함된 글자 수
+    last_page = None
+    chunk_no = 0
+
+    def new_chunk(page_no: int, page_end: int, text: str, meta: Optional[dict] = None) -> Chunk:
+        nonlocal last_page, chunk_no
+
+        if page_no != last_page:
+            last_page, chunk_no = page_no, 0
+        chunk_no += 1
+
+        return Chunk(page_no=page_no, page_end=page_end, chunk_no=chunk_no, text=text, meta=meta)
+
+    def make_chunk(end: int) -> Optional[Chunk]:
+        text = buf[:end].strip()
+        if not text:
+            return None
+
+        covered = [s for s in spans if s[0] < end] or spans[:1]
+        return new_chunk(covered[0][1], covered[-1][1], text)
+
+    def slide():
+        nonlocal buf, spans, carried
+        buf = buf[step:]
+        carried = overlap
+
+        for s in spans:
+            s[0] -= step
+        # offset 0 이전에서 시작한 span 은 마지막 1개만 유지 (buf 시작 위치 unit)
+        while len(spans) > 1 and spans[1][0] <= 0:
+            spans.pop(0)
+        spans[0][0] = max(spans[0][0], 0)
+
+    def flush() -> Optional[Chunk]:
+        # 이전 chunk 의 overlap 외 새 글자가 있을 때만
+        nonlocal buf, spans, carried
+        chunk = make_chunk(len(buf)) if len(buf) > carried else None
+        buf, spans, carried = "", [], 0
+        return chunk
+
+    for unit_no, text, *rest in units:
+        if not text:
+            continue
+
+        meta = rest[0] if rest else None
+        if meta:
+            chunk = flush()
+            if chunk:
+                yield chunk
+
+            pieces = [text] if len(text) <= size else _split_packed(text, size)
+            for piece in pieces:
+                if piece.strip():
+                    yield new_chunk(unit_no, unit_no, piece.strip(), _piece_meta(piece, meta))
+            continue
 
-        if chunk:
-            chunks.append(chunk)
-            count += 1
+        if buf:
+            buf += "\n"
+        spans.append([len(buf), unit_no])
 
-        if count >= max_chunks:
-            break  # 🔥 무한 방지
+        for start in range(0, len(text), size):
+            buf += text[start:start + size]
 
-        start += step  # ✅ 반드시 증가
+            while len(buf) >= size:
+                chunk = make_chunk(size)
+                if chunk:
+                    yield chunk
+                slide()
+
+    chunk = flush()
+    if chunk:
+        yield chunk
+
+
+def chunk_text(
+    text: str,
+    size: int = CHUNK_SIZE,
+    overlap: int = CHUNK_OVERLAP,
+    max_chunks: int | None = None,
+):
+    """
+    단일 텍스트 청크 분할 (iter_chunks wrapper)
+    - max_chunks 는 명시한 경우에만 적용 (기본 제한 없음)
+    """
+    if not text:
+        return []
+
+    chunks = []
+    for chunk in iter_chunks([(1, text)], size=size, overlap=overlap):
+        chunks.append(chunk.text)
+        if max_chunks is not None and len(chunks) >= max_chunks:
+            break
 
     return chunks
@@ -0,0 +1,374 @@
+# services/dedup.py
+"""
+근접 중복 chunk 억제 (SimHash)
+
+면책 조항 / 표지 / 템플릿 문단처럼 수많은 문서에 반복되는 chunk 를
+임베딩 전에 찾아내어
+
+- reuse : 이미 임베딩된 chunk 의 벡터를 Qdrant 에서 가져와 재사용 (임베딩 비용 절감)
+- skip  : 해당 chunk 는 Qdrant point 를 만들지 않음 (임베딩 + point 수 절감)
+
+content_table 에는 두 경우 모두 원문 그대로 저장됨 (DB 가 원본)
+
+판별:
+- 지문 = 문자 5-gram shingle 의 64bit SimHash
+- 해밍 거리 DEDUP_MAX_DISTANCE(≤3) 이하면 근접 중복
+- 같은 ingest 안의 중복은 메모리(최근 DEDUP_LOCAL_MAX 개)에서,
+  다른 문서와의 중복은 chunk_fingerprint 테이블(band 인덱스)에서 조회
+- 인덱스 조회/등록은 별도 세션, 실패해도 ingest 는 그대로 진행 (중복 억제만 생략)
+"""
+
+import os
+import time
+import hashlib
+import logging
+import threading
+from array import array
+from collections import Counter, OrderedDict
+from dataclasses import asdict, dataclass
+from typing import List, Sequence
+
+import numpy as np
+from sqlalchemy import insert, select
+
+from config.db import SessionLocal
+from models.chunk_fingerprint import ChunkFingerprint
+from vector.realtime_vector import get_qdrant_client
+
+logger = logging.getLogger("ingest")
+
+# off | reuse | skip
+DEDUP_MODE = os.getenv("DEDUP_MODE", "reuse").lower()
+# 4 band (16bit) → 거리 3 까지만 band 조회로 누락 없이 찾을 수 있음
+DEDUP_MAX_DISTANCE = min(3, int(os.getenv("DEDUP_MAX_DISTANCE", "3")))
+# 이보다 짧은 chunk 는 지문을 만들지 않음 (짧은 텍스트의 SimHash 는 오탐이 많음)
+DEDUP_MIN_CHARS = int(os.getenv("DEDUP_MIN_CHARS", "200"))
+# 같은 ingest 안에서 기억하는 최근 임베딩 chunk 수
+DEDUP_LOCAL_MAX = int(os.getenv("DEDUP_LOCAL_MAX", "512"))
+# 인덱스 DB 오류 후 재시도까지 대기 (그동안 중복 억제 생략)
+DEDUP_RETRY_SEC = float(os.getenv("DEDUP_RETRY_SEC", "60"))
+
+_SHINGLE = 5
+_BANDS = 4
+_BAND_BITS = 16
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+_fp_table = ChunkFingerprint.__table__
+_band_cols = [_fp_table.c[f"band{i}"] for i in range(_BANDS)]
+
+
+# =================================================
+# SimHash
+# =================================================
+def simhash(text: str) -> int:
+    """
+    64bit SimHash (shingle 빈도 가중)
+    """
+    text = " ".join(text.lower().split())
+    if len(text) <= _SHINGLE:
+        grams = Counter([text])
+    else:
+        grams = Counter(text[i:i + _SHINGLE] for i in range(len(text) - _SHINGLE + 1))
+
+    digests = b"".join(
+        hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest()
+        for g in grams
+    )
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(-1, 64)
+    weights = np.fromiter(grams.values(), dtype=np.int64, count=len(grams))
+    score = weights @ (bits.astype(np.int64) * 2 - 1)
+
+    return int.from_bytes(np.packbits(score > 0).tobytes(), "big")
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def _bands(h: int) -> list[int]:
+    return [(h >> (i * _BAND_BITS)) & _BAND_MASK for i in range(_BANDS)]
+
+
+def _to_signed(h: int) -> int:
+    # MySQL BIGINT (signed) 저장용
+    return h - (1 << 64) if h >= 1 << 63 else h
+
+
+def _to_unsigned(h: int) -> int:
+    return h + (1 << 64) if h < 0 else h
+
+
+# =================================================
+# metrics
+# =================================================
+@dataclass
+class DedupStats:
+    checked: int = 0        # 지문을 만든 chunk 수
+    duplicates: int = 0     # 근접 중복으로 판정되어 임베딩 생략
+    reused: int = 0         # 기존 벡터 재사용
+    skipped: int = 0        # point 생성 안 함
+    local_hits: int = 0     # 같은 ingest 내 중복
+    index_hits: int = 0     # 다른 문서와의 중복
+    misses: int = 0         # 인덱스에는 있으나 현재 컬렉션에 point 없음 → 임베딩
+    index_errors: int = 0
+
+
+_stats = DedupStats()
+_stats_lock = threading.Lock()
+
+
+def _count(**kw):
+    with _stats_lock:
+        for key, value in kw.items():
+            setattr(_stats, key, getattr(_stats, key) + value)
+
+
+def dedup_stats() -> dict:
+    with _stats_lock:
+        stats = asdict(_stats)
+    stats["mode"] = DEDUP_MODE
+    stats["dedup_ratio"] = (
+        round(stats["duplicates"] / stats["checked"], 4) if stats["checked"] else 0.0
+    )
+    return stats
+
+
+# =================================================
+# fingerprint index (chunk_fingerprint)
+# =================================================
+class FingerprintIndex:
+    """
+    chunk_fingerprint 테이블 조회/등록 (호출마다 별도 세션, 예외는 삼킴)
+    """
+
+    def __init__(self, max_distance: int = DEDUP_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._disabled_until = 0.0
+
+    def find(self, hashes: Sequence[int]) -> dict[int, int]:
+        """
+        simhash 목록 → {simhash: 가장 가까운 content_id}
+
+        - band 별로 조회 (band 인덱스 1개씩 사용) 후 (band, 값) 으로 묶음
+        - 각 지문은 자신의 band 값이 같은 후보하고만 비교
+        """
+        if not hashes or not self._available():
+            return {}
+
+        band_values = [set() for _ in range(_BANDS)]
+        for h in hashes:
+            for i, b in enumerate(_bands(h)):
+                band_values[i].add(b)
+
+        # (band index, band 값) → [(content_id, simhash)]
+        buckets: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        try:
+            with SessionLocal() as session:
+                for i, (col, values) in enumerate(zip(_band_cols, band_values)):
+                    rows = session.execute(
+                        select(col, _fp_table.c.content_id, _fp_table.c.simhash)
+                        .where(col.in_(values))
+                    ).all()
+                    for b, content_id, h in rows:
+                        buckets.setdefault((i, b), []).append((content_id, _to_unsigned(h)))
+        except Exception as e:
+            self._fail("lookup", e)
+            return {}
+
+        found = {}
+        for h in hashes:
+            best = None
+            for key in enumerate(_bands(h)):
+                for content_id, other in buckets.get(key, ()):
+                    distance = hamming(h, other)
+                    if distance <= self.max_distance and (best is None or distance < best[0]):
+                        best = (distance, content_id)
+            if best:
+                found[h] = best[1]
+        return found
+
+    def add(self, rows: Sequence[tuple[int, int, int]]) -> None:
+        """
+        rows: (content_id, doc_id, simhash)
+        """
+        if not rows or not self._available():
+            return
+
+        try:
+            with SessionLocal() as session:
+                session.execute(
+                    insert(_fp_table),
+                    [
+                        {
+                            "content_id": content_id,
+                            "doc_id": doc_id,
+                            "simhash": _to_signed(h),
+                            **{f"band{i}": b for i, b in enumerate(_bands(h))},
+                        }
+                        for content_id, doc_id, h in rows
+                    ],
+                )
+                session.commit()
+        except Exception as e:
+            self._fail("insert", e)
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._disabled_until
+
+    def _fail(self, op: str, e: Exception) -> None:
+        _count(index_errors=1)
+        self._disabled_until = time.monotonic() + DEDUP_RETRY_SEC
+        logger.warning(
+            f"[DEDUP] index {op} failed, disabled for {DEDUP_RETRY_SEC:.0f}s | {e}"
+        )
+
+
+_index = FingerprintIndex()
+
+
+# =================================================
+# ingest 단위 판별
+# =================================================
+@dataclass
+class DedupDecision:
+    fingerprint: int | None = None       # 임베딩 대상이면 등록할 지문
+    duplicate_of: int | None = None      # 인덱스 중복: 원본 content_id
+    vector: List[float] | None = None    # reuse: 재사용 벡터
+    follow: int | None = None            # 같은 batch 앞쪽 item index (임베딩 후 벡터 복사)
+    skip: bool = False                   # skip 모드 중복 → point 없음
+
+    @property
+    def embed(self) -> bool:
+        return not self.skip and self.vector is None and self.follow is None
+
+
+class ChunkDeduper:
+    """
+    ingest 1건(컬렉션 고정)의 근접 중복 판별
+
+    사용법 (embed stage):
+        decisions = deduper.resolve(texts)
+        ... decisions[i].embed 인 것만 임베딩 ...
+        deduper.remember(decisions, vectors)
+    사용법 (write 단계, content_id 확보 후):
+        deduper.register(doc_id, decisions, content_ids)
+    """
+
+    def __init__(
+        self,
+        *,
+        collection_name: str,
+        mode: str = DEDUP_MODE,
+        index: FingerprintIndex = _index,
+    ):
+        self.collection_name = collection_name
+        self.mode = mode
+        self.index = index
+        self.duplicates = 0
+        # simhash → float32 벡터 (skip 모드는 None)
+        self._local: OrderedDict[int, array | None] = OrderedDict()
+
+    def resolve(self, texts: Sequence[str]) -> List[DedupDecision]:
+        decisions = [DedupDecision() for _ in texts]
+        pending: dict[int, int] = {}   # 이 batch 에서 임베딩할 지문 → item index
+
+        for i, text in enumerate(texts):
+            if len(text) < DEDUP_MIN_CHARS:
+                continue
+
+            h = simhash(text)
+            _count(checked=1)
+
+            local = self._find_local(h)
+            if local is not None:
+                self._mark(decisions[i], vector=self._local[local], local=True)
+                continue
+
+            near = next((j for k, j in pending.items() if hamming(h, k) <= self.index.max_distance), None)
+            if near is not None:
+                if self.mode != "skip":
+                    decisions[i].follow = near
+                self._mark(decisions[i], vector=None, local=True)
+                continue
+
+            decisions[i].fingerprint = h
+            pending[h] = i
+
+        self._resolve_index(decisions, pending)
+        return decisions
+
+    def remember(self, decisions: Sequence[DedupDecision], vectors: Sequence[List[float] | None]) -> None:
+        """
+        새로 임베딩한 chunk 를 같은 ingest 내 재사용용으로 기억 (follow 벡터 채움)
+        """
+        for d, vector in zip(decisions, vectors):
+            if d.fingerprint is None or not d.embed or vector is None:
+                continue
+            self._local[d.fingerprint] = None if self.mode == "skip" else array("f", vector)
+            self._local.move_to_end(d.fingerprint)
+            while len(self._local) > DEDUP_LOCAL_MAX:
+                self._local.popitem(last=False)
+
+    def register(self, doc_id: int, decisions: Sequence[DedupDecision], content_ids: Sequence[int]) -> None:
+        self.index.add([
+            (content_id, doc_id, d.fingerprint)
+            for d, content_id in zip(decisions, content_ids)
+            if d.fingerprint is not None and d.embed
+        ])
+
+    # --------------------------
+    # internal
+    # --------------------------
+    def _find_local(self, h: int) -> int | None:
+        best = None
+        for other in self._local:
+            distance = hamming(h, other)
+            if distance <= self.index.max_distance and (best is None or distance < best[0]):
+                best = (distance, other)
+        return best[1] if best else None
+
+    def _mark(self, d: DedupDecision, *, vector, local: bool, duplicate_of: int | None = None):
+        if self.mode == "skip":
+            d.skip = True
+        elif vector is not None:
+            d.vector = vector.tolist() if isinstance(vector, array) else vector
+        d.duplicate_of = duplicate_of
+        self.duplicates += 1
+        _count(
+            duplicates=1,
+            **{"local_hits" if local else "index_hits": 1},
+            **{"skipped" if self.mode == "skip" else "reused": 1},
+        )
+
+    def _resolve_index(self, decisions: List[DedupDecision], pending: dict[int, int]) -> None:
+        matches = self.index.find(list(pending))
+        if not matches:
+            return
+
+        # 원본 point 가 현재 컬렉션에 있어야 재사용/생략 가능 (다른 모델 컬렉션 대비)
+        try:
+            records = get_qdrant_client().retrieve(
+                collection_name=self.collection_name,
+                ids=list(set(matches.values())),
+                with_payload=False,
+                with_vectors=self.mode != "skip",
+            )
+        except Exception as e:
+            logger.warning(f"[DEDUP] qdrant retrieve failed | {e}")
+            return
+
+        found = {int(r.id): r.vector for r in records}
+
+        for h, content_id in matches.items():
+            if content_id not in found or (self.mode != "skip" and found[content_id] is None):
+                _count(misses=1)
+                continue
+            d = decisions[pending[h]]
+            d.fingerprint = None   # 원본이 이미 등록됨
+            self._mark(d, vector=found[content_id], local=False, duplicate_of=content_id)
+
+
+def get_deduper(collection_name: str) -> ChunkDeduper | None:
+    if DEDUP_MODE not in ("reuse", "skip"):
+        return None
+    return ChunkDeduper(collection_name=collection_name)
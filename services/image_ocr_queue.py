@@ -0,0 +1,435 @@
+# services/image_ocr_queue.py
+"""
+추출 이미지(images 테이블) 백그라운드 OCR
+
+ingest_file 이 끝난 문서의 doc_id 를 받아,
+ocr_text 가 비어 있는 이미지를 OCR worker pool 에서 처리하고
+
+- images.ocr_text 에 결과 기록 (텍스트 없음 = "" → 재처리 안 함)
+- OCR 텍스트를 chunk → 임베딩 → content_table + Qdrant (payload origin=image_ocr)
+- ocr_text 는 임베딩 성공 후 content row 와 같은 commit 으로 기록
+  (실패 시 rollback + 이미 보낸 point 삭제 → ocr_text NULL 유지, 다음 시작 시 재시도)
+- PDF 스캔 페이지 이미지는 ingest 시 ocr_text="" 로 등록 (본문 OCR fallback 과 중복 방지)
+
+텍스트 ingest 와는 분리된 단일 dispatcher 스레드에서 실행되며,
+큐가 가득 차면 enqueue 는 대기하지 않고 건너뜀 (다음 시작 시 backlog 스캔으로 회수)
+"""
+
+import os
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+
+from qdrant_client.models import PointIdsList
+from sqlalchemy import bindparam, select, update
+
+from config.db import SessionLocal
+from models.ImageTable import ImageTable
+from models.meta import MetaTable
+from services.bulk_insert import ContentBulkInserter
+from services.chunking import chunk_text
+from services.ocr_executor import OCR_WORKERS, get_ocr_executor
+from services.text_normalizer import normalize_many
+from vector.embedding import embed_texts
+from vector.embedding_models import get_embedding_config
+from vector.realtime_vector import VectorRecord, VectorWriter, get_qdrant_client
+
+logger = logging.getLogger("image_ocr")
+
+IMAGE_OCR_ENABLED = os.getenv("IMAGE_OCR_ENABLED", "true").lower() == "true"
+IMAGE_OCR_QUEUE_SIZE = int(os.getenv("IMAGE_OCR_QUEUE_SIZE", "1000"))
+# 동시에 OCR worker 에 넘겨 둘 이미지 수
+IMAGE_OCR_INFLIGHT = int(os.getenv("IMAGE_OCR_INFLIGHT", str(max(1, OCR_WORKERS) * 2)))
+# 이 글자 수 미만의 OCR 결과는 임베딩하지 않음 (로고/아이콘 노이즈)
+IMAGE_OCR_MIN_CHARS = int(os.getenv("IMAGE_OCR_MIN_CHARS", "10"))
+
+# 이미지 파일 자체가 문서인 경우 ImageOCRLoader 가 이미 본문으로 임베딩함
+_IMAGE_DOC_TYPES = {"jpg", "jpeg", "png", "webp"}
+
+_images = ImageTable.__table__
+
+
+@dataclass
+class ImageOCRJob:
+    doc_id: int
+    collection_name: str
+    model_key: str
+
+
+@dataclass
+class ImageOCRStats:
+    docs_queued: int = 0
+    docs_done: int = 0
+    docs_failed: int = 0
+    docs_dropped: int = 0
+    images_done: int = 0
+    images_failed: int = 0
+    chunks_embedded: int = 0
+    busy_sec: float = 0.0
+    current_doc: int | None = None
+    started_at: datetime | None = None
+
+
+class ImageOCRQueue:
+    """
+    사용법:
+        q = ImageOCRQueue()
+        q.start()
+        q.enqueue(doc_id, collection_name=..., model_key=...)
+        q.metrics()
+        q.stop()
+    """
+
+    def __init__(self, queue_size: int = IMAGE_OCR_QUEUE_SIZE):
+        self._queue: queue.Queue[ImageOCRJob] = queue.Queue(maxsize=queue_size)
+        self._queued_ids: set[int] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.stats = ImageOCRStats()
+
+    # --------------------------
+    # lifecycle
+    # --------------------------
+    def start(self, *, collection_name: str | None = None, model_key: str | None = None):
+        """
+        collection_name/model_key 가 주어지면 이전 실행에서 남은 미처리 이미지도 회수
+        """
+        self.stats.started_at = datetime.now()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(collection_name, model_key),
+            name="image-ocr",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, wait: bool = True):
+        """
+        진행 중인 문서는 마무리, 대기 중인 문서는 버림 (ocr_text 가 NULL 로 남아 다음 시작 시 회수)
+        """
+        self._stop.set()
+        if wait and self._thread:
+            self._thread.join()
+        self._thread = None
+
+    # --------------------------
+    # public
+    # --------------------------
+    def enqueue(self, doc_id: int, *, collection_name: str, model_key: str) -> bool:
+        """
+        non-blocking (큐가 가득 차면 False)
+        """
+        with self._lock:
+            if doc_id in self._queued_ids:
+                return True
+            try:
+                self._queue.put_nowait(ImageOCRJob(doc_id, collection_name, model_key))
+            except queue.Full:
+                self.stats.docs_dropped += 1
+                logger.warning(f"[IMAGE OCR] queue full, skipped | doc_id={doc_id}")
+                return False
+            self._queued_ids.add(doc_id)
+            self.stats.docs_queued += 1
+            return True
+
+    def metrics(self) -> dict:
+        with self._lock:
+            stats = asdict(self.stats)
+            pending = self._queue.qsize()
+
+        busy = stats["busy_sec"]
+        stats.update(
+            running=bool(self._thread and self._thread.is_alive()),
+            pending_docs=pending,
+            images_per_sec=round(stats["images_done"] / busy, 2) if busy else None,
+        )
+        return stats
+
+    # --------------------------
+    # 내부
+    # --------------------------
+    def _run(self, collection_name: str | None, model_key: str | None):
+        if collection_name and model_key:
+            try:
+                self._enqueue_backlog(collection_name, model_key)
+            except Exception:
+                logger.exception("[IMAGE OCR] backlog scan failed")
+
+        while not self._stop.is_set():
+            try:
+                job = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            started = time.perf_counter()
+            with self._lock:
+                self.stats.current_doc = job.doc_id
+
+            try:
+                self._process(job)
+                with self._lock:
+                    self.stats.docs_done += 1
+            except Exception:
+                logger.exception(f"[IMAGE OCR] failed | doc_id={job.doc_id}")
+                with self._lock:
+                    self.stats.docs_failed += 1
+            finally:
+                with self._lock:
+                    self._queued_ids.discard(job.doc_id)
+                    self.stats.current_doc = None
+                    self.stats.busy_sec += time.perf_counter() - started
+
+    def _enqueue_backlog(self, collection_name: str, model_key: str):
+        """
+        시작 이전에 등록된 문서 중 OCR 미처리 이미지가 남은 문서
+        (시작 이후 문서는 ingest 완료 시점에 enqueue 되므로 제외 → ingest 중인 문서와 겹치지 않음)
+        """
+        db = SessionLocal()
+        try:
+            doc_ids = db.execute(
+                select(_images.c.doc_id)
+                .join(MetaTable, MetaTable.seq_id == _images.c.doc_id)
+                .where(_images.c.ocr_text.is_(None))
+                .where(MetaTable.create_dt < self.stats.started_at)
+                .distinct()
+            ).scalars().all()
+        finally:
+            db.close()
+
+        for doc_id in doc_ids:
+            if not self.enqueue(doc_id, collection_name=collection_name, model_key=model_key):
+                break
+
+        if doc_ids:
+            logger.info(f"[IMAGE OCR] backlog | docs={len(doc_ids)}")
+
+    def _process(self, job: ImageOCRJob):
+        db = SessionLocal()
+        try:
+            meta = db.get(MetaTable, job.doc_id)
+            if meta is None:
+                return
+
+            rows = db.execute(
+                select(
+                    _images.c.seq_id,
+                    _images.c.page_no,
+                    _images.c.image_no,
+                    _images.c.image_path,
+                )
+                .where(_images.c.doc_id == job.doc_id)
+                .where(_images.c.ocr_text.is_(None))
+                .order_by(_images.c.seq_id)
+            ).all()
+            if not rows:
+                return
+
+            results = list(self._ocr_rows(rows))
+            if not results:
+                return
+
+            point_ids: list[int] = []
+            embedded = 0
+            try:
+                # 1️⃣ 추가 chunk 임베딩 (이미지 문서는 본문에서 이미 처리)
+                if (meta.file_type or "").lower() not in _IMAGE_DOC_TYPES:
+                    embedded = self._embed(db, job, meta, results, point_ids)
+
+                # 2️⃣ ocr_text 기록 (content row 와 같은 commit)
+                db.execute(
+                    update(_images)
+                    .where(_images.c.seq_id == bindparam("_seq_id"))
+                    .values(ocr_text=bindparam("_ocr_text")),
+                    [{"_seq_id": row.seq_id, "_ocr_text": text} for row, text in results],
+                )
+                db.commit()
+            except Exception:
+                db.rollback()
+                self._delete_points(job, point_ids)
+                raise
+
+            with self._lock:
+                self.stats.chunks_embedded += embedded
+
+            logger.info(
+                f"[IMAGE OCR] done | doc_id={job.doc_id} images={len(results)} "
+                f"failed={len(rows) - len(results)}"
+            )
+        finally:
+            db.close()
+
+    def _ocr_rows(self, rows):
+        """
+        (row, text) - OCR 실패 이미지는 제외 (ocr_text NULL 유지 → 다음 시작 시 재시도)
+        """
+        ocr = get_ocr_executor()
+        pending = deque()
+
+        def pop():
+            row, future = pending.popleft()
+            try:
+                text = future.result().replace("\xa0", " ").strip()
+            except Exception as e:
+                logger.warning(f"[IMAGE OCR] image={row.image_path} failed | {e}")
+                with self._lock:
+                    self.stats.images_failed += 1
+                return None
+            with self._lock:
+                self.stats.images_done += 1
+            return row, text
+
+        for row in rows:
+            try:
+                with open(row.image_path, "rb") as f:
+                    data = f.read()
+            except OSError as e:
+                logger.warning(f"[IMAGE OCR] image={row.image_path} unreadable | {e}")
+                with self._lock:
+                    self.stats.images_failed += 1
+                continue
+
+            pending.append((row, ocr.submit(data)))
+
+            while len(pending) >= IMAGE_OCR_INFLIGHT:
+                result = pop()
+                if result:
+                    yield result
+
+        while pending:
+            result = pop()
+            if result:
+                yield result
+
+    def _embed(self, db, job: ImageOCRJob, meta: MetaTable, results, point_ids: list[int]) -> int:
+        """
+        content row INSERT (commit 은 호출자) + Qdrant upsert
+
+        - 보낸 point id 는 point_ids 에 누적 (실패 시 호출자가 삭제)
+        - 반환: 추가된 chunk 수
+        """
+        cfg = get_embedding_config(job.model_key)
+
+        items = []   # (row, chunk_no, text)
+        for row, text in results:
+            if len(text) < IMAGE_OCR_MIN_CHARS:
+                continue
+            chunks = normalize_many(
+                chunk_text(text, size=cfg.chunk_size, overlap=cfg.chunk_overlap)
+            )
+            for idx, chunk in enumerate(chunks, start=1):
+                if chunk:
+                    items.append((row, idx, chunk))
+
+        if not items:
+            return 0
+
+        batch_size = cfg.max_batch_size
+        inserter = ContentBulkInserter(db, job.doc_id)
+        writer = VectorWriter(collection_name=job.collection_name, model_key=job.model_key)
+
+        try:
+            for start in range(0, len(items), batch_size):
+                batch = items[start:start + batch_size]
+                vectors = embed_texts(
+                    [text[:cfg.max_input_chars] for _, _, text in batch], job.model_key
+                )
+
+                content_ids = inserter.insert([
+                    {"page_no": row.page_no, "chunk_no": chunk_no, "content": text}
+                    for row, chunk_no, text in batch
+                ])
+                point_ids.extend(content_ids)
+
+                for (row, chunk_no, text), content_id, vector in zip(batch, content_ids, vectors):
+                    writer.add(
+                        VectorRecord(
+                            content_id=content_id,
+                            doc_id=job.doc_id,
+                            page_no=row.page_no,
+                            chunk_no=chunk_no,
+                            text=text,
+                            folder_name=meta.folder_name,
+                            title=meta.title,
+                            file_type=meta.file_type,
+                            source=meta.source,
+                            extra_payload={
+                                "origin": "image_ocr",
+                                "image_id": row.seq_id,
+                                "image_no": row.image_no,
+                            },
+                        ),
+                        vector,
+                    )
+
+            failures = writer.close()
+        except Exception:
+            writer.abort()
+            raise
+
+        if failures:
+            logger.error(
+                f"[IMAGE OCR] vector fail | doc_id={job.doc_id} "
+                f"failed_points={[f.point_id for f in failures]}"
+            )
+
+        return inserter.inserted
+
+    def _delete_points(self, job: ImageOCRJob, point_ids: list[int]):
+        """
+        rollback 된 content row 의 point 삭제 (point id = content_id)
+        """
+        if not point_ids:
+            return
+        try:
+            get_qdrant_client().delete(
+                collection_name=job.collection_name,
+                points_selector=PointIdsList(points=point_ids),
+            )
+        except Exception as e:
+            logger.warning(
+                f"[IMAGE OCR] orphan point cleanup failed | doc_id={job.doc_id} "
+                f"points={len(point_ids)} | {e}"
+            )
+
+
+# =================================================
+# singleton (pipeline runner 가 start/stop)
+# =================================================
+_ocr_queue: ImageOCRQueue | None = None
+
+
+def start_image_ocr_queue(*, collection_name: str | None = None, model_key: str | None = None):
+    global _ocr_queue
+    if not IMAGE_OCR_ENABLED or _ocr_queue is not None:
+        return
+    _ocr_queue = ImageOCRQueue()
+    _ocr_queue.start(collection_name=collection_name, model_key=model_key)
+    logger.info("[IMAGE OCR] queue started")
+
+
+def stop_image_ocr_queue(wait: bool = True):
+    global _ocr_queue
+    if _ocr_queue is None:
+        return
+    _ocr_queue.stop(wait=wait)
+    _ocr_queue = None
+    logger.info("[IMAGE OCR] queue stopped")
+
+
+def enqueue_image_ocr(doc_id: int, *, collection_name: str, model_key: str) -> bool:
+    """
+    큐 미시작(파이프라인 중지 상태) 시 False → ocr_text NULL 유지, 다음 시작 시 backlog 로 회수
+    """
+    if _ocr_queue is None:
+        return False
+    return _ocr_queue.enqueue(doc_id, collection_name=collection_name, model_key=model_key)
+
+
+def image_ocr_metrics() -> dict | None:
+    return _ocr_queue.metrics() if _ocr_queue is not None else None
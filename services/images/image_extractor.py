@@ -6,6 +6,8 @@ from typing import List, Dict
 
 import fitz  # pymupdf
 
+from services.loaders.pdf_loader import ocr_fallback_pages
+
 ZIP_MEDIA_PATHS = {
     ".docx": "word/media/",
     ".pptx": "ppt/media/",
@@ -21,6 +23,9 @@ IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".webp"}
 def extract_images_from_pdf(file_path: Path, out_dir: Path) -> List[Dict]:
     meta = []
     doc = fitz.open(file_path)
+    # 페이지 전체를 OCR 하는 스캔 페이지 → 이미지 OCR 생략 표시 (마지막 이미지 페이지까지만 확인)
+    image_pages = [i + 1 for i in range(len(doc)) if doc[i].get_images()]
+    ocr_pages = ocr_fallback_pages(doc, until=image_pages[-1]) if image_pages else set()
 
     for page_idx in range(len(doc)):
         page = doc[page_idx]
@@ -36,7 +41,8 @@ def extract_images_from_pdf(file_path: Path, out_dir: Path) -> List[Dict]:
 
             meta.append({
                 "page": page_idx + 1,
-                "image": fname
+                "image": fname,
+                "page_ocr": page_idx + 1 in ocr_pages,
             })
 
     return meta
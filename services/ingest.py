@@ -1,11 +1,12 @@
 import os
 import logging
+from contextlib import closing
+from dataclasses import dataclass
 from datetime import datetime
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from models.meta import MetaTable
-from models.content import ContentTable
-from models.ImageTable import ImageTable
 
 from services.loaders.pdf_loader import PDFLoader
 from services.loaders.txt_loader import TXTLoader
@@ -13,14 +14,25 @@ from services.loaders.excel_loader import ExcelLoader
 from services.loaders.csv_loader import CSVLoader
 from services.loaders.docx_loader import DOCXLoader
 from services.loaders.image_ocr_loader import ImageOCRLoader
+from services.loaders.row_packer import pack_chars_for
 
-from services.chunking import chunk_text
-from services.utils.file_hash import file_sha1
+from services.bulk_insert import ContentBulkInserter, bulk_insert_images
+from services.chunking import iter_chunks
+from services.ingest_pipeline import StagePipeline
+from services.ingest_job import IngestJob
 from services.images.image_extractor import extract_images
+from services.image_ocr_queue import enqueue_image_ocr
+from services.dedup import ChunkDeduper, DedupDecision, get_deduper
 from services.text_normalizer import normalize_for_embedding
 
 from vector.collection_manager import ensure_collection
-from vector.realtime_vector import insert_vector, get_qdrant_client
+from vector.embedding import embed_texts
+from vector.embedding_models import get_embedding_config
+from vector.realtime_vector import (
+    VectorRecord,
+    VectorWriter,
+    get_qdrant_client,
+)
 
 
 # =================================================
@@ -84,6 +96,97 @@ LOADER_MAP = {
 }
 
 
+# =================================================
+# pipeline stages (parse → chunk → embed → write)
+# =================================================
+@dataclass
+class ChunkItem:
+    page_no: int
+    chunk_no: int
+    text: str          # normalize_for_embedding 적용 결과
+    payload: dict | None = None   # loader meta (예: row_start/row_end) → Qdrant payload
+
+
+@dataclass
+class EmbeddedBatch:
+    items: list[ChunkItem]
+    vectors: list[list[float] | None]   # items 와 같은 순서 (빈 텍스트 / skip 중복 = None)
+    error: Exception | None = None
+    decisions: list[DedupDecision] | None = None   # 근접 중복 판별 결과 (dedup 비활성 = None)
+
+
+def _make_chunk_stage(size: int, overlap: int):
+    """
+    loader 출력 (unit_no, text[, meta]) → ChunkItem
+    (unit 경계를 넘어 이어 붙임, 여러 unit 에 걸친 chunk 는 payload 에 page_end)
+    """
+    def chunk_stage(units):
+        for chunk in iter_chunks(units, size=size, overlap=overlap):
+            payload = dict(chunk.meta or {})
+            if chunk.page_end != chunk.page_no:
+                payload["page_end"] = chunk.page_end
+
+            yield ChunkItem(
+                page_no=chunk.page_no,
+                chunk_no=chunk.chunk_no,
+                text=normalize_for_embedding(chunk.text),
+                payload=payload or None,
+            )
+
+    return chunk_stage
+
+
+def _embed_batch(
+    items: list[ChunkItem],
+    model_key: str,
+    deduper: ChunkDeduper | None = None,
+) -> EmbeddedBatch:
+    vectors: list[list[float] | None] = [None] * len(items)
+    max_chars = get_embedding_config(model_key).max_input_chars
+
+    # 근접 중복 → 기존 벡터 재사용 / skip (임베딩 대상에서 제외)
+    decisions = deduper.resolve([item.text for item in items]) if deduper else None
+    targets = [
+        i for i, item in enumerate(items)
+        if item.text.strip() and (decisions is None or decisions[i].embed)
+    ]
+
+    try:
+        embedded = embed_texts([items[i].text[:max_chars] for i in targets], model_key)
+    except Exception as e:
+        return EmbeddedBatch(items=items, vectors=vectors, error=e, decisions=decisions)
+
+    for i, vector in zip(targets, embedded):
+        vectors[i] = vector
+
+    if decisions is not None:
+        for i, d in enumerate(decisions):
+            if d.vector is not None:
+                vectors[i] = d.vector
+            elif d.follow is not None:
+                vectors[i] = vectors[d.follow]
+        deduper.remember(decisions, vectors)
+
+    return EmbeddedBatch(items=items, vectors=vectors, decisions=decisions)
+
+
+def _make_embed_stage(model_key: str, batch_size: int, deduper: ChunkDeduper | None = None):
+    """
+    ChunkItem 을 max_batch_size 단위로 묶어 batch 임베딩
+    """
+    def embed_stage(chunks):
+        batch: list[ChunkItem] = []
+        for item in chunks:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield _embed_batch(batch, model_key, deduper)
+                batch = []
+        if batch:
+            yield _embed_batch(batch, model_key, deduper)
+
+    return embed_stage
+
+
 # =================================================
 # ingest main
 # =================================================
@@ -95,10 +198,13 @@ def ingest_file(
     *,
     base_collection: str = BASE_COLLECTION,
     model_key: str | None = None,
+    job: IngestJob | None = None,
 ) -> int:
     """
     단일 파일 ingest
     (meta → content → vector)
+
+    - job: 호출자가 이미 계산한 해시/중복 체크 결과 (없으면 여기서 생성)
     """
 
     logger.info(f"[START] ingest_file | file={file_path}")
@@ -121,22 +227,30 @@ def ingest_file(
         raise ValueError(f"지원하지 않는 파일 타입: {ext}")
 
     # -------------------------------------------------
-    # 2️⃣ 해시
+    # 2️⃣ 해시 (job 에 있으면 재사용, 없으면 stat 캐시 경유)
     # -------------------------------------------------
-    file_hash = file_sha1(file_path)
+    if job is None:
+        job = IngestJob.from_path(
+            file_path,
+            source=source,
+            folder_name=folder_name,
+        )
+
+    file_hash = job.file_hash
 
     # -------------------------------------------------
-    # 3️⃣ 중복 체크
+    # 3️⃣ 중복 체크 (호출자가 이미 했으면 생략, 경합은 unique 제약으로 처리)
     # -------------------------------------------------
-    exists = db.query(MetaTable).filter(
-        MetaTable.file_hash == file_hash
-    ).first()
-
-    if exists:
-        logger.warning(
-            f"[SKIP] duplicate | file={file_path}, doc_id={exists.seq_id}"
-        )
-        return exists.seq_id
+    if not job.duplicate_checked:
+        exists = db.query(MetaTable).filter(
+            MetaTable.file_hash == file_hash
+        ).first()
+
+        if exists:
+            logger.warning(
+                f"[SKIP] duplicate | file={file_path}, doc_id={exists.seq_id}"
+            )
+            return exists.seq_id
 
     # -------------------------------------------------
     # 4️⃣ meta insert
@@ -152,7 +266,20 @@ def ingest_file(
     )
 
     db.add(meta)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # 동시 처리 중인 worker 가 같은 해시를 먼저 등록한 경우
+        db.rollback()
+        exists = db.query(MetaTable).filter(
+            MetaTable.file_hash == file_hash
+        ).first()
+        if not exists:
+            raise
+        logger.warning(
+            f"[SKIP] duplicate (concurrent) | file={file_path}, doc_id={exists.seq_id}"
+        )
+        return exists.seq_id
     db.refresh(meta)
 
     logger.info(f"[META] inserted | doc_id={meta.seq_id}")
@@ -168,21 +295,23 @@ def ingest_file(
         output_dir=image_dir,
     )
 
+    image_rows = []
     for idx, img in enumerate(images, start=1):
         image_name = img["image"]
         image_ext = os.path.splitext(image_name)[1].lstrip(".")
 
-        db.add(
-            ImageTable(
-                doc_id=meta.seq_id,
-                page_no=img.get("page"),
-                image_no=idx,
-                image_path=f"{image_dir}/{image_name}",
-                image_name=image_name,
-                image_ext=image_ext,
-            )
-        )
-
+        image_rows.append({
+            "doc_id": meta.seq_id,
+            "page_no": img.get("page"),
+            "image_no": idx,
+            "image_path": f"{image_dir}/{image_name}",
+            "image_name": image_name,
+            "image_ext": image_ext,
+            # 스캔 페이지 이미지는 본문 OCR 로 이미 색인 → "" (image OCR 큐 대상 아님)
+            "ocr_text": "" if img.get("page_ocr") else None,
+        })
+
+    bulk_insert_images(db, image_rows)
     db.commit()
 
     # -------------------------------------------------
@@ -195,49 +324,114 @@ def ingest_file(
         model_key=model_key,
     )
 
-    chunk_count = 0
+    embed_cfg = get_embedding_config(model_key)
 
-    for unit_no, text in loader.load(file_path):
-        for idx, chunk in enumerate(chunk_text(text), start=1):
-            clean = normalize_for_embedding(chunk)
-            chunk_count += 1
+    writer = VectorWriter(
+        collection_name=collection_name,
+        model_key=model_key,
+    )
 
-            content = ContentTable(
-                doc_id=meta.seq_id,
-                page_no=unit_no,
-                chunk_no=idx,
-                content=clean,
-            )
-            db.add(content)
-            db.flush()   # content_id 확보
-
-            try:
-                insert_vector(
-                    collection_name=collection_name,
-                    model_key=model_key,
-                    content_id=content.content_id,
-                    doc_id=meta.seq_id,
-                    page_no=unit_no,
-                    chunk_no=idx,
-                    text=clean[:1500],
-                    folder_name=folder_name,
-                    title=meta.title,
-                    file_type=ext,
-                    source=source,
-                )
-            except Exception as ve:
+    deduper = get_deduper(collection_name)
+    # (content_id, decision) → 문서 commit 후 지문 등록 (FK: content_table)
+    fingerprints: list[tuple[int, DedupDecision]] = []
+
+    # parse → chunk → embed 는 stage 스레드, write 는 현재 스레드 (db Session)
+    pipeline = StagePipeline(name=f"ingest-{meta.seq_id}")
+    # CSV / Excel 행 묶음 크기 = 이 문서 임베딩 모델의 chunk_size
+    load_kwargs = (
+        {"max_chars": pack_chars_for(embed_cfg.chunk_size)}
+        if isinstance(loader, (CSVLoader, ExcelLoader)) else {}
+    )
+    pipeline.add_stage("parse", lambda _: loader.load(file_path, **load_kwargs))
+    pipeline.add_stage("chunk", _make_chunk_stage(embed_cfg.chunk_size, embed_cfg.chunk_overlap))
+    pipeline.add_stage("embed", _make_embed_stage(model_key, embed_cfg.max_batch_size, deduper))
+
+    inserter = ContentBulkInserter(db, meta.seq_id)
+
+    with closing(pipeline.run()) as batches:
+        for batch in batches:
+            # batch 단위 multi-row INSERT + content_id 일괄 확보
+            content_ids = inserter.insert([
+                {
+                    "page_no": item.page_no,
+                    "chunk_no": item.chunk_no,
+                    "content": item.text,
+                }
+                for item in batch.items
+            ])
+
+            if batch.error is not None:
                 logger.error(
-                    f"[VECTOR FAIL] content_id={content.content_id} | {ve}"
+                    f"[VECTOR FAIL] content_ids={content_ids} | {batch.error}"
+                )
+                continue
+
+            decisions = batch.decisions or [None] * len(batch.items)
+
+            for item, content_id, vector, decision in zip(
+                batch.items, content_ids, batch.vectors, decisions
+            ):
+                if vector is None:
+                    continue
+
+                payload = item.payload
+                if decision is not None:
+                    if decision.fingerprint is not None:
+                        fingerprints.append((content_id, decision))
+                    if decision.duplicate_of is not None:
+                        payload = {**(payload or {}), "dedup_of": decision.duplicate_of}
+
+                writer.add(
+                    VectorRecord(
+                        content_id=content_id,   # Qdrant point id = content_id
+                        doc_id=meta.seq_id,
+                        page_no=item.page_no,
+                        chunk_no=item.chunk_no,
+                        text=item.text,
+                        folder_name=folder_name,
+                        title=meta.title,
+                        file_type=ext,
+                        source=source,
+                        extra_payload=payload,
+                    ),
+                    vector,
                 )
 
+    failures = writer.close()
     db.commit()
 
+    if deduper and fingerprints:
+        failed = {f.point_id for f in failures}
+        deduper.register(
+            meta.seq_id,
+            [d for cid, d in fingerprints if cid not in failed],
+            [cid for cid, d in fingerprints if cid not in failed],
+        )
+
+    if failures:
+        logger.error(
+            f"[VECTOR FAIL] doc_id={meta.seq_id} failed_points="
+            f"{[f.point_id for f in failures]}"
+        )
+
+    logger.info(f"[PIPELINE] doc_id={meta.seq_id} | {pipeline.report()}")
+
     # -------------------------------------------------
     # 7️⃣ 완료
     # -------------------------------------------------
     logger.info(
         f"[END] ingest completed | doc_id={meta.seq_id}, "
-        f"images={len(images)}, chunks={chunk_count}"
+        f"images={len(images)}, chunks={inserter.inserted}, "
+        f"vector_batches={writer.stats.batches}, "
+        f"near_duplicates={deduper.duplicates if deduper else 0}"
     )
 
+    # 이미지 OCR 은 백그라운드 큐에서 (텍스트 ingest 완료 후, 대기 없음)
+    if images:
+        enqueue_image_ocr(
+            meta.seq_id,
+            collection_name=collection_name,
+            model_key=model_key,
+        )
+
     return meta.seq_id
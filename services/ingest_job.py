@@ -0,0 +1,41 @@
+# services/ingest_job.py
+
+import os
+from dataclasses import dataclass
+
+from services.utils.file_hash import file_sha1_cached
+
+
+@dataclass
+class IngestJob:
+    """
+    파일 1건 ingest 작업 컨텍스트
+
+    watcher / batch / upload 에서 한 번 계산한 해시·크기·mtime 을
+    ingest_file 까지 그대로 전달 (파일 재해시, 중복 쿼리 반복 방지)
+    """
+    file_path: str
+    file_hash: str
+    size: int
+    mtime_ns: int
+    source: str = "watcher"
+    folder_name: str | None = None
+    duplicate_checked: bool = False   # 호출자가 MetaTable.file_hash 중복 조회 완료
+
+    @classmethod
+    def from_path(
+        cls,
+        file_path: str,
+        *,
+        source: str = "watcher",
+        folder_name: str | None = None,
+    ) -> "IngestJob":
+        st = os.stat(file_path)
+        return cls(
+            file_path=file_path,
+            file_hash=file_sha1_cached(file_path, st),
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            source=source,
+            folder_name=folder_name,
+        )
@@ -0,0 +1,229 @@
+# services/ingest_pipeline.py
+"""
+Stage pipeline (bounded queue 기반)
+
+ingest_file 내부에서 parse → chunk → embed → write 단계를
+스레드로 분리해 CPU 파싱과 네트워크 임베딩을 겹쳐 실행한다.
+
+- 각 stage 는 "입력 iterator → 출력 generator" 함수
+- stage 사이는 maxsize 가 있는 queue.Queue (가득 차면 상류 대기 = backpressure)
+- 마지막 stage 출력은 호출 스레드에서 소비 (DB Session 은 호출 스레드 소유)
+- stage 별 busy / 입력 대기 / 출력 대기 시간 집계
+"""
+
+import os
+import time
+import queue
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, List
+
+logger = logging.getLogger("ingest")
+
+INGEST_QUEUE_SIZE = int(os.getenv("INGEST_QUEUE_SIZE", "8"))
+
+_DONE = object()
+_POLL_SEC = 0.1
+
+
+class PipelineCancelled(Exception):
+    """다른 stage 실패/중단으로 파이프라인이 취소됨"""
+
+
+@dataclass
+class StageStats:
+    name: str
+    items: int = 0
+    busy_sec: float = 0.0
+    wait_in_sec: float = 0.0
+    wait_out_sec: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.name}: items={self.items} busy={self.busy_sec:.2f}s "
+            f"wait_in={self.wait_in_sec:.2f}s wait_out={self.wait_out_sec:.2f}s"
+        )
+
+
+# Stage 함수: 입력 iterator 를 받아 출력 generator 반환
+StageFn = Callable[[Iterator[Any]], Iterable[Any]]
+
+
+class StagePipeline:
+    """
+    사용법:
+        pipeline = StagePipeline(queue_size=8)
+        pipeline.add_stage("parse", lambda _: loader.load(path))
+        pipeline.add_stage("chunk", chunk_stage)
+        pipeline.add_stage("embed", embed_stage)
+
+        for item in pipeline.run():      # write stage (호출 스레드)
+            ...
+
+        pipeline.report()
+    """
+
+    def __init__(self, *, queue_size: int = INGEST_QUEUE_SIZE, name: str = "ingest"):
+        self.queue_size = max(1, queue_size)
+        self.name = name
+        self.stats: List[StageStats] = []
+
+        self._stages: List[tuple[str, StageFn]] = []
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._error: BaseException | None = None
+        self._error_lock = threading.Lock()
+        self._started = 0.0
+        self._elapsed = 0.0
+
+    # --------------------------
+    # 구성
+    # --------------------------
+    def add_stage(self, name: str, fn: StageFn) -> "StagePipeline":
+        self._stages.append((name, fn))
+        return self
+
+    # --------------------------
+    # 실행
+    # --------------------------
+    def run(self, consumer_name: str = "write") -> Iterator[Any]:
+        """
+        stage 스레드를 시작하고 마지막 stage 출력을 yield
+        (호출 스레드에서 소비하는 구간 = consumer stage)
+        """
+        if not self._stages:
+            return
+
+        self._started = time.perf_counter()
+        in_q: queue.Queue | None = None
+
+        for name, fn in self._stages:
+            out_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+            stats = StageStats(name=name)
+            self.stats.append(stats)
+
+            t = threading.Thread(
+                target=self._run_stage,
+                args=(fn, in_q, out_q, stats),
+                name=f"{self.name}-{name}",
+                daemon=True,
+            )
+            self._threads.append(t)
+            in_q = out_q
+
+        consumer = StageStats(name=consumer_name)
+        self.stats.append(consumer)
+
+        for t in self._threads:
+            t.start()
+
+        try:
+            for item in self._iter_queue(in_q, consumer):
+                # yield 로 멈춰 있는 동안 = 호출 스레드 처리 시간
+                resumed = time.perf_counter()
+                yield item
+                consumer.busy_sec += time.perf_counter() - resumed
+                consumer.items += 1
+        except PipelineCancelled:
+            pass
+        except BaseException as e:
+            # 소비 측 중단(GeneratorExit 포함) → 상류 stage 취소
+            self._fail(e)
+            raise
+        finally:
+            self._shutdown()
+
+        if self._error is not None:
+            raise self._error
+
+    def report(self) -> str:
+        """
+        stage 별 소요 시간 요약 (문서 단위 로그용)
+        """
+        lines = " | ".join(s.summary() for s in self.stats)
+        return f"total={self._elapsed:.2f}s | {lines}"
+
+    # --------------------------
+    # 내부
+    # --------------------------
+    def _run_stage(self, fn, in_q, out_q, stats: StageStats):
+        try:
+            source = self._iter_queue(in_q, stats) if in_q is not None else iter(())
+            outputs = iter(fn(source))
+
+            while True:
+                started = time.perf_counter()
+                wait_before = stats.wait_in_sec
+                try:
+                    item = next(outputs)
+                except StopIteration:
+                    break
+                finally:
+                    # 입력 대기 시간은 busy 에서 제외
+                    stats.busy_sec += (
+                        time.perf_counter() - started
+                        - (stats.wait_in_sec - wait_before)
+                    )
+
+                self._put(out_q, item, stats)
+                stats.items += 1
+
+        except PipelineCancelled:
+            pass
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            self._put_done(out_q)
+
+    def _iter_queue(self, q: queue.Queue, stats: StageStats) -> Iterator[Any]:
+        while True:
+            started = time.perf_counter()
+            item = self._get(q)
+            stats.wait_in_sec += time.perf_counter() - started
+
+            if item is _DONE:
+                return
+            yield item
+
+    def _get(self, q: queue.Queue):
+        while True:
+            if self._stop.is_set():
+                raise PipelineCancelled()
+            try:
+                return q.get(timeout=_POLL_SEC)
+            except queue.Empty:
+                continue
+
+    def _put(self, q: queue.Queue, item, stats: StageStats):
+        started = time.perf_counter()
+        while True:
+            if self._stop.is_set():
+                raise PipelineCancelled()
+            try:
+                q.put(item, timeout=_POLL_SEC)
+                break
+            except queue.Full:
+                continue
+        stats.wait_out_sec += time.perf_counter() - started
+
+    def _put_done(self, q: queue.Queue):
+        while True:
+            try:
+                q.put(_DONE, timeout=_POLL_SEC)
+                return
+            except queue.Full:
+                if self._stop.is_set():
+                    return
+
+    def _fail(self, e: BaseException):
+        with self._error_lock:
+            if self._error is None and not isinstance(e, GeneratorExit):
+                self._error = e
+        self._stop.set()
+
+    def _shutdown(self):
+        self._stop.set()
+        for t in self._threads:
+            t.join()
+        self._elapsed = time.perf_counter() - self._started
@@ -5,11 +5,12 @@ class BaseLoader(ABC):
     file_type: str
 
     @abstractmethod
-    def load(self, file_path: str) -> Iterable[Tuple[int, str]]:
+    def load(self, file_path: str) -> Iterable[Tuple]:
         """
         반환:
         [
           (unit_no, text),
+          (unit_no, text, meta),   # meta: Qdrant payload 에 추가 (예: row_start/row_end)
           ...
         ]
         """
@@ -1,26 +1,157 @@
+import io
+import os
 import csv
+import codecs
+import logging
 from .base import BaseLoader
+from .row_packer import TABULAR_PACK_ROWS, pack_rows
+
+logger = logging.getLogger("ingest")
+
+# 인코딩/구분자 판별에 사용하는 파일 앞부분 크기
+CSV_SNIFF_BYTES = int(os.getenv("CSV_SNIFF_BYTES", str(64 * 1024)))
+
+# cp949 는 euc-kr 의 상위 집합 → euc-kr 파일도 cp949 로 디코딩
+_CANDIDATE_ENCODINGS = ("utf-8", "cp949")
+_SNIFF_DELIMITERS = ",;\t|"
+
+
+def _detect_encoding(sample: bytes) -> str | None:
+    """
+    None = sample 이 모두 ASCII → 미결정 (본문에서 첫 비 ASCII 줄로 판별)
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if sample.isascii():
+        return None
+
+    for encoding in _CANDIDATE_ENCODINGS:
+        # incremental decoder (final=False): sample 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+
+    return "utf-8"   # 판별 실패 → errors="replace" 로 디코딩
+
+
+def _detect_dialect(sample: bytes, encoding: str | None):
+    text = codecs.getincrementaldecoder(encoding or "ascii")(errors="replace").decode(sample)
+
+    # 마지막 (잘렸을 수 있는) 행 제외
+    cut = text.rfind("\n")
+    if cut > 0:
+        text = text[:cut]
+
+    try:
+        return csv.Sniffer().sniff(text, delimiters=_SNIFF_DELIMITERS)
+    except csv.Error:
+        pass
+
+    # Sniffer 는 따옴표 안 구분자 때문에 행별 빈도가 달라지면 실패
+    # → 후보 구분자로 실제 파싱해 열 개수가 가장 일정한 것 선택
+    best, best_score = None, (0.0, 0)
+    for delimiter in _SNIFF_DELIMITERS:
+        counts = [len(r) for r in csv.reader(io.StringIO(text), delimiter=delimiter) if r]
+        if not counts:
+            continue
+        width = max(set(counts), key=counts.count)
+        score = (counts.count(width) / len(counts), width)
+        if width > 1 and score > best_score:
+            best, best_score = delimiter, score
+
+    if best is None:
+        return csv.excel
+
+    class _Guessed(csv.excel):
+        delimiter = best
+
+    return _Guessed
+
+
+def sniff_csv(f) -> tuple[str | None, type[csv.Dialect] | csv.Dialect]:
+    """
+    binary file 앞부분(CSV_SNIFF_BYTES)만 읽어 (encoding, dialect) 판별 후 처음 위치로 복귀
+    (encoding None = 앞부분이 모두 ASCII → _iter_undecided_lines 로 디코딩)
+    """
+    sample = f.read(CSV_SNIFF_BYTES)
+    f.seek(0)
+
+    encoding = _detect_encoding(sample)
+    return encoding, _detect_dialect(sample, encoding)
+
+
+def _iter_undecided_lines(raw, file_name: str):
+    """
+    인코딩 미결정 파일 → 줄 단위 디코딩, 첫 비 ASCII 줄에서 인코딩 결정
+    (utf-8 strict 성공 = utf-8, UnicodeDecodeError = cp949, 이후 줄은 결정된 인코딩)
+
+    - 0x0A 는 utf-8 / cp949 멀티바이트 문자 안에 나오지 않음 → 줄 경계에서 잘라도 안전
+    - 줄바꿈 문자는 유지 (csv 모듈의 newline="" 규칙)
+    """
+    encoding = None
+
+    for line in raw:
+        if encoding is not None:
+            yield line.decode(encoding, errors="replace")
+            continue
+
+        if line.isascii():
+            yield line.decode("ascii")
+            continue
+
+        try:
+            text = line.decode("utf-8")
+            encoding = "utf-8"
+        except UnicodeDecodeError:
+            encoding = "cp949"
+            text = line.decode(encoding, errors="replace")
+
+        logger.info(f"[CSV] {file_name} | encoding={encoding} (first non-ASCII line)")
+        yield text
+
 
 class CSVLoader(BaseLoader):
     file_type = "csv"
 
-    def load(self, file_path: str):
+    def __init__(self, pack: bool = TABULAR_PACK_ROWS):
+        self.pack = pack
+
+    def load(self, file_path: str, max_chars: int | None = None):
+        """
+        max_chars: pack=True 일 때 행 묶음 크기 (None = pack_chars_for() 기본값)
+        """
         unit_no = 1
 
-        # 인코딩 자동 대응
-        for encoding in ("utf-8", "cp949"):
-            try:
-                f = open(file_path, newline="", encoding=encoding)
-                break
-            except UnicodeDecodeError:
-                continue
-        else:
-            f = open(file_path, newline="", encoding="utf-8", errors="ignore")
-
-        with f:
-            reader = csv.DictReader(f)
+        with open(file_path, "rb") as raw:
+            # 인코딩/구분자 자동 대응 (sample 만 선판독, 본문은 1회 스트리밍 디코딩)
+            encoding, dialect = sniff_csv(raw)
+            file_name = os.path.basename(file_path)
+            logger.info(
+                f"[CSV] {file_name} | encoding={encoding or 'undecided (ASCII sample)'} "
+                f"delimiter={dialect.delimiter!r}"
+            )
+
+            if encoding is None:
+                f = _iter_undecided_lines(raw, file_name)
+            else:
+                f = io.TextIOWrapper(raw, encoding=encoding, errors="replace", newline="")
+            reader = csv.DictReader(f, dialect=dialect)
             headers = reader.fieldnames or []
 
+            if self.pack:
+                # 행 번호: 헤더 = 1행 기준
+                rows = (
+                    (row_no, [row.get(h) for h in headers])
+                    for row_no, row in enumerate(reader, start=2)
+                )
+                for text, meta in pack_rows(headers, rows, max_chars=max_chars):
+                    yield unit_no, text, meta
+                    unit_no += 1
+                return
+
             for row in reader:
                 values = [
                     f"{h}: {row[h]}"
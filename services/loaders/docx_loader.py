@@ -1,15 +1,255 @@
-from docx import Document
+import os
+import re
+import zipfile
+import xml.etree.ElementTree as ET
 from .base import BaseLoader
 
+# section 단위 unit 최대 글자 수 (초과 시 다음 unit 으로)
+DOCX_UNIT_CHARS = int(os.getenv("DOCX_UNIT_CHARS", "3000"))
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+_P = _W + "p"
+_T = _W + "t"
+_TBL = _W + "tbl"
+_TR = _W + "tr"
+_TC = _W + "tc"
+_BODY = _W + "body"
+_PSTYLE = _W + "pStyle"
+_OUTLINE = _W + "outlineLvl"
+_SECTPR = _W + "sectPr"
+_PPR = _W + "pPr"
+_VAL = _W + "val"
+_BREAKS = {_W + "tab", _W + "br", _W + "cr"}
+# AlternateContent 의 대체 표현 (mc:Choice 와 같은 텍스트 상자를 VML 로 한 번 더 저장)
+_FALLBACK = _MC + "Fallback"
+
+_HEADER_FOOTER = re.compile(r"word/(header|footer)\d*\.xml$")
+
+
+def _heading_styles(z: zipfile.ZipFile) -> set[str]:
+    """
+    styles.xml 에서 제목 스타일 id 수집
+    (styleId 는 언어별로 다름 → 내장 스타일 이름 "heading N" / "title" 기준)
+    """
+    try:
+        root = ET.fromstring(z.read("word/styles.xml"))
+    except KeyError:
+        return set()
+
+    ids = set()
+    for style in root.iter(_W + "style"):
+        name = style.find(_W + "name")
+        name = (name.get(_VAL) if name is not None else "").lower()
+        if name.startswith("heading") or name == "title" or style.find(f"{_PPR}/{_OUTLINE}") is not None:
+            ids.add(style.get(_W + "styleId"))
+    return ids
+
+
+def _iter_content(el):
+    """
+    el.iter() 와 같은 문서 순서, mc:Fallback 하위는 제외
+    """
+    yield el
+    for child in el:
+        if child.tag != _FALLBACK:
+            yield from _iter_content(child)
+
+
+def _part_paragraphs(data: bytes) -> list[str]:
+    """
+    최상위 문단 텍스트 (텍스트 상자 안 문단은 감싸는 문단 텍스트에 포함)
+    """
+    lines = []
+
+    def walk(el):
+        for child in el:
+            if child.tag == _FALLBACK:
+                continue
+            if child.tag != _P:
+                walk(child)
+                continue
+
+            # 중첩 문단 시작 = 공백 구분
+            text = "".join(
+                (sub.text or "") if sub.tag == _T else " "
+                for sub in _iter_content(child)
+                if sub.tag == _T or sub.tag in _BREAKS or (sub.tag == _P and sub is not child)
+            ).strip()
+            if text:
+                lines.append(text)
+
+    walk(ET.fromstring(data))
+    return lines
+
+
+def _join_lines(parts: list[str]) -> str:
+    # 중첩 문단/표 줄은 "\n" 으로 구분해 들어옴 → 빈 줄 제거
+    return "\n".join(line.strip() for line in "".join(parts).split("\n") if line.strip())
+
+
 class DOCXLoader(BaseLoader):
     file_type = "docx"
 
     def load(self, file_path: str):
-        doc = Document(file_path)
+        """
+        word/document.xml 을 iterparse 로 스트리밍 (python-docx 객체 모델 미생성)
+
+        - 문단 + 표(행 단위 "셀 | 셀") + 머리글/바닥글
+        - 제목 문단 / 구역 나누기 / DOCX_UNIT_CHARS 기준으로 section 단위 unit 병합
+        - 처리 끝난 요소는 즉시 clear → 메모리는 문서 크기와 무관
+        """
         unit_no = 1
 
-        for para in doc.paragraphs:
-            text = para.text.strip()
-            if text:
+        with zipfile.ZipFile(file_path) as z:
+            headings = _heading_styles(z)
+
+            for text in self._iter_sections(z, headings):
                 yield unit_no, text
                 unit_no += 1
+
+            # 머리글/바닥글: 페이지마다 반복되므로 문서당 1 unit (중복 제거)
+            extra = []
+            for name in sorted(z.namelist()):
+                if _HEADER_FOOTER.match(name):
+                    extra.extend(_part_paragraphs(z.read(name)))
+            extra = list(dict.fromkeys(extra))
+            if extra:
+                yield unit_no, "[Header/Footer] " + "\n".join(extra)
+
+    def _iter_sections(self, z: zipfile.ZipFile, headings: set[str]):
+        buf: list[str] = []
+        size = 0
+
+        def add(line: str):
+            nonlocal size
+            buf.append(line)
+            size += len(line) + 1
+
+        def flush():
+            nonlocal buf, size
+            text = "\n".join(buf).strip()
+            buf, size = [], 0
+            return text
+
+        body = None
+        p_stack: list[list[str]] = []    # 문단별 텍스트 (텍스트 상자 안 중첩 문단 대응)
+        p_heading: list[bool] = []
+        p_section_end: list[bool] = []
+        p_tbl_depth: list[int] = []      # 문단 시작 시점의 표 깊이
+        cell_bufs: list[list[str]] = []  # 표 깊이별 현재 셀 텍스트
+        row_cells: list[list[str]] = []  # 표 깊이별 현재 행 셀 목록
+        fallback = 0                     # mc:Fallback 깊이 (> 0 이면 무시)
+
+        def in_paragraph(depth: int) -> bool:
+            # 표 깊이 depth 에서 가장 안쪽 컨테이너가 문단인지 (텍스트 상자 → 감싸는 문단)
+            return bool(p_stack) and p_tbl_depth[-1] == depth
+
+        with z.open("word/document.xml") as f:
+            for event, el in ET.iterparse(f, events=("start", "end")):
+                tag = el.tag
+
+                if tag == _FALLBACK:
+                    fallback += 1 if event == "start" else -1
+                    if event == "end":
+                        el.clear()
+                    continue
+                if fallback:
+                    continue
+
+                if event == "start":
+                    if tag == _P:
+                        p_stack.append([])
+                        p_heading.append(False)
+                        p_section_end.append(False)
+                        p_tbl_depth.append(len(cell_bufs))
+                    elif tag == _TBL:
+                        cell_bufs.append([])
+                        row_cells.append([])
+                    elif tag == _BODY:
+                        body = el
+                    continue
+
+                # ---------------- end ----------------
+                if tag == _T:
+                    if p_stack:
+                        p_stack[-1].append(el.text or "")
+                elif tag in _BREAKS:
+                    if p_stack:
+                        p_stack[-1].append(" ")
+                elif tag == _PSTYLE:
+                    if p_heading and el.get(_VAL) in headings:
+                        p_heading[-1] = True
+                elif tag == _OUTLINE:
+                    if p_heading:
+                        p_heading[-1] = True
+                elif tag == _SECTPR:
+                    if p_section_end:
+                        p_section_end[-1] = True
+
+                elif tag == _P:
+                    text = _join_lines(p_stack.pop())
+                    heading = p_heading.pop()
+                    section_end = p_section_end.pop()
+                    p_tbl_depth.pop()
+                    el.clear()
+
+                    if in_paragraph(len(cell_bufs)):
+                        # 텍스트 상자 문단 → 감싸는 문단의 해당 위치
+                        if text:
+                            p_stack[-1].append(f"\n{text}\n")
+                        continue
+
+                    if cell_bufs:
+                        if text:
+                            # 셀 텍스트는 행 1줄 ("셀 | 셀") 안에 들어감
+                            cell_bufs[-1].append(text.replace("\n", " "))
+                        continue
+
+                    if text:
+                        if buf and (heading or size + len(text) > DOCX_UNIT_CHARS):
+                            yield flush()
+                        add(text)
+
+                    if section_end and buf:
+                        yield flush()
+
+                    if body is not None and not p_stack:
+                        body.clear()
+
+                elif tag == _TC:
+                    row_cells[-1].append(" ".join(cell_bufs[-1]))
+                    cell_bufs[-1] = []
+
+                elif tag == _TR:
+                    cells = row_cells[-1]
+                    row_cells[-1] = []
+                    el.clear()
+
+                    if not any(cells):
+                        continue
+                    line = " | ".join(cells)
+
+                    if in_paragraph(len(cell_bufs) - 1):
+                        # 텍스트 상자 안 표 → 감싸는 문단
+                        p_stack[-1].append(f"\n{line}\n")
+                        continue
+
+                    if len(cell_bufs) > 1:
+                        # 중첩 표 → 바깥 셀 텍스트로
+                        cell_bufs[-2].append(line)
+                        continue
+
+                    if buf and size + len(line) > DOCX_UNIT_CHARS:
+                        yield flush()
+                    add(line)
+
+                elif tag == _TBL:
+                    cell_bufs.pop()
+                    row_cells.pop()
+                    if not cell_bufs and not p_stack and body is not None:
+                        body.clear()
+
+        if buf:
+            yield flush()
@@ -1,17 +1,80 @@
+import os
+
 import pandas as pd
+from openpyxl import load_workbook
+
 from .base import BaseLoader
+from .row_packer import TABULAR_PACK_ROWS, pack_rows
+
+
+def _format_row(columns, row):
+    values = []
+
+    for col, val in zip(columns, row):
+        if val is None:
+            continue
+
+        val = str(val).strip()
+        if not val or val.lower() in ("nan", "nat"):
+            continue
+
+        values.append(f"{col}: {val}")
+
+    return values
 
 
 class ExcelLoader(BaseLoader):
     file_type = "excel"
 
-    def load(self, file_path: str):
+    def __init__(self, pack: bool = TABULAR_PACK_ROWS):
+        self.pack = pack
+
+    def load(self, file_path: str, max_chars: int | None = None):
         """
         Excel Loader (Streaming-safe)
         - Sheet 단위
         - Row 단위
         - 값 정규화
+        - .xlsx/.xlsm : openpyxl read_only 스트리밍 (시트 전체를 메모리에 올리지 않음)
+        - .xls        : openpyxl 미지원 → pandas
+        - pack=True   : 연속 행을 chunk 크기까지 묶어 1 unit (meta: row_start/row_end)
+                        max_chars = 묶음 크기 (None = pack_chars_for() 기본값)
         """
+        ext = os.path.splitext(file_path)[1].lower()
+
+        if ext == ".xls":
+            yield from self._load_pandas(file_path, max_chars)
+        else:
+            yield from self._load_streaming(file_path, max_chars)
+
+    def _load_streaming(self, file_path: str, max_chars: int | None):
+        # read_only: 행을 XML 에서 순차 파싱 → 메모리는 현재 행 수준으로 유지
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        unit_no = 1
+
+        try:
+            for ws in wb.worksheets:
+                rows = ws.iter_rows(values_only=True)
+
+                header = next(rows, None)
+                if header is None:
+                    continue
+
+                # pandas 와 동일한 헤더 규칙 (빈 헤더 → "Unnamed: i")
+                columns = [
+                    str(c).strip() if c is not None and str(c).strip() else f"Unnamed: {i}"
+                    for i, c in enumerate(header)
+                ]
+
+                # 행 번호: 시트 기준 (헤더 = 1행)
+                for unit in self._emit(ws.title, columns, enumerate(rows, start=2), unit_no, max_chars):
+                    yield unit
+                    unit_no += 1
+        finally:
+            # read_only 모드는 zip 핸들을 유지하므로 명시적으로 닫음
+            wb.close()
+
+    def _load_pandas(self, file_path: str, max_chars: int | None):
         xls = pd.ExcelFile(file_path)
         unit_no = 1
 
@@ -28,23 +91,27 @@ class ExcelLoader(BaseLoader):
             columns = [str(c).strip() for c in df.columns]
 
             # 🔹 itertuples(): iterrows()보다 훨씬 빠름
-            for row in df.itertuples(index=False):
-                values = []
-
-                for col, val in zip(columns, row):
-                    if val is None:
-                        continue
-
-                    val = str(val).strip()
-                    if not val or val.lower() in ("nan", "nat"):
-                        continue
+            rows = enumerate(df.itertuples(index=False), start=2)
+            for unit in self._emit(sheet_name, columns, rows, unit_no, max_chars):
+                yield unit
+                unit_no += 1
 
-                    values.append(f"{col}: {val}")
+    def _emit(self, sheet_name, columns, rows, unit_no, max_chars=None):
+        """
+        (row_no, row) → (unit_no, text) 또는 packed (unit_no, text, meta)
+        """
+        prefix = f"[Sheet:{sheet_name}] "
 
-                if not values:
-                    continue
+        if self.pack:
+            for text, meta in pack_rows(columns, rows, prefix=prefix, max_chars=max_chars):
+                yield unit_no, text, meta
+                unit_no += 1
+            return
 
-                text = f"[Sheet:{sheet_name}] " + " | ".join(values)
+        for _, row in rows:
+            values = _format_row(columns, row)
+            if not values:
+                continue
 
-                yield unit_no, text
-                unit_no += 1
+            yield unit_no, prefix + " | ".join(values)
+            unit_no += 1
@@ -1,17 +1,15 @@
-import pytesseract
-from PIL import Image
+from services.ocr_executor import get_ocr_executor
 from .base import BaseLoader
 
 class ImageOCRLoader(BaseLoader):
     file_type = "image"
 
     def load(self, file_path: str):
-        image = Image.open(file_path)
+        with open(file_path, "rb") as f:
+            data = f.read()
 
-        text = pytesseract.image_to_string(
-            image,
-            lang="kor+eng"
-        )
+        # 전처리 + OCR 은 OCR worker 프로세스에서 (같은 이미지는 캐시)
+        text = get_ocr_executor().ocr(data)
 
         unit_no = 1
         for line in text.splitlines():
@@ -1,17 +1,233 @@
+import os
+import logging
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
 import fitz
+
+from services.ocr_executor import OCR_TARGET_DPI, OCR_WORKERS, get_ocr_executor
+from services.page_cleaner import strip_repeated_lines
+from services.utils.file_hash import file_sha1_cached
 from .base import BaseLoader
 
+logger = logging.getLogger("ingest")
+
+# 이 페이지 수 이상인 PDF 만 process pool 로 분할 추출 (0 = 비활성)
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "200"))
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", str(min(4, os.cpu_count() or 1))))
+# worker 1개가 한 번에 처리하는 페이지 구간 크기 (0 이하 → 1)
+PDF_PAGE_RANGE = max(1, int(os.getenv("PDF_PAGE_RANGE", "50")))
+
+# 텍스트 레이어 없는(스캔) 페이지 OCR 대체
+PDF_OCR_FALLBACK = os.getenv("PDF_OCR_FALLBACK", "true").lower() == "true"
+# 추출 텍스트가 이 글자 수 미만이면 OCR 대상
+PDF_OCR_MIN_CHARS = int(os.getenv("PDF_OCR_MIN_CHARS", "20"))
+PDF_OCR_DPI = int(os.getenv("PDF_OCR_DPI", str(OCR_TARGET_DPI)))
+# 문서당 OCR 페이지 수 상한 (초과 페이지는 건너뜀)
+PDF_OCR_MAX_PAGES = int(os.getenv("PDF_OCR_MAX_PAGES", "200"))
+# 동시에 진행 중인 페이지 OCR 수 (페이지 순서 유지용 look-ahead)
+PDF_OCR_WINDOW = int(os.getenv("PDF_OCR_WINDOW", str(max(1, OCR_WORKERS) * 2)))
+
+# 페이지마다 반복되는 머리글/바닥글/쪽번호 줄 제거
+PDF_STRIP_HEADERS = os.getenv("PDF_STRIP_HEADERS", "true").lower() == "true"
+
+
+def _page_text(page) -> str:
+    return (
+        page.get_text("text")
+        .replace("\xa0", " ")
+        .strip()
+    )
+
+
+def ocr_fallback_pages(doc, until: int | None = None) -> set[int]:
+    """
+    _ocr_fallback 이 렌더링 + OCR 하는 페이지 번호 (텍스트 레이어 없음, PDF_OCR_MAX_PAGES 이내)
+    → 같은 페이지의 이미지는 image OCR 대상에서 제외 (스캔 페이지 이중 색인 방지)
+
+    until: 이 페이지 번호까지만 확인 (None = 전체)
+    """
+    if not PDF_OCR_FALLBACK:
+        return set()
+
+    pages = set()
+    for i in range(min(len(doc), until or len(doc))):
+        if len(_page_text(doc[i])) < PDF_OCR_MIN_CHARS:
+            pages.add(i + 1)
+            if len(pages) >= PDF_OCR_MAX_PAGES:
+                break
+    return pages
+
+
+def _extract_range(file_path: str, start: int, end: int) -> list[tuple[int, str]]:
+    """
+    (worker 프로세스) [start, end) 페이지 텍스트 추출
+    - fitz Document 는 프로세스 간 공유 불가 → worker 가 직접 open
+    """
+    with fitz.open(file_path) as doc:
+        return [
+            (i + 1, _page_text(doc[i]))
+            for i in range(start, end)
+        ]
+
+
+# =================================================
+# process pool (lazy singleton)
+# =================================================
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # ingest worker / watchdog 스레드가 떠 있는 프로세스 → fork 대신 spawn
+                _pool = ProcessPoolExecutor(
+                    max_workers=max(1, PDF_WORKERS),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _pool
+
+
+def shutdown_pdf_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
 class PDFLoader(BaseLoader):
     file_type = "pdf"
 
     def load(self, file_path: str):
-        doc = fitz.open(file_path)
-
-        for page_no, page in enumerate(doc, start=1):
-            text = (
-                page.get_text("text")
-                .replace("\xa0", " ")
-                .strip()
-            )
+        pages = self._iter_pages(file_path)
+
+        if PDF_OCR_FALLBACK:
+            pages = self._ocr_fallback(file_path, pages)
+
+        if PDF_STRIP_HEADERS:
+            pages = strip_repeated_lines(pages)
+
+        for page_no, text in pages:
             if text:
                 yield page_no, text
+
+    def _iter_pages(self, file_path: str):
+        """
+        (page_no, text) 전체 페이지 (빈 페이지 포함, 페이지 순서)
+        """
+        with fitz.open(file_path) as doc:
+            page_count = doc.page_count
+
+            if (
+                PDF_PARALLEL_MIN_PAGES <= 0
+                or PDF_WORKERS <= 1
+                or page_count < PDF_PARALLEL_MIN_PAGES
+            ):
+                for page_no, page in enumerate(doc, start=1):
+                    yield page_no, _page_text(page)
+                return
+
+        yield from self._load_parallel(file_path, page_count)
+
+    def _load_parallel(self, file_path: str, page_count: int):
+        """
+        페이지 구간을 process pool 에 분배하고 페이지 순서대로 yield
+
+        - 제출은 PDF_WORKERS * 2 구간까지만 앞서 나감 (결과 메모리 상한)
+        - 앞 구간 결과를 기다리는 동안 뒤 구간은 계속 추출됨
+        """
+        pool = _get_pool()
+        ranges = deque(
+            (start, min(start + PDF_PAGE_RANGE, page_count))
+            for start in range(0, page_count, PDF_PAGE_RANGE)
+        )
+        window = max(1, PDF_WORKERS) * 2
+        pending = deque()
+
+        logger.info(
+            f"[PDF] parallel extract | pages={page_count} "
+            f"ranges={len(ranges)} workers={PDF_WORKERS}"
+        )
+
+        try:
+            while ranges or pending:
+                while ranges and len(pending) < window:
+                    start, end = ranges.popleft()
+                    pending.append(pool.submit(_extract_range, file_path, start, end))
+
+                yield from pending.popleft().result()
+        finally:
+            # 소비 중단(예외/취소) 시 남은 구간 취소
+            for future in pending:
+                future.cancel()
+
+    def _ocr_fallback(self, file_path: str, pages):
+        """
+        텍스트 레이어가 없거나 거의 빈 페이지 → 렌더링 + OCR (OCR worker 에서 병렬)
+
+        - 문서당 OCR 페이지 수 상한 PDF_OCR_MAX_PAGES (대용량 스캔본의 worker 독점 방지)
+        - 대기 페이지(OCR 진행 중 + 그 뒤 페이지)는 PDF_OCR_WINDOW 개까지
+          → 넘으면 맨 앞 OCR 완료까지 대기 (페이지 순서 유지, 메모리 상한)
+        - 캐시 key = 파일 해시 + 페이지 번호
+        """
+        window = max(1, PDF_OCR_WINDOW)
+        file_hash = None   # 첫 OCR 대상 페이지에서 계산 (텍스트 PDF 는 비용 없음)
+
+        # (page_no, text, future | None)
+        pending = deque()
+        requested = skipped = 0
+
+        def pop():
+            # 맨 앞 OCR 이 끝나지 않았으면 result() 에서 대기
+            page_no, text, future = pending.popleft()
+            if future is None:
+                return page_no, text
+
+            try:
+                ocr_text = future.result().replace("\xa0", " ").strip()
+            except Exception as e:
+                logger.warning(f"[PDF OCR] page={page_no} failed | {e}")
+                return page_no, text
+            return page_no, ocr_text if len(ocr_text) > len(text) else text
+
+        try:
+            for page_no, text in pages:
+                future = None
+                if len(text) < PDF_OCR_MIN_CHARS:
+                    if requested < PDF_OCR_MAX_PAGES:
+                        file_hash = file_hash or file_sha1_cached(file_path)
+                        future = get_ocr_executor().submit_pdf_page(
+                            file_path, page_no, file_hash=file_hash, dpi=PDF_OCR_DPI
+                        )
+                        requested += 1
+                    else:
+                        skipped += 1
+
+                pending.append((page_no, text, future))
+
+                # 앞쪽 완료분 방출, window 가 차면 맨 앞 OCR 완료까지 대기
+                while pending and (
+                    pending[0][2] is None
+                    or pending[0][2].done()
+                    or len(pending) >= window
+                ):
+                    yield pop()
+
+            while pending:
+                yield pop()
+        finally:
+            for _, _, future in pending:
+                if future is not None:
+                    future.cancel()
+
+            if requested or skipped:
+                logger.info(
+                    f"[PDF OCR] {os.path.basename(file_path)} | ocr_pages={requested} "
+                    f"skipped_over_budget={skipped}"
+                )
@@ -0,0 +1,77 @@
+import os
+import re
+from typing import Iterable, Iterator, Sequence, Tuple
+
+# CSV / Excel 연속 행을 chunk 크기까지 묶어 1 unit 으로 yield (false = 행당 1 unit)
+TABULAR_PACK_ROWS = os.getenv("TABULAR_PACK_ROWS", "false").lower() == "true"
+# 0 = 문서 임베딩 모델의 chunk_size (ingest 가 loader 에 전달)
+TABULAR_PACK_CHARS = int(os.getenv("TABULAR_PACK_CHARS", "0"))
+
+
+# packed unit 의 행 줄 ("row 12: v | v") → chunker 가 행 경계 / row_start, row_end 인식에 사용
+ROW_LINE = re.compile(r"^row (\d+): ", re.M)
+
+
+def pack_chars_for(chunk_size: int | None = None) -> int:
+    """
+    행 묶음 크기: TABULAR_PACK_CHARS 지정 시 그 값, 아니면 chunk_size (None = CHUNK_SIZE)
+    """
+    if TABULAR_PACK_CHARS > 0:
+        return TABULAR_PACK_CHARS
+    if chunk_size is None:
+        # chunking 이 ROW_LINE 을 import → 모듈 로드 시점 순환 import 방지
+        from services.chunking import CHUNK_SIZE
+        chunk_size = CHUNK_SIZE
+    return chunk_size
+
+
+def _clean(val) -> str:
+    if val is None:
+        return ""
+    val = str(val).strip()
+    if val.lower() in ("nan", "nat"):
+        return ""
+    return val
+
+
+def pack_rows(
+    columns: Sequence[str],
+    rows: Iterable[Tuple[int, Sequence]],
+    *,
+    prefix: str = "",
+    max_chars: int | None = None,
+) -> Iterator[Tuple[str, dict]]:
+    """
+    (row_no, values) → (packed_text, {"row_start", "row_end"})
+
+    - 헤더는 unit 마다 1번만 포함 (첫 줄), 각 행은 값만 (열 위치 유지)
+    - max_chars 를 넘기 직전에 끊음 (행 1개가 더 긴 경우 단독 unit → chunker 가 분할)
+    - 값이 모두 빈 행은 건너뜀
+    """
+    max_chars = max_chars or pack_chars_for()
+    header = f"{prefix}columns: " + " | ".join(columns)
+
+    lines: list[str] = []
+    size = len(header)
+    row_start = row_end = 0
+
+    for row_no, values in rows:
+        cells = [_clean(v) for v in values]
+        if not any(cells):
+            continue
+
+        line = f"row {row_no}: " + " | ".join(cells)
+
+        if lines and size + 1 + len(line) > max_chars:
+            yield "\n".join([header, *lines]), {"row_start": row_start, "row_end": row_end}
+            lines = []
+            size = len(header)
+
+        if not lines:
+            row_start = row_no
+        lines.append(line)
+        size += 1 + len(line)
+        row_end = row_no
+
+    if lines:
+        yield "\n".join([header, *lines]), {"row_start": row_start, "row_end": row_end}
@@ -0,0 +1,290 @@
+# services/ocr_executor.py
+"""
+OCR 실행기 (process pool + 전처리 + 결과 캐시)
+
+- tesseract 호출은 OCR_WORKERS 개 worker 프로세스에서만 실행 (동시 OCR 수 상한)
+- OCR 전 전처리: grayscale → 목표 DPI 로 축소 → (선택) Otsu 이진화
+- 결과는 이미지 content hash 기준 디스크 캐시 (같은 스캔 문서 재유입 / 재인덱싱 시 OCR 생략)
+"""
+
+import io
+import os
+import hashlib
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from services.utils.kv_cache import CACHE_DIR, SqliteKVCache
+
+logger = logging.getLogger("ocr")
+
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", str(min(2, os.cpu_count() or 1))))
+OCR_LANG = os.getenv("OCR_LANG", "kor+eng")
+OCR_TARGET_DPI = int(os.getenv("OCR_TARGET_DPI", "300"))
+# DPI 정보가 없는 이미지(사진/캡처)의 긴 변 상한 (px)
+OCR_MAX_SIDE = int(os.getenv("OCR_MAX_SIDE", "3500"))
+OCR_BINARIZE = os.getenv("OCR_BINARIZE", "true").lower() == "true"
+OCR_CACHE_PATH = os.getenv("OCR_CACHE_PATH", os.path.join(CACHE_DIR, "ocr_cache.sqlite3"))
+
+# 전처리/OCR 방식이 바뀌면 올려서 기존 캐시 무효화
+_PREPROCESS_VERSION = 2
+
+
+# =================================================
+# worker 프로세스
+# =================================================
+def _init_worker():
+    # tesseract 내부 OpenMP 스레드 억제 (병렬성은 프로세스 수로만 제어)
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
+def _otsu_threshold(histogram: list[int]) -> int:
+    total = sum(histogram)
+    sum_all = sum(i * h for i, h in enumerate(histogram))
+
+    sum_bg = weight_bg = 0
+    best_t, best_var = 127, 0.0
+
+    for t, h in enumerate(histogram):
+        weight_bg += h
+        if weight_bg == 0:
+            continue
+        weight_fg = total - weight_bg
+        if weight_fg == 0:
+            break
+
+        sum_bg += t * h
+        mean_bg = sum_bg / weight_bg
+        mean_fg = (sum_all - sum_bg) / weight_fg
+        var = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        if var > best_var:
+            best_t, best_var = t, var
+
+    return best_t
+
+
+def preprocess_image(image, *, target_dpi: int = OCR_TARGET_DPI, binarize: bool = OCR_BINARIZE):
+    """
+    PIL Image → (OCR 입력용 Image, 축소 후 실제 DPI | None)
+
+    - 메타데이터 DPI 가 target_dpi 보다 높으면 target_dpi 로, 아니면 긴 변 OCR_MAX_SIDE 이하로 축소
+    - DPI 는 원본 DPI x 축소 비율 (원본 DPI 를 모르면 None)
+    """
+    from PIL import Image
+
+    image = image.convert("L")
+
+    src_dpi = image.info.get("dpi", (0, 0))[0] or 0
+    if src_dpi > target_dpi:
+        scale = target_dpi / src_dpi
+    else:
+        scale = min(1.0, OCR_MAX_SIDE / max(image.size))
+
+    if scale < 1.0:
+        image = image.resize(
+            (max(1, int(image.width * scale)), max(1, int(image.height * scale))),
+            Image.LANCZOS,
+        )
+
+    if binarize:
+        threshold = _otsu_threshold(image.histogram())
+        image = image.point(lambda p: 255 if p > threshold else 0, mode="1")
+
+    dpi = int(round(src_dpi * min(scale, 1.0))) if src_dpi > 0 else None
+    return image, dpi
+
+
+def _tesseract_config(dpi: int | None) -> str:
+    """
+    DPI 를 아는 경우에만 --dpi 전달 (모르는 값을 주면 tesseract 분할 결과가 달라짐)
+    """
+    return f"--dpi {dpi}" if dpi else ""
+
+
+def _ocr_bytes(data: bytes, lang: str, target_dpi: int, binarize: bool) -> str:
+    import pytesseract
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as image:
+        # dpi = 축소 후 해상도 (메타데이터 DPI 가 없으면 None → --dpi 생략)
+        prepared, dpi = preprocess_image(image, target_dpi=target_dpi, binarize=binarize)
+
+    return pytesseract.image_to_string(
+        prepared,
+        lang=lang,
+        config=_tesseract_config(dpi),
+    )
+
+
+def _ocr_pdf_page(file_path: str, page_no: int, dpi: int, lang: str, binarize: bool) -> str:
+    import fitz
+    import pytesseract
+    from PIL import Image
+
+    with fitz.open(file_path) as doc:
+        pix = doc[page_no - 1].get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+        image = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+
+    # 렌더링 DPI = 목표 DPI (대형 판형은 OCR_MAX_SIDE 로 축소될 수 있음 → 축소 후 DPI 사용)
+    image.info["dpi"] = (dpi, dpi)
+    prepared, dpi = preprocess_image(image, target_dpi=dpi, binarize=binarize)
+
+    return pytesseract.image_to_string(
+        prepared,
+        lang=lang,
+        config=_tesseract_config(dpi),
+    )
+
+
+# =================================================
+# executor
+# =================================================
+class OCRExecutor:
+    """
+    사용법:
+        ocr = get_ocr_executor()
+        text = ocr.ocr(image_bytes)            # blocking
+        future = ocr.submit(image_bytes)       # Future[str]
+    """
+
+    def __init__(
+        self,
+        max_workers: int = OCR_WORKERS,
+        *,
+        lang: str = OCR_LANG,
+        target_dpi: int = OCR_TARGET_DPI,
+        binarize: bool = OCR_BINARIZE,
+        cache: SqliteKVCache | None = None,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.lang = lang
+        self.target_dpi = target_dpi
+        self.binarize = binarize
+        self.cache = cache
+
+        self.submitted = 0
+        self.cached = 0
+        self.failed = 0
+
+        self._lock = threading.Lock()
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+
+    def cache_key(self, data: bytes) -> str:
+        digest = hashlib.sha1(data).hexdigest()
+        return (
+            f"{digest}:{self.lang}:{self.target_dpi}:"
+            f"{int(self.binarize)}:v{_PREPROCESS_VERSION}"
+        )
+
+    def submit(self, data: bytes, *, key: str | None = None) -> Future:
+        """
+        key: 캐시 key (기본 = 이미지 content hash 기반)
+        """
+        return self._submit(
+            key or self.cache_key(data),
+            _ocr_bytes, data, self.lang, self.target_dpi, self.binarize,
+        )
+
+    def submit_pdf_page(
+        self,
+        file_path: str,
+        page_no: int,
+        *,
+        file_hash: str,
+        dpi: int | None = None,
+    ) -> Future:
+        """
+        PDF 페이지 렌더링(fitz pixmap) + OCR 을 worker 에서 실행
+        캐시 key = 파일 해시 + 페이지 번호 (+ OCR 설정)
+        """
+        dpi = dpi or self.target_dpi
+        key = (
+            f"pdf:{file_hash}:{page_no}:{self.lang}:{dpi}:"
+            f"{int(self.binarize)}:v{_PREPROCESS_VERSION}"
+        )
+        return self._submit(
+            key,
+            _ocr_pdf_page, file_path, page_no, dpi, self.lang, self.binarize,
+        )
+
+    def ocr(self, data: bytes) -> str:
+        return self.submit(data).result()
+
+    def shutdown(self, wait: bool = False):
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "submitted": self.submitted,
+                "cached": self.cached,
+                "failed": self.failed,
+                "cache": self.cache.stats() if self.cache is not None else None,
+            }
+
+    def _submit(self, key: str, fn, *args) -> Future:
+        if self.cache is not None:
+            text = self.cache.get(key)
+            if text is not None:
+                with self._lock:
+                    self.cached += 1
+                future: Future = Future()
+                future.set_result(text)
+                return future
+
+        with self._lock:
+            self.submitted += 1
+
+        future = self._pool.submit(fn, *args)
+        future.add_done_callback(lambda f: self._on_done(key, f))
+        return future
+
+    def _on_done(self, key: str, future: Future):
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            with self._lock:
+                self.failed += 1
+            return
+        if self.cache is not None:
+            self.cache.put(key, future.result())
+
+
+# =================================================
+# singleton
+# =================================================
+_executor: OCRExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_ocr_executor() -> OCRExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = OCRExecutor(cache=SqliteKVCache(OCR_CACHE_PATH))
+                logger.info(
+                    f"[OCR] executor started | workers={_executor.max_workers} "
+                    f"cache={OCR_CACHE_PATH}"
+                )
+    return _executor
+
+
+def shutdown_ocr_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+def ocr_stats() -> dict:
+    if _executor is None:
+        return {"started": False}
+    return {"started": True, **_executor.stats()}
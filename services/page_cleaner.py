@@ -0,0 +1,106 @@
+# services/page_cleaner.py
+"""
+페이지 반복 머리글/바닥글/쪽번호 제거 (chunking 전)
+
+- 각 페이지의 위/아래 가장자리 줄만 후보 (본문 중간 줄은 건드리지 않음)
+- 쪽번호 줄만 숫자를 "#" 로 치환해 비교 ("12", "- 12 -", "Page 3 of 40", "3 / 40")
+  (그 외 숫자가 든 줄은 원문 그대로 비교 → 합계/표 행 등 본문 보존)
+- 앞뒤 window 페이지 안에서 일정 비율 이상 페이지에 나타난 줄을 반복 줄로 판단
+- window 페이지만 앞서 읽음 → 스트리밍 유지 (메모리 O(window))
+"""
+
+import os
+import re
+from collections import Counter, deque
+from typing import Iterable, Iterator, Tuple
+
+# 판단에 사용하는 앞(look-ahead) / 뒤 페이지 수
+PAGE_HF_WINDOW = int(os.getenv("PAGE_HF_WINDOW", "8"))
+# 주변 페이지 중 이 비율 이상에 나타나면 반복 줄 (홀/짝 페이지 머리글 대비 0.5 미만)
+PAGE_HF_MIN_RATIO = float(os.getenv("PAGE_HF_MIN_RATIO", "0.4"))
+# 페이지 위/아래에서 후보로 볼 줄 수
+PAGE_HF_EDGE_LINES = int(os.getenv("PAGE_HF_EDGE_LINES", "3"))
+
+# 최소 이 페이지 수 이상에 나타나야 반복 줄 (짧은 문서 오탐 방지)
+_MIN_PAGES = 3
+
+_DIGITS = re.compile(r"\d+")
+# 쪽번호 줄: "12", "- 12 -", "Page 3", "Page 3 of 40", "p. 3", "3 / 40", "3 쪽", "3 페이지"
+_PAGE_NO = re.compile(
+    r"[-–—\s]*(?:page|pg\.?|p\.)?\s*\d+(?:\s*(?:/|of)\s*\d+)?\s*(?:쪽|페이지)?[-–—\s]*",
+    re.IGNORECASE,
+)
+
+
+def _line_key(line: str) -> str:
+    line = " ".join(line.split())
+    if _PAGE_NO.fullmatch(line):
+        return _DIGITS.sub("#", line)
+    return line
+
+
+def _edge_keys(lines: list[str], edge: int) -> set[str]:
+    """
+    위/아래 edge 줄의 비교 key (빈 줄 제외)
+    """
+    idx = [i for i, line in enumerate(lines) if line.strip()]
+    edge_idx = idx[:edge] + idx[-edge:]
+    return {_line_key(lines[i]) for i in edge_idx}
+
+
+def strip_repeated_lines(
+    pages: Iterable[Tuple[int, str]],
+    *,
+    window: int = PAGE_HF_WINDOW,
+    min_ratio: float = PAGE_HF_MIN_RATIO,
+    edge: int = PAGE_HF_EDGE_LINES,
+) -> Iterator[Tuple[int, str]]:
+    """
+    (page_no, text) 스트림 → 반복 머리글/바닥글 줄을 뺀 (page_no, text) 스트림
+
+    - 페이지 순서/개수 유지 (모두 지워진 페이지는 "")
+    - 페이지마다 앞뒤 최대 window 페이지씩을 포함해 판단
+    """
+    window = max(1, window)
+    edge = max(1, edge)
+
+    buf: deque = deque()       # 판단 대기 페이지 (page_no, lines, keys)
+    behind: deque = deque()    # 이미 내보낸 직전 페이지 keys (앞쪽 문맥)
+    counts: Counter = Counter()   # behind + buf 페이지 기준 key 등장 페이지 수
+
+    def emit():
+        page_no, lines, keys = buf.popleft()
+
+        total = len(behind) + 1 + len(buf)
+        need = max(_MIN_PAGES, min_ratio * total)
+        repeated = {k for k in keys if counts[k] >= need}
+
+        behind.append(keys)
+        if len(behind) > window:
+            for k in behind.popleft():
+                counts[k] -= 1
+                if counts[k] <= 0:
+                    del counts[k]
+
+        if not repeated:
+            return page_no, "\n".join(lines)
+
+        idx = [i for i, line in enumerate(lines) if line.strip()]
+        edge_idx = set(idx[:edge] + idx[-edge:])
+        kept = [
+            line for i, line in enumerate(lines)
+            if i not in edge_idx or _line_key(line) not in repeated
+        ]
+        return page_no, "\n".join(kept).strip()
+
+    for page_no, text in pages:
+        lines = text.splitlines() if text else []
+        keys = _edge_keys(lines, edge)
+        counts.update(keys)
+        buf.append((page_no, lines, keys))
+
+        if len(buf) > window:
+            yield emit()
+
+    while buf:
+        yield emit()
@@ -1,5 +1,15 @@
+import os
 import hashlib
 
+from services.utils.kv_cache import CACHE_DIR, SqliteKVCache
+
+FILE_HASH_CACHE_PATH = os.getenv(
+    "FILE_HASH_CACHE_PATH", os.path.join(CACHE_DIR, "file_hash.sqlite3")
+)
+
+_hash_cache: SqliteKVCache | None = None
+
+
 def file_sha1(path: str) -> str:
     """
     파일 내용을 기반으로 SHA1 해시 생성
@@ -7,6 +17,63 @@ def file_sha1(path: str) -> str:
     """
     h = hashlib.sha1()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
     return h.hexdigest()
+
+
+def _get_hash_cache() -> SqliteKVCache:
+    global _hash_cache
+    if _hash_cache is None:
+        _hash_cache = SqliteKVCache(FILE_HASH_CACHE_PATH)
+    return _hash_cache
+
+
+def _stat_key(st: os.stat_result) -> str:
+    # 같은 파일시스템 내 move(rename)는 inode/mtime 유지 → incoming → processing 이동 후에도 hit
+    return f"{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def file_sha1_cached(path: str, st: os.stat_result | None = None) -> str:
+    """
+    (device, inode, size, mtime_ns) 키로 캐시된 SHA1
+    - 변경 없는 파일 재스캔 시 파일을 다시 읽지 않음
+    """
+    st = st or os.stat(path)
+    key = _stat_key(st)
+
+    cache = _get_hash_cache()
+    cached = cache.get(key)
+    if cached:
+        return cached
+
+    sha1 = file_sha1(path)
+    cache.put(key, sha1)
+    return sha1
+
+
+def remember_file_sha1(path: str, sha1: str) -> None:
+    """
+    다른 경로(업로드 저장 중 계산 등)에서 구한 해시를 캐시에 등록
+    """
+    _get_hash_cache().put(_stat_key(os.stat(path)), sha1)
+
+
+def save_stream_with_sha1(src, dest_path: str) -> str:
+    """
+    업로드 스트림을 저장하면서 SHA1 동시 계산 + 캐시 등록
+    (watcher 가 같은 파일을 다시 읽지 않도록)
+    """
+    h = hashlib.sha1()
+    with open(dest_path, "wb") as out:
+        for chunk in iter(lambda: src.read(1024 * 1024), b""):
+            h.update(chunk)
+            out.write(chunk)
+
+    sha1 = h.hexdigest()
+    remember_file_sha1(dest_path, sha1)
+    return sha1
+
+
+def file_hash_cache_stats() -> dict:
+    return _get_hash_cache().stats()
@@ -43,16 +43,22 @@ def move_file(
     dest_dir: str,
     retry: int = 5,
     wait_sec: float = 1.0,
-):
+    dest_name: str | None = None,
+) -> str | None:
     """
     Windows 안전 move (WinError 32 대응)
+
+    - dest_name : 대상 파일명 (기본 = 원본 파일명)
+
+    Returns:
+        실제 이동된 경로 (원본이 없으면 None)
     """
     if not os.path.exists(src):
         logger.warning(f"[MOVE SKIP] source not found: {src}")
-        return
+        return None
 
     os.makedirs(dest_dir, exist_ok=True)
-    dest = os.path.join(dest_dir, os.path.basename(src))
+    dest = os.path.join(dest_dir, dest_name or os.path.basename(src))
 
     # 1️⃣ 파일 안정화 대기
     if not wait_for_file_stable(src):
@@ -63,7 +69,7 @@ def move_file(
         try:
             shutil.move(src, dest)
             logger.info(f"[MOVE OK] {src} -> {dest}")
-            return
+            return dest
         except PermissionError as e:
             logger.warning(
                 f"[MOVE RETRY {i+1}/{retry}] {src} | {e}"
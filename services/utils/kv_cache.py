@@ -0,0 +1,93 @@
+# services/utils/kv_cache.py
+
+import os
+import sqlite3
+import logging
+import threading
+
+logger = logging.getLogger("kv_cache")
+
+CACHE_DIR = os.getenv("CACHE_DIR", ".cache")
+
+
+class SqliteKVCache:
+    """
+    프로세스 재시작 후에도 유지되는 단순 key → text 캐시 (thread-safe)
+
+    - max_entries 초과 시 가장 오래 저장된 항목부터 제거
+    - 캐시 오류는 호출자에게 전파하지 않음 (miss 로 처리)
+    """
+
+    def __init__(self, path: str, *, max_entries: int = 200_000):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM kv").fetchone()[0]
+
+    def get(self, key: str) -> str | None:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM kv WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                self.hits += 1
+                return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"[KV CACHE] get failed ({self.path}): {e}")
+            return None
+
+    def put(self, key: str, value: str) -> None:
+        try:
+            with self._lock:
+                cur = self._conn.execute(
+                    "INSERT OR IGNORE INTO kv (key, value) VALUES (?, ?)",
+                    (key, value),
+                )
+                if cur.rowcount:
+                    self._count += 1
+                else:
+                    self._conn.execute(
+                        "UPDATE kv SET value = ? WHERE key = ?", (value, key)
+                    )
+
+                if self._count > self.max_entries:
+                    overflow = self._count - int(self.max_entries * 0.9)
+                    self._conn.execute(
+                        "DELETE FROM kv WHERE rowid IN "
+                        "(SELECT rowid FROM kv ORDER BY rowid LIMIT ?)",
+                        (overflow,),
+                    )
+                    self._count -= overflow
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[KV CACHE] put failed ({self.path}): {e}")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "path": self.path,
+            "entries": self._count,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
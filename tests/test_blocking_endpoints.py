@@ -0,0 +1,124 @@
+"""
+/search, /rag/chat 의 blocking 호출(임베딩 / Qdrant / LLM)이 이벤트 루프를 막지 않는지 확인
+
+- embed_text / LLM 호출을 느린 stub 으로 교체 (time.sleep = blocking)
+- /search, /rag/chat 를 동시에 보내는 동안 /health 가 즉시 응답해야 함
+- 동시 요청들은 직렬 합보다 훨씬 짧은 시간에 끝나야 함
+"""
+
+import os
+
+for key in ("DB_HOST", "DB_NAME", "DB_USER", "DB_PASSWORD"):
+    os.environ.setdefault(key, "test")
+os.environ["MODEL_KEY"] = "nomic"
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from qdrant_client import QdrantClient
+from qdrant_client.models import PointStruct, VectorParams
+
+import app.api.rag as rag_api
+import app.api.search as search_api
+import vector.realtime_vector as realtime_vector
+from app.api.health import router as health_router
+from vector.collection_manager import resolve_collection_name
+from vector.embedding_models import get_embedding_config
+
+SLOW_SEC = 0.5
+SEARCH_REQUESTS = 6
+RAG_REQUESTS = 4
+
+
+@pytest.fixture
+def app(monkeypatch):
+    cfg = get_embedding_config("nomic")
+    client = QdrantClient(":memory:")
+
+    collection = resolve_collection_name("documents", "nomic")
+    client.create_collection(
+        collection,
+        vectors_config=VectorParams(size=cfg.vector_size, distance=cfg.distance),
+    )
+    client.upsert(
+        collection,
+        points=[
+            PointStruct(
+                id=i,
+                vector=[((i * 31 + j) % 97) / 97 for j in range(cfg.vector_size)],
+                payload={
+                    "content": f"doc {i}",
+                    "metadata": {"content_id": i, "doc_id": i, "title": f"doc{i}"},
+                },
+            )
+            for i in range(1, 21)
+        ],
+    )
+
+    def slow_embed(text, model_key):
+        time.sleep(SLOW_SEC)
+        return [0.5] * cfg.vector_size
+
+    def slow_llm(prompt, model):
+        time.sleep(SLOW_SEC)
+        return "answer"
+
+    monkeypatch.setenv("BASE_COLLECTION", "documents")
+    monkeypatch.setattr(realtime_vector, "_qdrant_client", client)
+    monkeypatch.setattr(search_api, "embed_text", slow_embed)
+    monkeypatch.setattr(rag_api, "embed_text", slow_embed)
+    monkeypatch.setitem(rag_api._LLM_CALLS, "stub", slow_llm)
+    monkeypatch.setattr(rag_api.runtime_settings.collection, "collection_name", None)
+
+    application = FastAPI()
+    application.include_router(search_api.router)
+    application.include_router(rag_api.router)
+    application.include_router(health_router)
+    return application
+
+
+def test_event_loop_stays_responsive(app):
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+            async def timed(coro):
+                started = time.perf_counter()
+                res = await coro
+                return res, time.perf_counter() - started
+
+            fired = time.perf_counter()
+            slow = [
+                asyncio.create_task(timed(client.post("/search", json={"query": f"q{i}", "top_k": 3})))
+                for i in range(SEARCH_REQUESTS)
+            ] + [
+                asyncio.create_task(timed(client.post(
+                    "/rag/chat", json={"question": f"q{i}", "top_k": 3, "llm_provider": "stub"}
+                )))
+                for i in range(RAG_REQUESTS)
+            ]
+
+            # 느린 요청들이 진행 중일 때 가벼운 엔드포인트
+            # (루프가 막히면 sleep 에서 깨어나는 시점부터 늦어짐 → 발사 시점 기준으로 측정)
+            await asyncio.sleep(0.1)
+            health = await client.get("/health")
+            health_sec = time.perf_counter() - fired - 0.1
+
+            results = await asyncio.gather(*slow)
+            return health, health_sec, results, time.perf_counter() - fired
+
+    health, health_sec, results, wall = asyncio.run(run())
+
+    assert health.status_code == 200
+    assert health_sec < SLOW_SEC / 2, f"/health delayed {health_sec:.2f}s"
+
+    for res, _ in results:
+        assert res.status_code == 200, res.text
+    assert all(r.json()["answer"] == "answer" for r, _ in results[SEARCH_REQUESTS:])
+
+    # 직렬이면 search 0.5s x 6 + rag 1.0s x 4 = 7s
+    serial = SEARCH_REQUESTS * SLOW_SEC + RAG_REQUESTS * 2 * SLOW_SEC
+    assert wall < serial / 3
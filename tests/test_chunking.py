@@ -0,0 +1,76 @@
+"""
+iter_chunks 가 row_packer 묶음 unit 을 행 중간에서 자르지 않는지 확인
+
+- CSV 를 CSVLoader(pack=True) 로 읽어 chunk
+- 모든 chunk 는 행 경계(헤더 / "row N:")에서 시작
+- chunk 의 row_start / row_end 는 chunk 에 실제로 포함된 행 번호와 일치
+"""
+
+import csv
+import pytest
+
+from services.chunking import iter_chunks
+from services.loaders.csv_loader import CSVLoader
+from services.loaders.row_packer import ROW_LINE, pack_rows
+
+
+def _rows_in(text: str) -> list[int]:
+    return [int(n) for n in ROW_LINE.findall(text)]
+
+
+def _assert_row_chunks(chunks, expected_rows):
+    seen = []
+    for chunk in chunks:
+        # 모든 chunk (분할 조각 포함) 가 헤더 줄로 시작, 다음 줄부터 행 경계
+        header, body = chunk.text.split("\n", 1)
+        assert header == "columns: id | name | comment", chunk.text
+        assert ROW_LINE.match(body), chunk.text
+
+        rows = _rows_in(chunk.text)
+        assert rows, chunk.text
+        assert chunk.meta == {"row_start": rows[0], "row_end": rows[-1]}
+        seen.extend(rows)
+
+    assert seen == expected_rows
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "rows.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "name", "comment"])
+        for i in range(1, 301):
+            writer.writerow([i, f"name {i}", "x" * (i % 37)])
+    return path
+
+
+def test_packed_csv_chunks_start_at_row_boundary(csv_path):
+    units = list(CSVLoader(pack=True).load(str(csv_path), max_chars=500))
+    chunks = list(iter_chunks(units, size=500, overlap=100))
+
+    # 묶음 unit 1개 = chunk 1개 (이어 붙이거나 다시 자르지 않음)
+    assert len(chunks) == len(units)
+    for (unit_no, text, meta), chunk in zip(units, chunks):
+        assert (chunk.page_no, chunk.text, chunk.meta) == (unit_no, text.strip(), meta)
+
+    # 헤더 = 1행 → 데이터 2 ~ 301행
+    _assert_row_chunks(chunks, list(range(2, 302)))
+
+
+def test_oversized_packed_unit_splits_on_rows(csv_path):
+    # chunk size 보다 크게 묶인 unit → 줄 경계에서 나누고 행 범위 재계산
+    with open(csv_path, encoding="utf-8") as f:
+        reader = csv.reader(f)
+        columns = next(reader)
+        rows = [(row_no, values) for row_no, values in enumerate(reader, start=2)]
+
+    units = [
+        (unit_no, text, meta)
+        for unit_no, (text, meta) in enumerate(pack_rows(columns, rows, max_chars=2000), start=1)
+    ]
+    chunks = list(iter_chunks(units, size=500, overlap=100))
+
+    assert len(chunks) > len(units)
+    assert all(len(c.text) <= 500 for c in chunks)
+    _assert_row_chunks(chunks, list(range(2, 302)))
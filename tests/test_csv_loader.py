@@ -0,0 +1,33 @@
+"""
+CSVLoader 인코딩 판별: 앞부분(CSV_SNIFF_BYTES)이 모두 ASCII 인 파일
+
+- 뒤쪽의 cp949 / utf-8 한글이 U+FFFD 로 바뀌지 않아야 함
+"""
+
+import pytest
+
+from services.loaders.csv_loader import CSV_SNIFF_BYTES, CSVLoader
+
+
+def _write(path, encoding: str):
+    ascii_rows = CSV_SNIFF_BYTES // 20 + 10   # sniff 구간을 넘기는 ASCII 행
+    with open(path, "w", encoding=encoding, newline="") as f:
+        f.write("id,name,memo\r\n")
+        for i in range(ascii_rows):
+            f.write(f"{i},name{i},plain text\r\n")
+        f.write('9001,홍길동,"여러 줄\r\n메모"\r\n')
+        f.write("9002,김철수,서울특별시\r\n")
+    return ascii_rows
+
+
+@pytest.mark.parametrize("encoding", ["cp949", "utf-8"])
+def test_ascii_sample_then_korean(tmp_path, encoding):
+    path = tmp_path / f"{encoding}.csv"
+    ascii_rows = _write(path, encoding)
+
+    units = [text for _, text in CSVLoader(pack=False).load(str(path))]
+
+    assert len(units) == ascii_rows + 2
+    assert units[-2] == "id: 9001 | name: 홍길동 | memo: 여러 줄\r\n메모"
+    assert units[-1] == "id: 9002 | name: 김철수 | memo: 서울특별시"
+    assert not any("�" in text for text in units)
@@ -0,0 +1,54 @@
+"""
+FingerprintIndex.find 가 band 후보만으로 brute force 와 같은 결과를 내는지 확인 (SQLite)
+"""
+
+import os
+
+for key in ("DB_HOST", "DB_NAME", "DB_USER", "DB_PASSWORD"):
+    os.environ.setdefault(key, "test")
+
+import random
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import models.content  # noqa: F401  (chunk_fingerprint FK 대상 테이블 등록)
+import services.dedup as dedup
+from models.chunk_fingerprint import ChunkFingerprint
+
+
+@pytest.fixture
+def index(monkeypatch):
+    engine = create_engine("sqlite://")
+    ChunkFingerprint.__table__.create(engine)
+    monkeypatch.setattr(dedup, "SessionLocal", sessionmaker(bind=engine))
+    return dedup.FingerprintIndex(max_distance=3)
+
+
+def _flip(h: int, bits: list[int]) -> int:
+    for bit in bits:
+        h ^= 1 << bit
+    return h
+
+
+def test_find_matches_brute_force(index):
+    rng = random.Random(0)
+    stored = [rng.getrandbits(64) for _ in range(500)]
+    index.add([(content_id, 1, h) for content_id, h in enumerate(stored, start=1)])
+
+    # 저장된 지문에서 0 ~ 5 bit 바꾼 질의 (4 이상은 매칭되면 안 됨) + 무관한 지문
+    queries = [
+        _flip(stored[i], rng.sample(range(64), i % 6)) for i in range(0, 500, 5)
+    ] + [rng.getrandbits(64) for _ in range(50)]
+
+    found = index.find(queries)
+
+    for h in queries:
+        best = min(
+            ((dedup.hamming(h, other), content_id) for content_id, other in enumerate(stored, start=1)),
+        )
+        if best[0] <= 3:
+            assert dedup.hamming(h, stored[found[h] - 1]) == best[0]
+        else:
+            assert h not in found
@@ -0,0 +1,62 @@
+"""
+DOCXLoader 텍스트 상자 (mc:AlternateContent) 처리 확인
+
+- Word 는 텍스트 상자를 mc:Choice (DrawingML) / mc:Fallback (VML) 에 두 번 저장 → 1번만 추출
+- 텍스트 상자 문단은 감싸는 문단 안 실제 위치에 포함
+"""
+
+import zipfile
+
+import pytest
+
+from services.loaders.docx_loader import DOCXLoader
+
+_NS = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" '
+    'xmlns:v="urn:schemas-microsoft-com:vml"'
+)
+
+
+def _text_box(text: str) -> str:
+    box = f"<w:txbxContent><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:txbxContent>"
+    return (
+        "<w:r><mc:AlternateContent>"
+        f"<mc:Choice Requires=\"wps\"><w:drawing><wps:txbx>{box}</wps:txbx></w:drawing></mc:Choice>"
+        f"<mc:Fallback><w:pict><v:textbox>{box}</v:textbox></w:pict></mc:Fallback>"
+        "</mc:AlternateContent></w:r>"
+    )
+
+
+def _write_docx(path, body: str, header: str | None = None):
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("word/document.xml", f"<w:document {_NS}><w:body>{body}</w:body></w:document>")
+        if header is not None:
+            z.writestr("word/header1.xml", f"<w:hdr {_NS}>{header}</w:hdr>")
+
+
+@pytest.fixture
+def docx_path(tmp_path):
+    path = tmp_path / "textbox.docx"
+    body = (
+        "<w:p><w:r><w:t>Intro paragraph</w:t></w:r>"
+        + _text_box("BOXTEXT")
+        + "<w:r><w:t> continues</w:t></w:r></w:p>"
+        "<w:tbl><w:tr>"
+        "<w:tc><w:p><w:r><w:t>a</w:t></w:r></w:p></w:tc>"
+        "<w:tc><w:p><w:r><w:t>b</w:t></w:r>" + _text_box("CELLBOX") + "</w:p></w:tc>"
+        "</w:tr></w:tbl>"
+    )
+    header = "<w:p><w:r><w:t>Head</w:t></w:r>" + _text_box("HEADBOX") + "</w:p>"
+    _write_docx(path, body, header)
+    return path
+
+
+def test_text_box_extracted_once_in_place(docx_path):
+    units = list(DOCXLoader().load(str(docx_path)))
+
+    assert units == [
+        (1, "Intro paragraph\nBOXTEXT\ncontinues\na | b CELLBOX"),
+        (2, "[Header/Footer] Head HEADBOX"),
+    ]
@@ -0,0 +1,28 @@
+"""
+preprocess_image 가 돌려주는 DPI = 축소 후 실제 해상도 (tesseract --dpi 값)
+"""
+
+import pytest
+from PIL import Image
+
+from services.ocr_executor import OCR_MAX_SIDE, _tesseract_config, preprocess_image
+
+
+def _image(size, dpi=None):
+    image = Image.new("L", size, 255)
+    if dpi:
+        image.info["dpi"] = (dpi, dpi)
+    return image
+
+
+@pytest.mark.parametrize("size, src_dpi, expected_dpi", [
+    ((1200, 1600), 150, 150),                           # 축소 없음
+    ((4800, 6400), 600, 300),                           # target_dpi 로 축소
+    ((OCR_MAX_SIDE * 4, OCR_MAX_SIDE * 2), 300, 75),    # 대형 판형 → OCR_MAX_SIDE 로 축소
+    ((1000, 800), None, None),                          # DPI 모름
+])
+def test_preprocess_returns_effective_dpi(size, src_dpi, expected_dpi):
+    _, dpi = preprocess_image(_image(size, src_dpi), target_dpi=300, binarize=False)
+
+    assert dpi == expected_dpi
+    assert _tesseract_config(dpi) == (f"--dpi {expected_dpi}" if expected_dpi else "")
@@ -0,0 +1,29 @@
+"""
+strip_repeated_lines 가 반복 머리글/쪽번호만 지우고 가장자리 본문 줄은 남기는지 확인
+"""
+
+from services.page_cleaner import strip_repeated_lines
+
+
+def _pages(count: int):
+    for i in range(1, count + 1):
+        yield i, "\n".join([
+            "ACME Corp Confidential",
+            f"Total 1{i}3,{i}45,000",
+            f"Body line {i} describing the quarter in some detail.",
+            f"- {i} -",
+        ])
+
+
+def test_page_numbers_and_headers_removed_data_lines_kept():
+    cleaned = dict(strip_repeated_lines(_pages(10)))
+
+    assert list(cleaned) == list(range(1, 11))
+    for i, text in cleaned.items():
+        lines = text.split("\n")
+        # 같은 모양의 숫자 줄 (합계/표 행) 은 쪽번호가 아님 → 유지
+        assert f"Total 1{i}3,{i}45,000" in lines
+        assert f"Body line {i} describing the quarter in some detail." in lines
+        # 모든 페이지에 같은 머리글 / 쪽번호 → 제거
+        assert "ACME Corp Confidential" not in lines
+        assert f"- {i} -" not in lines
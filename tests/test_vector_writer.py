@@ -0,0 +1,69 @@
+"""
+VectorWriter batch upsert 실패 처리
+
+- 연결 실패 / timeout → point 단위 재시도 없이 batch 전체 실패 (Qdrant 장애 시 빠르게 반환)
+- 요청 내용 오류 (4xx) → point 단위 재시도로 실패 point 만 보고
+"""
+
+import os
+
+for key in ("DB_HOST", "DB_NAME", "DB_USER", "DB_PASSWORD"):
+    os.environ.setdefault(key, "test")
+
+import httpx
+import pytest
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
+
+import vector.realtime_vector as realtime_vector
+from vector.embedding_models import get_embedding_config
+from vector.realtime_vector import VectorRecord, VectorWriter
+
+POINTS = 8
+
+
+class _FailingClient:
+    def __init__(self, error, bad_id=None):
+        self.error = error
+        self.bad_id = bad_id
+        self.calls = []
+
+    def upsert(self, collection_name, points, wait):
+        self.calls.append([p.id for p in points])
+        if len(points) > 1 or points[0].id == self.bad_id:
+            raise self.error
+
+
+def _write(monkeypatch, client):
+    monkeypatch.setattr(realtime_vector, "get_qdrant_client", lambda: client)
+    dim = get_embedding_config("nomic").vector_size
+
+    writer = VectorWriter(collection_name="c", model_key="nomic", batch_size=POINTS)
+    for i in range(1, POINTS + 1):
+        writer.add(
+            VectorRecord(
+                content_id=i, doc_id=1, page_no=1, chunk_no=i, text="t",
+                folder_name="f", title="t", file_type="txt", source="test",
+            ),
+            [0.1] * dim,
+        )
+    return writer.close()
+
+
+@pytest.mark.parametrize("error", [
+    ResponseHandlingException(httpx.ConnectError("Connection refused")),
+    UnexpectedResponse(503, "Service Unavailable", b"", httpx.Headers()),
+])
+def test_unavailable_fails_batch_without_retry(monkeypatch, error):
+    client = _FailingClient(error)
+    failures = _write(monkeypatch, client)
+
+    assert len(client.calls) == 1
+    assert [f.point_id for f in failures] == list(range(1, POINTS + 1))
+
+
+def test_bad_request_retries_per_point(monkeypatch):
+    client = _FailingClient(UnexpectedResponse(400, "Bad Request", b"", httpx.Headers()), bad_id=3)
+    failures = _write(monkeypatch, client)
+
+    assert len(client.calls) == 1 + POINTS
+    assert [f.point_id for f in failures] == [3]
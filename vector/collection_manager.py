@@ -2,9 +2,26 @@
 
 import logging
 from qdrant_client import QdrantClient
-from qdrant_client.models import VectorParams
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    HnswConfigDiff,
+    PayloadSchemaType,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+    VectorParamsDiff,
+)
 
-from vector.embedding_models import get_embedding_config
+from vector.embedding_models import (
+    QUANT_BINARY,
+    QUANT_SCALAR,
+    EmbeddingModelConfig,
+    get_embedding_config,
+)
 
 
 # =================================================
@@ -14,6 +31,150 @@ logger = logging.getLogger("collection_manager")
 logger.setLevel(logging.INFO)
 
 
+# =================================================
+# payload index (필터 검색 / 문서 단위 조회)
+# =================================================
+# _build_payload() 의 metadata 필드 기준
+PAYLOAD_INDEXES = {
+    "metadata.folder_name": PayloadSchemaType.KEYWORD,
+    "metadata.file_type": PayloadSchemaType.KEYWORD,
+    "metadata.source": PayloadSchemaType.KEYWORD,
+    "metadata.doc_id": PayloadSchemaType.INTEGER,
+}
+
+
+def ensure_payload_indexes(
+    client: QdrantClient,
+    collection_name: str,
+    existing: dict | None = None,
+    *,
+    wait: bool = True,
+) -> list[str]:
+    """
+    PAYLOAD_INDEXES 중 없는 index 생성
+
+    - existing : collection info 의 payload_schema (없으면 조회)
+    - 기존 대용량 컬렉션은 wait=False → 서버가 백그라운드로 색인
+    - 실패해도 예외 없음 (index 가 없으면 필터 검색이 느려질 뿐)
+
+    Returns:
+        생성 요청한 field 목록
+    """
+    if existing is None:
+        existing = client.get_collection(collection_name).payload_schema or {}
+
+    created = []
+    for field_name, schema in PAYLOAD_INDEXES.items():
+        if field_name in existing:
+            continue
+        try:
+            client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=schema,
+                wait=wait,
+            )
+            created.append(field_name)
+        except Exception as e:
+            logger.warning(
+                f"[QDRANT] payload index failed: {collection_name}.{field_name} | {e}"
+            )
+
+    if created:
+        logger.info(f"[QDRANT] payload index created: {collection_name} {created}")
+    return created
+
+
+# =================================================
+# 양자화 / HNSW (EmbeddingModelConfig 기준)
+# =================================================
+def _quantization_config(cfg: EmbeddingModelConfig):
+    if cfg.quantization == QUANT_SCALAR:
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+        )
+    if cfg.quantization == QUANT_BINARY:
+        return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+    return None
+
+
+def _hnsw_config(cfg: EmbeddingModelConfig) -> HnswConfigDiff | None:
+    if cfg.hnsw_m is None and cfg.hnsw_ef_construct is None:
+        return None
+    return HnswConfigDiff(m=cfg.hnsw_m, ef_construct=cfg.hnsw_ef_construct)
+
+
+def _quantization_kind(quantization) -> str | None:
+    if isinstance(quantization, ScalarQuantization):
+        return QUANT_SCALAR
+    if isinstance(quantization, BinaryQuantization):
+        return QUANT_BINARY
+    return None
+
+
+def apply_storage_config(client: QdrantClient, collection_name: str, cfg: EmbeddingModelConfig, info) -> list[str]:
+    """
+    기존 컬렉션에 모델 설정(양자화 / on_disk / HNSW)과 다른 항목만 update_collection
+
+    - 서버가 백그라운드 optimizer 로 재색인 (검색은 계속 가능)
+    - 모델 설정이 None 인 항목은 기존 값 유지 (양자화 해제는 하지 않음)
+    - 실패해도 예외 없음 (기존 설정으로 계속 동작)
+
+    Returns:
+        변경 요청한 항목 목록
+    """
+    changes = {}
+    config = info.config
+
+    if cfg.quantization and _quantization_kind(config.quantization_config) != cfg.quantization:
+        changes["quantization_config"] = _quantization_config(cfg)
+
+    if cfg.on_disk and not getattr(config.params.vectors, "on_disk", False):
+        changes["vectors_config"] = {"": VectorParamsDiff(on_disk=True)}
+
+    hnsw = config.hnsw_config
+    if (
+        (cfg.hnsw_m is not None and hnsw.m != cfg.hnsw_m)
+        or (cfg.hnsw_ef_construct is not None and hnsw.ef_construct != cfg.hnsw_ef_construct)
+    ):
+        changes["hnsw_config"] = _hnsw_config(cfg)
+
+    if not changes:
+        return []
+
+    try:
+        client.update_collection(collection_name=collection_name, **changes)
+    except Exception as e:
+        logger.warning(f"[QDRANT] storage config update failed: {collection_name} | {e}")
+        return []
+
+    logger.info(f"[QDRANT] storage config updated: {collection_name} {list(changes)}")
+    return list(changes)
+
+
+def build_search_params(
+    model_key: str,
+    *,
+    oversampling: float | None = None,
+    rescore: bool | None = None,
+) -> SearchParams | None:
+    """
+    양자화 컬렉션 검색 파라미터 (요청 값 > 모델 기본값)
+    - 양자화 미사용 모델은 None (서버 기본 동작)
+    """
+    cfg = get_embedding_config(model_key)
+    if not cfg.quantization:
+        return None
+
+    return SearchParams(
+        quantization=QuantizationSearchParams(
+            ignore=False,
+            rescore=cfg.search_rescore if rescore is None else rescore,
+            oversampling=cfg.search_oversampling if oversampling is None else oversampling,
+        )
+    )
+
+
 # =================================================
 # Collection name resolver
 # =================================================
@@ -46,6 +207,8 @@ def ensure_collection(
 
     - 컬렉션이 없으면 생성
     - 이미 있으면 vector_size 불일치 시 즉시 에러
+    - payload index (PAYLOAD_INDEXES) 는 신규/기존 모두 보장
+    - 양자화 / on_disk / HNSW 는 모델 설정대로 (기존 컬렉션은 다른 항목만 갱신)
 
     Returns:
         실제 사용해야 할 collection_name
@@ -76,6 +239,11 @@ def ensure_collection(
             f"[QDRANT] collection exists: {collection_name} "
             f"(dim={existing_dim})"
         )
+
+        ensure_payload_indexes(
+            client, collection_name, info.payload_schema or {}, wait=False
+        )
+        apply_storage_config(client, collection_name, cfg, info)
         return collection_name
 
     # -------------------------------------------------
@@ -83,7 +251,8 @@ def ensure_collection(
     # -------------------------------------------------
     logger.info(
         f"[QDRANT] creating collection: {collection_name} "
-        f"(dim={cfg.vector_size}, distance={cfg.distance})"
+        f"(dim={cfg.vector_size}, distance={cfg.distance}, "
+        f"quantization={cfg.quantization}, on_disk={cfg.on_disk})"
     )
 
     client.create_collection(
@@ -91,9 +260,14 @@ def ensure_collection(
         vectors_config=VectorParams(
             size=cfg.vector_size,
             distance=cfg.distance,
+            on_disk=cfg.on_disk,
         ),
+        hnsw_config=_hnsw_config(cfg),
+        quantization_config=_quantization_config(cfg),
     )
 
+    ensure_payload_indexes(client, collection_name, {})
+
     return collection_name
 
 
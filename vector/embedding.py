@@ -1,8 +1,7 @@
 # vector/embedding.py
 
 import os
-import json
-import http.client
+import logging
 from dotenv import load_dotenv
 
 load_dotenv()  # 환경변수 로드
@@ -16,6 +15,10 @@ from vector.embedding_models import (
     ENGINE_OLLAMA,
     ENGINE_GEMINI,
 )
+from vector.embedding_cache import get_embedding_cache
+from vector.ollama_pool import get_ollama_pool
+
+logger = logging.getLogger("embedding")
 
 # -----------------------------
 # OpenAI (Lazy initialization)
@@ -39,6 +42,16 @@ def _embed_openai(text: str, model: str) -> list[float]:
     return resp.data[0].embedding
 
 
+def _embed_openai_batch(texts: list[str], model: str) -> list[list[float]]:
+    client = _get_openai_client()
+    resp = client.embeddings.create(
+        model=model,
+        input=texts
+    )
+    # 응답 순서 보장을 위해 index 기준 정렬
+    return [d.embedding for d in sorted(resp.data, key=lambda d: d.index)]
+
+
 # -----------------------------
 # Ollama
 # -----------------------------
@@ -48,19 +61,27 @@ OLLAMA_HOST = "localhost" if _ollama_host_env == "0.0.0.0" else _ollama_host_env
 OLLAMA_PORT = int(os.getenv("OLLAMA_PORT", "11434"))
 
 
-def _embed_ollama(text: str, model: str) -> list[float]:
-    conn = http.client.HTTPConnection(OLLAMA_HOST, OLLAMA_PORT, timeout=60)
-    payload = json.dumps({"model": model, "prompt": text})
-    headers = {"Content-Type": "application/json"}
+# 모델을 메모리에 유지할 시간 (bulk ingest 중 재로딩 방지)
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
 
-    conn.request("POST", "/api/embeddings", payload, headers)
-    res = conn.getresponse()
-    body = res.read().decode("utf-8")
+def _embed_ollama(text: str, model: str) -> list[float]:
+    data = get_ollama_pool(OLLAMA_HOST, OLLAMA_PORT).post_json(
+        "/api/embeddings",
+        {"model": model, "prompt": text, "keep_alive": OLLAMA_KEEP_ALIVE},
+    )
+    return data["embedding"]
 
-    if res.status != 200:
-        raise RuntimeError(f"Ollama error {res.status}: {body}")
 
-    return json.loads(body)["embedding"]
+def _embed_ollama_batch(texts: list[str], model: str) -> list[list[float]]:
+    """
+    Ollama /api/embed (multi-input) 사용
+    """
+    data = get_ollama_pool(OLLAMA_HOST, OLLAMA_PORT).post_json(
+        "/api/embed",
+        {"model": model, "input": texts, "keep_alive": OLLAMA_KEEP_ALIVE},
+    )
+    return data["embeddings"]
 
 
 # -----------------------------
@@ -86,13 +107,21 @@ def _embed_gemini(text: str, model: str) -> list[float]:
     return result["embedding"]
 
 
+def _embed_gemini_batch(texts: list[str], model: str) -> list[list[float]]:
+    _ensure_gemini_configured()
+    # content 에 list 를 넘기면 batchEmbedContents 로 처리됨
+    result = genai.embed_content(
+        model=model,
+        content=texts,
+        task_type="retrieval_document",
+    )
+    return result["embedding"]
+
+
 # -----------------------------
 # Unified API
 # -----------------------------
-def embed_text(text: str, model_key: str) -> list[float]:
-    if model_key not in EMBEDDING_MODELS:
-        raise ValueError(f"Unknown model_key: {model_key}")
-
+def _embed_one(text: str, model_key: str) -> list[float]:
     cfg = EMBEDDING_MODELS[model_key]
 
     if cfg.engine == ENGINE_OPENAI:
@@ -105,3 +134,118 @@ def embed_text(text: str, model_key: str) -> list[float]:
         return _embed_gemini(text, cfg.model_name)
 
     raise RuntimeError(f"Unsupported embedding engine: {cfg.engine}")
+
+
+# -----------------------------
+# Cache (embedding_cache.py) - 실패해도 임베딩은 계속
+# -----------------------------
+def _cache_get(texts: list[str], model_key: str) -> list[list[float] | None]:
+    cache = get_embedding_cache()
+    if cache is None:
+        return [None] * len(texts)
+    try:
+        return cache.get_many(model_key, texts)
+    except Exception as e:
+        logger.warning(f"[EMBED CACHE] get failed: {e}")
+        return [None] * len(texts)
+
+
+def _cache_put(texts: list[str], vectors: list[list[float]], model_key: str):
+    cache = get_embedding_cache()
+    if cache is None or not texts:
+        return
+    try:
+        cache.put_many(model_key, texts, vectors)
+    except Exception as e:
+        logger.warning(f"[EMBED CACHE] put failed: {e}")
+
+
+def embed_text(text: str, model_key: str) -> list[float]:
+    if model_key not in EMBEDDING_MODELS:
+        raise ValueError(f"Unknown model_key: {model_key}")
+
+    cached = _cache_get([text], model_key)[0]
+    if cached is not None:
+        return cached
+
+    vector = _embed_one(text, model_key)
+    _cache_put([text], [vector], model_key)
+    return vector
+
+
+_BATCH_FUNCS = {
+    ENGINE_OPENAI: _embed_openai_batch,
+    ENGINE_OLLAMA: _embed_ollama_batch,
+    ENGINE_GEMINI: _embed_gemini_batch,
+}
+
+
+def _split_batches(texts: list[str], max_items: int, max_chars: int | None):
+    """
+    입력 수 max_items, 글자 합 max_chars 이하로 분할 (단일 텍스트가 더 길면 단독 batch)
+    """
+    batch: list[str] = []
+    chars = 0
+    for text in texts:
+        if batch and (
+            len(batch) >= max_items
+            or (max_chars is not None and chars + len(text) > max_chars)
+        ):
+            yield batch
+            batch, chars = [], 0
+        batch.append(text)
+        chars += len(text)
+
+    if batch:
+        yield batch
+
+
+def embed_texts(texts: list[str], model_key: str) -> list[list[float]]:
+    """
+    여러 텍스트를 provider 의 batch 입력으로 임베딩
+
+    - 캐시 hit 는 재사용, miss 만 provider 호출
+    - 모델별 max_batch_size (입력 수) / max_batch_chars (글자 합) 단위로 분할 요청
+    - 반환 순서 = 입력 순서
+    """
+    if model_key not in EMBEDDING_MODELS:
+        raise ValueError(f"Unknown model_key: {model_key}")
+
+    cfg = EMBEDDING_MODELS[model_key]
+
+    if cfg.engine not in _BATCH_FUNCS:
+        raise RuntimeError(f"Unsupported embedding engine: {cfg.engine}")
+
+    if not texts:
+        return []
+
+    vectors = _cache_get(texts, model_key)
+
+    # 같은 배치 안의 중복 텍스트는 1회만 요청
+    missing: dict[str, list[int]] = {}
+    for i, vector in enumerate(vectors):
+        if vector is None:
+            missing.setdefault(texts[i], []).append(i)
+
+    if not missing:
+        return vectors
+
+    embed_batch = _BATCH_FUNCS[cfg.engine]
+    batch_size = max(1, cfg.max_batch_size)
+
+    for batch in _split_batches(list(missing), batch_size, cfg.max_batch_chars):
+        result = embed_batch(batch, cfg.model_name)
+
+        if len(result) != len(batch):
+            raise RuntimeError(
+                f"Embedding count mismatch: expected={len(batch)}, "
+                f"got={len(result)} (model_key={model_key})"
+            )
+
+        for text, vector in zip(batch, result):
+            for i in missing[text]:
+                vectors[i] = vector
+
+        _cache_put(batch, result, model_key)
+
+    return vectors
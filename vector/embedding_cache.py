@@ -0,0 +1,278 @@
+# vector/embedding_cache.py
+"""
+임베딩 결과 디스크 캐시 (content-addressed, size-bounded LRU)
+
+key   : (model_key, model version, sha256(텍스트))
+value : float32 / float16 blob
+
+- embed_text / embed_texts 앞단에서 사용 (재적재/재인덱싱 시 유료 임베딩 재호출 방지)
+- 텍스트는 호출자가 normalize_for_embedding 을 적용한 "실제 임베딩 입력" 그대로 해시
+- 전체 blob 크기가 max_bytes 를 넘으면 last_access 가 오래된 순으로 제거
+"""
+
+import os
+import array
+import struct
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import List, Optional, Sequence
+
+from vector.embedding_models import get_embedding_config
+
+logger = logging.getLogger("embedding_cache")
+
+EMBED_CACHE_ENABLED = os.getenv("EMBED_CACHE_ENABLED", "true").lower() == "true"
+EMBED_CACHE_PATH = os.getenv("EMBED_CACHE_PATH", ".cache/embedding_cache.sqlite3")
+EMBED_CACHE_MAX_MB = int(os.getenv("EMBED_CACHE_MAX_MB", "4096"))
+EMBED_CACHE_DTYPE = os.getenv("EMBED_CACHE_DTYPE", "float32")   # float32 | float16
+
+DTYPE_FLOAT32 = "float32"
+DTYPE_FLOAT16 = "float16"
+
+# eviction 시 max_bytes 의 이 비율까지 줄임 (매 put 마다 evict 방지)
+_EVICT_TARGET_RATIO = 0.9
+_SQLITE_MAX_VARS = 900
+
+
+def _encode(vector: Sequence[float], dtype: str) -> bytes:
+    if dtype == DTYPE_FLOAT16:
+        return struct.pack(f"<{len(vector)}e", *vector)
+    return array.array("f", vector).tobytes()
+
+
+def _decode(blob: bytes, dtype: str) -> List[float]:
+    if dtype == DTYPE_FLOAT16:
+        return list(struct.unpack(f"<{len(blob) // 2}e", blob))
+    vec = array.array("f")
+    vec.frombytes(blob)
+    return vec.tolist()
+
+
+def _text_hash(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """
+    sqlite 기반 임베딩 캐시 (thread-safe)
+
+    사용법:
+        cache = EmbeddingCache(path, max_bytes=4 * 1024**3)
+        vectors = cache.get_many("openai_large", texts)   # miss = None
+        cache.put_many("openai_large", texts, vectors)
+        cache.stats()
+    """
+
+    def __init__(
+        self,
+        path: str = EMBED_CACHE_PATH,
+        *,
+        max_bytes: int = EMBED_CACHE_MAX_MB * 1024 * 1024,
+        dtype: str = EMBED_CACHE_DTYPE,
+    ):
+        if dtype not in (DTYPE_FLOAT32, DTYPE_FLOAT16):
+            raise ValueError(f"Unsupported cache dtype: {dtype}")
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.dtype = dtype
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model_key   TEXT    NOT NULL,
+                version     INTEGER NOT NULL,
+                text_hash   BLOB    NOT NULL,
+                dtype       TEXT    NOT NULL,
+                vector      BLOB    NOT NULL,
+                nbytes      INTEGER NOT NULL,
+                last_access INTEGER NOT NULL,
+                PRIMARY KEY (model_key, version, text_hash)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_embedding_cache_lru "
+            "ON embedding_cache (last_access)"
+        )
+        self._conn.commit()
+
+        total, clock = self._conn.execute(
+            "SELECT COALESCE(SUM(nbytes), 0), COALESCE(MAX(last_access), 0) "
+            "FROM embedding_cache"
+        ).fetchone()
+        self._total_bytes = total
+        self._clock = clock
+
+    # --------------------------
+    # public
+    # --------------------------
+    def get_many(self, model_key: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        version = get_embedding_config(model_key).version
+        hashes = [_text_hash(t) for t in texts]
+        found: dict[bytes, tuple[bytes, str]] = {}
+
+        with self._lock:
+            unique = list(dict.fromkeys(hashes))
+            for start in range(0, len(unique), _SQLITE_MAX_VARS):
+                part = unique[start:start + _SQLITE_MAX_VARS]
+                rows = self._conn.execute(
+                    "SELECT text_hash, vector, dtype FROM embedding_cache "
+                    "WHERE model_key = ? AND version = ? "
+                    f"AND text_hash IN ({','.join('?' * len(part))})",
+                    (model_key, version, *part),
+                ).fetchall()
+                for h, blob, dtype in rows:
+                    found[h] = (blob, dtype)
+
+            if found:
+                self._touch(model_key, version, list(found))
+                self._conn.commit()
+
+            hit = sum(1 for h in hashes if h in found)
+            self.hits += hit
+            self.misses += len(hashes) - hit
+
+        return [
+            _decode(*found[h]) if h in found else None
+            for h in hashes
+        ]
+
+    def put_many(
+        self,
+        model_key: str,
+        texts: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+    ) -> None:
+        version = get_embedding_config(model_key).version
+
+        with self._lock:
+            rows = []
+            for text, vector in zip(texts, vectors):
+                blob = _encode(vector, self.dtype)
+                self._clock += 1
+                rows.append((
+                    model_key, version, _text_hash(text),
+                    self.dtype, blob, len(blob), self._clock,
+                ))
+
+            for row in rows:
+                cur = self._conn.execute(
+                    "INSERT OR IGNORE INTO embedding_cache "
+                    "(model_key, version, text_hash, dtype, vector, nbytes, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    row,
+                )
+                if cur.rowcount:
+                    self._total_bytes += row[5]
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute(
+                "SELECT COUNT(*) FROM embedding_cache"
+            ).fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "enabled": True,
+                "path": self.path,
+                "dtype": self.dtype,
+                "entries": entries,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+            }
+
+    # --------------------------
+    # 내부 (lock 보유 상태에서 호출)
+    # --------------------------
+    def _touch(self, model_key: str, version: int, hashes: List[bytes]) -> None:
+        rows = []
+        for h in hashes:
+            self._clock += 1
+            rows.append((self._clock, model_key, version, h))
+        self._conn.executemany(
+            "UPDATE embedding_cache SET last_access = ? "
+            "WHERE model_key = ? AND version = ? AND text_hash = ?",
+            rows,
+        )
+
+    def _evict(self) -> None:
+        target = int(self.max_bytes * _EVICT_TARGET_RATIO)
+
+        while self._total_bytes > target:
+            victims = self._conn.execute(
+                "SELECT rowid, nbytes FROM embedding_cache "
+                "ORDER BY last_access LIMIT 1000"
+            ).fetchall()
+            if not victims:
+                self._total_bytes = 0
+                break
+
+            rowids = []
+            for rowid, nbytes in victims:
+                rowids.append((rowid,))
+                self._total_bytes -= nbytes
+                self.evictions += 1
+                if self._total_bytes <= target:
+                    break
+
+            self._conn.executemany(
+                "DELETE FROM embedding_cache WHERE rowid = ?", rowids
+            )
+
+        logger.info(
+            f"[EMBED CACHE] evicted -> bytes={self._total_bytes} "
+            f"(max={self.max_bytes})"
+        )
+
+
+# =================================================
+# singleton
+# =================================================
+_cache: EmbeddingCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache | None:
+    """
+    캐시 단일 인스턴스 (EMBED_CACHE_ENABLED=false 이면 None)
+    """
+    global _cache
+    if not EMBED_CACHE_ENABLED:
+        return None
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EmbeddingCache()
+                logger.info(f"[EMBED CACHE] opened: {_cache.path}")
+    return _cache
+
+
+def embedding_cache_stats() -> dict:
+    cache = get_embedding_cache()
+    if cache is None:
+        return {"enabled": False}
+    return cache.stats()
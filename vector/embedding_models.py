@@ -8,6 +8,9 @@ ENGINE_OPENAI = "openai"
 ENGINE_OLLAMA = "ollama"
 ENGINE_GEMINI = "gemini"   # ⭐ 추가
 
+QUANT_SCALAR = "scalar"    # int8 (메모리 1/4)
+QUANT_BINARY = "binary"    # 1bit (메모리 1/32, 고차원 모델 전용 권장)
+
 
 @dataclass(frozen=True)
 class EmbeddingModelConfig:
@@ -17,6 +20,29 @@ class EmbeddingModelConfig:
     distance: Distance
     version: int
     engine: str          # ⭐ 추가: openai | ollama
+    max_batch_size: int = 32   # 1회 요청당 최대 입력 수 (embed_texts)
+    max_batch_chars: int | None = None   # 1회 요청당 입력 글자 합 상한 (provider 요청당 token 한도, None = 없음)
+    max_input_chars: int = 1500   # 임베딩 입력 최대 글자 수 (모델 context, 한글 1자 ≈ 1 token 기준 보수적)
+    chunk_size: int = 500         # chunker 목표 크기 (글자)
+    chunk_overlap: int = 100
+
+    # Qdrant 컬렉션 설정 (ensure_collection 이 생성/기존 컬렉션에 적용)
+    quantization: str | None = None   # None | scalar | binary (양자화 벡터는 RAM 유지)
+    on_disk: bool = False             # 원본 벡터 mmap (rescore 시에만 읽음)
+    hnsw_m: int | None = None         # None = 서버 기본값
+    hnsw_ef_construct: int | None = None
+    # 양자화 검색 기본값: limit * oversampling 후보를 원본 벡터로 rescore
+    search_oversampling: float = 1.0
+    search_rescore: bool = True
+
+    def __post_init__(self):
+        if self.chunk_size > self.max_input_chars:
+            raise ValueError(
+                f"[{self.key}] chunk_size({self.chunk_size}) > "
+                f"max_input_chars({self.max_input_chars})"
+            )
+        if self.quantization not in (None, QUANT_SCALAR, QUANT_BINARY):
+            raise ValueError(f"[{self.key}] unknown quantization: {self.quantization}")
 
 
 EMBEDDING_MODELS = {
@@ -26,7 +52,19 @@ EMBEDDING_MODELS = {
         vector_size=3072,
         distance=Distance.COSINE,
         version=2,
-        engine=ENGINE_OPENAI
+        engine=ENGINE_OPENAI,
+        max_batch_size=256,
+        # 요청당 300k token 한도 (한글 1자 ≈ 1 token 이상 → 여유 두고 글자 기준)
+        max_batch_chars=200_000,
+        max_input_chars=6000,
+        chunk_size=2000,
+        chunk_overlap=200,
+        # 3072 dim float32 = 12KB/point → binary 384B 만 RAM
+        quantization=QUANT_BINARY,
+        on_disk=True,
+        hnsw_m=16,
+        hnsw_ef_construct=128,
+        search_oversampling=3.0,
     ),
 
     "nomic": EmbeddingModelConfig(
@@ -35,7 +73,14 @@ EMBEDDING_MODELS = {
         vector_size=768,
         distance=Distance.COSINE,
         version=2,
-        engine=ENGINE_OLLAMA
+        engine=ENGINE_OLLAMA,
+        max_batch_size=64,
+        max_input_chars=2000,
+        chunk_size=1000,
+        chunk_overlap=150,
+        quantization=QUANT_SCALAR,
+        on_disk=True,
+        search_oversampling=2.0,
     ),
 
     "bge_m3": EmbeddingModelConfig(
@@ -44,7 +89,14 @@ EMBEDDING_MODELS = {
         vector_size=1024,
         distance=Distance.COSINE,
         version=1,
-        engine=ENGINE_OLLAMA
+        engine=ENGINE_OLLAMA,
+        max_batch_size=32,
+        max_input_chars=4000,
+        chunk_size=1200,
+        chunk_overlap=150,
+        quantization=QUANT_SCALAR,
+        on_disk=True,
+        search_oversampling=2.0,
     ),
 
     # -----------------------------
@@ -56,7 +108,14 @@ EMBEDDING_MODELS = {
         vector_size=768,
         distance=Distance.COSINE,
         version=1,
-        engine=ENGINE_GEMINI
+        engine=ENGINE_GEMINI,
+        max_batch_size=100,
+        max_input_chars=2000,
+        chunk_size=1000,
+        chunk_overlap=150,
+        quantization=QUANT_SCALAR,
+        on_disk=True,
+        search_oversampling=2.0,
     ),
     
      # ⭐ NEW: Gemma 2 Embedding
@@ -66,7 +125,14 @@ EMBEDDING_MODELS = {
         vector_size=768,
         distance=Distance.COSINE,
         version=1,
-        engine=ENGINE_OLLAMA
+        engine=ENGINE_OLLAMA,
+        max_batch_size=64,
+        max_input_chars=2000,
+        chunk_size=1000,
+        chunk_overlap=150,
+        quantization=QUANT_SCALAR,
+        on_disk=True,
+        search_oversampling=2.0,
     ),   
     
 }
@@ -0,0 +1,174 @@
+# vector/ollama_pool.py
+"""
+Ollama HTTP keep-alive connection pool
+
+- host:port 별 pool 1개 (thread-safe)
+- 유휴 연결을 재사용해 요청마다 TCP 연결을 새로 맺지 않음
+- 서버가 끊은 오래된 keep-alive 연결은 1회 새 연결로 재시도
+  (응답을 받기 전 연결 끊김만 재시도, timeout 등은 그대로 예외 → 중복 요청 방지)
+"""
+
+import os
+import json
+import queue
+import socket
+import logging
+import threading
+import http.client
+from typing import Any, Dict
+
+logger = logging.getLogger("embedding")
+
+OLLAMA_POOL_SIZE = int(os.getenv("OLLAMA_POOL_SIZE", "8"))
+OLLAMA_TIMEOUT = float(os.getenv("OLLAMA_TIMEOUT", "120"))
+OLLAMA_CONNECT_TIMEOUT = float(os.getenv("OLLAMA_CONNECT_TIMEOUT", "5"))
+
+# 재사용 연결에서 이 예외가 응답 수신 전에 나면 서버가 유휴 연결을 끊은 것
+# (RemoteDisconnected 는 ConnectionResetError 하위 클래스)
+_STALE_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+class _StaleConnection(Exception):
+    pass
+
+
+class OllamaConnectionPool:
+    """
+    사용법:
+        pool = get_ollama_pool("localhost", 11434)
+        data = pool.post_json("/api/embed", {"model": ..., "input": [...]})
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        size: int = OLLAMA_POOL_SIZE,
+        timeout: float = OLLAMA_TIMEOUT,
+        connect_timeout: float = OLLAMA_CONNECT_TIMEOUT,
+    ):
+        self.host = host
+        self.port = port
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+
+        self.created = 0
+        self.reused = 0
+
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+        # 동시에 사용 중인 연결 수 상한 (초과 요청은 대기)
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+
+    # --------------------------
+    # public
+    # --------------------------
+    def post_json(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        # bytes 로 넘겨야 header 와 body 가 한 번에 전송됨 (Nagle + delayed ACK 지연 방지)
+        body = json.dumps(payload).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        }
+
+        with self._slots:
+            conn, reused = self._acquire()
+            try:
+                status, data, keep = self._send_once(conn, path, body, headers, reused)
+            except _StaleConnection as e:
+                # 유휴 중 서버가 끊은 연결 → 새 연결로 1회 재시도
+                logger.debug(f"[OLLAMA POOL] stale connection, reconnect: {e.__cause__}")
+                conn = self._connect()
+                status, data, keep = self._send_once(conn, path, body, headers, False)
+
+            if keep:
+                self._idle.put(conn)
+            else:
+                conn.close()
+
+        if status != 200:
+            raise RuntimeError(f"Ollama error {status}: {data}")
+
+        return json.loads(data)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def stats(self) -> dict:
+        return {
+            "host": f"{self.host}:{self.port}",
+            "size": self.size,
+            "idle": self._idle.qsize(),
+            "created": self.created,
+            "reused": self.reused,
+        }
+
+    # --------------------------
+    # 내부
+    # --------------------------
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect(), False
+
+        with self._lock:
+            self.reused += 1
+        return conn, True
+
+    def _connect(self) -> http.client.HTTPConnection:
+        conn = http.client.HTTPConnection(
+            self.host, self.port, timeout=self.connect_timeout
+        )
+        conn.connect()
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # 연결 후에는 (임베딩 처리 시간을 고려한) 읽기 timeout 적용
+        conn.sock.settimeout(self.timeout)
+        conn.timeout = self.timeout
+
+        with self._lock:
+            self.created += 1
+        return conn
+
+    @staticmethod
+    def _send_once(conn, path, body, headers, reused: bool) -> tuple[int, str, bool]:
+        """
+        요청 1회. 실패 시 연결은 닫고 예외 전달
+        - 재사용 연결이 응답 status line 수신 전에 끊긴 경우만 _StaleConnection (재시도 가능)
+        """
+        try:
+            try:
+                conn.request("POST", path, body, headers)
+                res = conn.getresponse()
+            except _STALE_ERRORS as e:
+                if reused:
+                    raise _StaleConnection() from e
+                raise
+
+            data = res.read().decode("utf-8")
+            return res.status, data, not res.will_close
+        except BaseException:
+            conn.close()
+            raise
+
+
+_pools: Dict[tuple[str, int], OllamaConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_ollama_pool(host: str, port: int) -> OllamaConnectionPool:
+    key = (host, port)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = OllamaConnectionPool(host, port)
+                _pools[key] = pool
+    return pool
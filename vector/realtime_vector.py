@@ -1,16 +1,20 @@
 # vector/realtime_vector.py
 
 import os
+import time
 import logging
-from typing import Dict, Any
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, List
 
+import grpc
 from qdrant_client import QdrantClient
-from qdrant_client.models import PointStruct
+from qdrant_client.http.exceptions import UnexpectedResponse
+from qdrant_client.models import PointStruct, UpdateStatus
 
-from vector.embedding import embed_text
+from vector.embedding import embed_text, embed_texts
 from vector.embedding_models import get_embedding_config
 from vector.collection_manager import assert_vector_dimension
-from vector.embedding_models import get_embedding_config
 
 # =================================================
 # logging
@@ -24,25 +28,88 @@ logger.setLevel(logging.INFO)
 # =================================================
 QDRANT_HOST = os.getenv("QDRANT_HOST")
 QDRANT_PORT = int(os.getenv("QDRANT_PORT", "6333"))
+# true = gRPC 로 통신 (벡터 batch upsert / 검색의 JSON 인코딩 비용 제거)
+QDRANT_PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC", "false").lower() == "true"
+QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+QDRANT_TIMEOUT = int(os.getenv("QDRANT_TIMEOUT", "30"))
+
+# VectorWriter 기본값 (buffered bulk upsert)
+VECTOR_WRITE_BATCH = int(os.getenv("VECTOR_WRITE_BATCH", "256"))
+# 마지막 flush 후 이 시간이 지나면 다음 add() 에서 flush (타이머 없음, 남은 버퍼는 flush()/close())
+VECTOR_FLUSH_SEC = float(os.getenv("VECTOR_FLUSH_SEC", "2.0"))
+VECTOR_UPSERT_WAIT = os.getenv("VECTOR_UPSERT_WAIT", "true").lower() == "true"
 
 _qdrant_client: QdrantClient | None = None
+_qdrant_lock = threading.Lock()
 
 
 def get_qdrant_client() -> QdrantClient:
     """
     Qdrant client 단일 인스턴스 반환
+    (ingest worker / 검색 / RAG / dashboard 가 같은 인스턴스 공유, 최초 생성만 lock)
     """
     global _qdrant_client
     if _qdrant_client is None:
-        _qdrant_client = QdrantClient(
-            host=QDRANT_HOST,
-            port=QDRANT_PORT,
-            timeout=30,
-        )
-        logger.info("[QDRANT] client initialized")
+        with _qdrant_lock:
+            if _qdrant_client is None:
+                _qdrant_client = QdrantClient(
+                    host=QDRANT_HOST,
+                    port=QDRANT_PORT,
+                    grpc_port=QDRANT_GRPC_PORT,
+                    prefer_grpc=QDRANT_PREFER_GRPC,
+                    timeout=QDRANT_TIMEOUT,
+                )
+                logger.info(
+                    f"[QDRANT] client initialized | transport="
+                    f"{'grpc:' + str(QDRANT_GRPC_PORT) if QDRANT_PREFER_GRPC else 'http:' + str(QDRANT_PORT)}"
+                )
     return _qdrant_client
 
 
+# =================================================
+# payload
+# =================================================
+def _build_payload(
+    *,
+    model_key: str,
+    content_id: int,
+    doc_id: int,
+    page_no: int,
+    chunk_no: int,
+    text: str,
+    folder_name: str,
+    title: str,
+    file_type: str,
+    source: str,
+    extra_payload: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
+    """
+    Payload 구성 (검색/필터 최적화: flatten) - 차후 확장 가능
+    - 현재는 content 기반 검색만 사용
+    - 확장 시 metadata 는 상위 레벨로 이동해야함.
+    """
+    metadata = {
+        "content_id": content_id,
+        "doc_id": doc_id,
+        "page_no": page_no,
+        "chunk_no": chunk_no,
+        "model_key": model_key,
+        "folder_name": folder_name,
+        "title": title,
+        "file_type": file_type,
+        "source": source,
+    }
+    payload = {
+        "content": text,
+        "metadata": metadata,
+    }
+
+    if extra_payload:
+        payload.update(extra_payload)
+
+    return payload
+
+
 # =================================================
 # vector insert (🔥 최종 안전 API)
 # =================================================
@@ -101,28 +168,21 @@ def insert_vector(
     )
 
     # -------------------------------------------------
-    # 3️⃣ Payload 구성 (검색/필터 최적화: flatten) - 차후 확장 가능
-    #    - 현재는 content 기반 검색만 사용
-    #    - 확장 시 metadata 는 상위 레벨로 이동해야함.
+    # 3️⃣ Payload 구성
     # -------------------------------------------------
-    metadata = {
-        "content_id": content_id,
-        "doc_id": doc_id,
-        "page_no": page_no,
-        "chunk_no": chunk_no,
-        "model_key": model_key,
-        "folder_name": folder_name,
-        "title": title,
-        "file_type": file_type,
-        "source": source,
-    }
-    payload = {
-        "content": text,
-        "metadata": metadata,
-    }
-
-    if extra_payload:
-        payload.update(extra_payload)
+    payload = _build_payload(
+        model_key=model_key,
+        content_id=content_id,
+        doc_id=doc_id,
+        page_no=page_no,
+        chunk_no=chunk_no,
+        text=text,
+        folder_name=folder_name,
+        title=title,
+        file_type=file_type,
+        source=source,
+        extra_payload=extra_payload,
+    )
 
     # -------------------------------------------------
     # 4️⃣ Qdrant upsert
@@ -152,3 +212,293 @@ def insert_vector(
         f"[VECTOR OK] collection={collection_name} "
         f"content_id={content_id}"
     )
+
+
+# =================================================
+# batch vector insert
+# =================================================
+def _is_point_error(e: Exception) -> bool:
+    """
+    요청 내용(payload / 벡터 / id) 문제인지 → point 단위 재시도로 실패 point 식별 가능
+    (연결 실패 / timeout / 서버 오류는 False → 재시도 없이 batch 전체 실패)
+    """
+    if isinstance(e, UnexpectedResponse):
+        return e.status_code is not None and 400 <= e.status_code < 500
+    if isinstance(e, grpc.RpcError):
+        return e.code() == grpc.StatusCode.INVALID_ARGUMENT
+    # client 측 검증 (pydantic ValidationError 포함)
+    return isinstance(e, (ValueError, TypeError))
+
+
+
+@dataclass
+class VectorRecord:
+    """
+    insert_vectors() 입력 단위 (insert_vector 인자와 동일)
+    """
+    content_id: int
+    doc_id: int
+    page_no: int
+    chunk_no: int
+    text: str
+    folder_name: str
+    title: str
+    file_type: str
+    source: str
+    extra_payload: Dict[str, Any] | None = None
+
+
+@dataclass
+class PointFailure:
+    """
+    upsert 실패 point (호출자 보고용)
+    """
+    point_id: int
+    error: str
+
+
+@dataclass
+class VectorWriterStats:
+    points_sent: int = 0
+    points_failed: int = 0
+    batches: int = 0
+    acknowledged: int = 0   # wait=False → 서버 접수
+    completed: int = 0      # wait=True  → 반영 완료
+    last_operation_id: int | None = None
+    flush_sec: float = 0.0
+
+
+class VectorWriter:
+    """
+    Buffered Qdrant upsert (size / time 기반 flush)
+
+    - add() 로 point 를 버퍼링, batch_size 도달 또는
+      마지막 flush 이후 flush_interval 초 경과 시 1회 upsert
+      (시간 조건은 add() 호출 시에만 확인 → 한가한 writer 의 잔여분은 flush()/close() 가 보냄)
+    - wait=False 이면 서버 접수(ACKNOWLEDGED)까지만 대기,
+      close() 의 마지막 flush 는 wait=True 로 보내 반영을 보장
+    - batch upsert 가 요청 내용 오류(4xx / INVALID_ARGUMENT)로 실패하면
+      point 단위로 재시도하여 실패 point 만 PointFailure 로 보고
+    - 연결 실패 / timeout / 서버 오류는 재시도 없이 batch 전체를 PointFailure 로 보고
+
+    사용법:
+        with VectorWriter(collection_name=..., model_key=...) as writer:
+            writer.add(record, vector)
+        writer.failures  # -> list[PointFailure]
+    """
+
+    def __init__(
+        self,
+        *,
+        collection_name: str,
+        model_key: str,
+        batch_size: int = VECTOR_WRITE_BATCH,
+        flush_interval: float = VECTOR_FLUSH_SEC,
+        wait: bool = VECTOR_UPSERT_WAIT,
+        on_failure: Callable[[PointFailure], None] | None = None,
+    ):
+        self.collection_name = collection_name
+        self.model_key = model_key
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.wait = wait
+        self.on_failure = on_failure
+
+        self.failures: List[PointFailure] = []
+        self.stats = VectorWriterStats()
+
+        self._expected_dim = get_embedding_config(model_key).vector_size
+        self._buffer: List[PointStruct] = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._closed = False
+
+    # --------------------------
+    # public
+    # --------------------------
+    def add(self, record: VectorRecord, vector: List[float]) -> None:
+        """
+        point 1건 버퍼링 (필요 시 자동 flush)
+        """
+        try:
+            assert_vector_dimension(
+                expected_dim=self._expected_dim,
+                vector=vector,
+                content_id=record.content_id,
+            )
+        except ValueError as e:
+            self._report([record.content_id], e)
+            return
+
+        point = PointStruct(
+            id=record.content_id,   # 🔥 PK 기반 (중복/재처리 안전)
+            vector=vector,
+            payload=_build_payload(
+                model_key=self.model_key,
+                content_id=record.content_id,
+                doc_id=record.doc_id,
+                page_no=record.page_no,
+                chunk_no=record.chunk_no,
+                text=record.text,
+                folder_name=record.folder_name,
+                title=record.title,
+                file_type=record.file_type,
+                source=record.source,
+                extra_payload=record.extra_payload,
+            ),
+        )
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("VectorWriter is closed")
+            self._buffer.append(point)
+            due = (
+                len(self._buffer) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+            if due:
+                self._flush_locked(wait=self.wait)
+
+    def flush(self) -> List[PointFailure]:
+        """
+        버퍼 강제 flush
+
+        Returns:
+            누적 실패 point 목록
+        """
+        with self._lock:
+            self._flush_locked(wait=self.wait)
+        return self.failures
+
+    def close(self) -> List[PointFailure]:
+        """
+        남은 버퍼 flush (wait=True) 후 종료
+        """
+        with self._lock:
+            if not self._closed:
+                self._flush_locked(wait=True)
+                self._closed = True
+        return self.failures
+
+    def abort(self) -> None:
+        """
+        남은 버퍼를 보내지 않고 종료 (이미 보낸 point 정리는 호출자 몫)
+        """
+        with self._lock:
+            self._buffer = []
+            self._closed = True
+
+    def __enter__(self) -> "VectorWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # --------------------------
+    # internal
+    # --------------------------
+    def _flush_locked(self, *, wait: bool) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+
+        points, self._buffer = self._buffer, []
+        started = time.perf_counter()
+
+        try:
+            self._upsert(points, wait=wait)
+        except Exception as e:
+            if not _is_point_error(e):
+                # Qdrant 장애 → point 별 재시도는 batch 크기 x timeout 만큼 대기만 늘림
+                self._report([p.id for p in points], e)
+            else:
+                logger.warning(
+                    f"[QDRANT UPSERT RETRY] collection={self.collection_name} "
+                    f"points={len(points)} -> per-point | {e}"
+                )
+                # 실패 point 식별을 위해 1건씩 재시도
+                for p in points:
+                    try:
+                        self._upsert([p], wait=True)
+                    except Exception as pe:
+                        self._report([p.id], pe)
+
+        self.stats.flush_sec += time.perf_counter() - started
+
+        logger.info(
+            f"[VECTOR OK] collection={self.collection_name} "
+            f"points={len(points)} wait={wait}"
+        )
+
+    def _upsert(self, points: List[PointStruct], *, wait: bool) -> None:
+        client = get_qdrant_client()
+        result = client.upsert(
+            collection_name=self.collection_name,
+            points=points,
+            wait=wait,
+        )
+
+        self.stats.batches += 1
+        self.stats.points_sent += len(points)
+        self.stats.last_operation_id = getattr(result, "operation_id", None)
+
+        status = getattr(result, "status", None)
+        if status == UpdateStatus.COMPLETED:
+            self.stats.completed += len(points)
+        elif status == UpdateStatus.ACKNOWLEDGED:
+            self.stats.acknowledged += len(points)
+
+    def _report(self, point_ids: List[int], error: Exception) -> None:
+        for pid in point_ids:
+            failure = PointFailure(point_id=pid, error=str(error))
+            self.failures.append(failure)
+            self.stats.points_failed += 1
+
+            logger.error(
+                f"[QDRANT UPSERT FAIL] "
+                f"collection={self.collection_name} "
+                f"content_id={pid} | {error}"
+            )
+
+            if self.on_failure:
+                self.on_failure(failure)
+
+
+def insert_vectors(
+    *,
+    collection_name: str,
+    model_key: str,
+    records: List[VectorRecord],
+) -> List[PointFailure]:
+    """
+    여러 chunk 를 batch 임베딩 → VectorWriter 로 bulk upsert
+
+    - embed_texts() 로 provider batch 입력 사용
+    - 빈 텍스트는 skip
+
+    Returns:
+        upsert 실패 point 목록 (임베딩 실패는 예외)
+    """
+    records = [r for r in records if r.text and r.text.strip()]
+    if not records:
+        return []
+
+    try:
+        vectors = embed_texts([r.text for r in records], model_key)
+    except Exception as e:
+        logger.error(
+            f"[EMBED FAIL] batch size={len(records)} "
+            f"content_ids={records[0].content_id}..{records[-1].content_id} | {e}"
+        )
+        raise
+
+    writer = VectorWriter(
+        collection_name=collection_name,
+        model_key=model_key,
+        batch_size=len(records),
+    )
+    with writer:
+        for r, vector in zip(records, vectors):
+            writer.add(r, vector)
+
+    return writer.failures
@@ -1,16 +1,19 @@
 import os
 import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from watchdog.events import FileSystemEventHandler, FileMovedEvent
 
 from config.db import SessionLocal
 from services.ingest import ingest_file
-from services.utils.file_hash import file_sha1
-from services.utils.file_ops import move_file
+from services.ingest_job import IngestJob
+from services.utils.file_ops import move_file, resolve_duplicate_filename
 from models.meta import MetaTable
 from models.folder_status import FolderStatus
 from pipeline import status_store
+from watcher.worker_pool import IngestWorkerPool
 
 
 
@@ -43,27 +46,47 @@ class IngestHandler(FileSystemEventHandler):
     ✅ 파일 + 폴더 모두 처리
     ✅ 폴더 단위 상태 관리: NEW -> INGESTING -> DONE/ERROR
     ✅ 문서 메타에는 folder_name 포함
+    ✅ observer 스레드는 이벤트 수신만, 파일 처리는 worker pool 에서 병렬 실행
     """
 
-    def __init__(self):
+    def __init__(self, pool: IngestWorkerPool | None = None):
         super().__init__()
         ensure_dirs()
+        self.pool = pool or IngestWorkerPool()
+        # 폴더 안정화 대기/집계 전용 (파일 job 은 pool 로 fan-out)
+        self._dir_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="ingest-dir",
+        )
 
     # --------------------------
     # 이벤트
     # --------------------------
     def on_created(self, event):
         if event.is_directory:
-            self._handle_directory(event.src_path)
+            self.submit_directory(event.src_path)
         else:
-            self._handle_file(event.src_path)
+            self.submit_file(event.src_path)
 
     def on_moved(self, event: FileMovedEvent):
         path = event.dest_path
         if event.is_directory:
-            self._handle_directory(path)
+            self.submit_directory(path)
         else:
-            self._handle_file(path)
+            self.submit_file(path)
+
+    # --------------------------
+    # worker pool 제출
+    # --------------------------
+    def submit_file(self, src_path: str) -> Future:
+        return self.pool.submit(self._handle_file, src_path)
+
+    def submit_directory(self, dir_path: str) -> Future:
+        return self._dir_executor.submit(self._handle_directory, dir_path)
+
+    def shutdown(self, wait: bool = True):
+        self._dir_executor.shutdown(wait=wait, cancel_futures=True)
+        self.pool.shutdown(wait=wait)
 
     # --------------------------
     # 폴더 처리 + 폴더 상태 관리 (핵심)
@@ -113,13 +136,15 @@ class IngestHandler(FileSystemEventHandler):
         finally:
             db.close()
 
-        # 2) 폴더 내 파일들 처리 (파일 단위 기존 로직 재사용)
+        # 2) 폴더 내 파일들 처리 (worker pool 로 병렬 처리 후 집계)
         processed_ok = 0
         processed_err = 0
 
-        for p in files:
+        futures = [self.submit_file(str(p)) for p in files]
+
+        for future in futures:
             try:
-                self._handle_file(str(p))
+                future.result()
                 processed_ok += 1
             except Exception:
                 # _handle_file 내부에서 예외를 안 던지도록 해도 되지만,
@@ -183,33 +208,46 @@ class IngestHandler(FileSystemEventHandler):
             print(f"[SKIP] file not ready: {src_path}")
             return
 
-        # incoming -> processing
+        # incoming -> processing/<job id>/ (다른 폴더의 같은 파일명과 충돌 방지, 파일명은 유지)
+        job_dir = os.path.join(PROCESSING_DIR, uuid.uuid4().hex)
         try:
-            move_file(src_path, PROCESSING_DIR)
+            processing_path = move_file(src_path, job_dir)
         except Exception as e:
             print(f"[ERROR] move to processing failed: {src_path} -> {e}")
+            self._remove_job_dir(job_dir)
             raise
 
-        processing_path = os.path.join(PROCESSING_DIR, os.path.basename(src_path))
+        if processing_path is None:
+            # 다른 job 이 먼저 가져감
+            self._remove_job_dir(job_dir)
+            return
 
         db = SessionLocal()
         try:
-            file_hash = file_sha1(processing_path)
+            # 해시 1회 계산 → ingest_file 까지 job 으로 전달
+            job = IngestJob.from_path(
+                processing_path,
+                source="watcher",
+                folder_name=folder_name,
+            )
 
-            exists = db.query(MetaTable).filter(MetaTable.file_hash == file_hash).first()
+            exists = db.query(MetaTable).filter(MetaTable.file_hash == job.file_hash).first()
             if exists:
-                move_file(processing_path, DUPLICATED_DIR)
+                self._move_out(processing_path, DUPLICATED_DIR)
                 print(f"[DUPLICATE] {processing_path}")
                 return
 
+            job.duplicate_checked = True
+
             ingest_file(
                 file_path=processing_path,
                 source="watcher",
                 db=db,
-                folder_name=folder_name
+                folder_name=folder_name,
+                job=job,
             )
 
-            move_file(processing_path, PROCESSED_DIR)
+            self._move_out(processing_path, PROCESSED_DIR)
             print(f"[OK] processed: {processing_path}")
 
         except Exception as e:
@@ -219,7 +257,7 @@ class IngestHandler(FileSystemEventHandler):
                 pass
 
             try:
-                move_file(processing_path, ERROR_DIR)
+                self._move_out(processing_path, ERROR_DIR)
             except Exception:
                 pass
 
@@ -228,6 +266,25 @@ class IngestHandler(FileSystemEventHandler):
 
         finally:
             db.close()
+            self._remove_job_dir(job_dir)
+
+    def _move_out(self, processing_path: str, dest_dir: str):
+        """
+        processing/<job id>/ → 결과 폴더 (같은 이름이 있으면 "name (1).ext")
+        """
+        name = os.path.basename(processing_path)
+        os.makedirs(dest_dir, exist_ok=True)
+        move_file(
+            processing_path,
+            dest_dir,
+            dest_name=resolve_duplicate_filename(dest_dir, name),
+        )
+
+    def _remove_job_dir(self, job_dir: str):
+        try:
+            os.rmdir(job_dir)
+        except OSError:
+            pass
 
     # --------------------------
     # 파일 안정화
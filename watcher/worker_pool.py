@@ -0,0 +1,135 @@
+# watcher/worker_pool.py
+"""
+파일 ingest worker pool
+
+watchdog observer 스레드는 이벤트 수신만 하고,
+실제 파일 처리(_handle_file)는 이 pool 의 worker 스레드에서 실행한다.
+(각 job 은 _handle_file 내부에서 자기 SessionLocal 세션 사용)
+
+같은 파일 경로는 동시에 1개 job 만 실행된다
+(폴더 on_created 와 파일 on_created 가 같은 경로를 제출하는 경우 → 기존 Future 반환)
+"""
+
+import os
+import time
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Callable, Dict
+
+logger = logging.getLogger("pipeline")
+
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+
+@dataclass
+class WorkerStats:
+    worker: str
+    jobs: int = 0
+    ok: int = 0
+    failed: int = 0
+    busy_sec: float = 0.0
+    current_file: str | None = None
+    last_finished_at: datetime | None = None
+
+
+class IngestWorkerPool:
+    """
+    ThreadPoolExecutor + worker 별 처리 통계
+
+    사용법:
+        pool = IngestWorkerPool(max_workers=4)
+        future = pool.submit(handler._handle_file, path)
+        pool.metrics()
+    """
+
+    def __init__(self, max_workers: int = INGEST_WORKERS):
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="ingest-worker",
+        )
+        self._lock = threading.Lock()
+        self._workers: Dict[str, WorkerStats] = {}
+        self._queued = 0
+        # 대기/처리 중인 파일 경로 → Future
+        self._in_flight: Dict[str, Future] = {}
+
+    def submit(self, fn: Callable[[str], None], file_path: str) -> Future:
+        key = os.path.abspath(file_path)
+
+        with self._lock:
+            existing = self._in_flight.get(key)
+            if existing is not None:
+                logger.info(f"[WORKER] already in flight, reuse job: {file_path}")
+                return existing
+
+            self._queued += 1
+            future = self._executor.submit(self._run, fn, file_path)
+            self._in_flight[key] = future
+
+        future.add_done_callback(lambda f: self._on_done(key, f))
+        return future
+
+    def metrics(self) -> dict:
+        with self._lock:
+            workers = [asdict(w) for w in self._workers.values()]
+            queued = self._queued
+            in_flight = len(self._in_flight)
+
+        return {
+            "max_workers": self.max_workers,
+            "queued": queued,
+            "in_flight": in_flight,
+            "active": sum(1 for w in workers if w["current_file"]),
+            "processed": sum(w["ok"] for w in workers),
+            "failed": sum(w["failed"] for w in workers),
+            "workers": sorted(workers, key=lambda w: w["worker"]),
+        }
+
+    def shutdown(self, wait: bool = True):
+        """
+        대기 중인 job 은 취소 (incoming 에 그대로 남아 다음 시작 시 재스캔),
+        처리 중인 job 은 완료까지 대기
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    # --------------------------
+    # 내부
+    # --------------------------
+    def _on_done(self, key: str, future: Future):
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+            # shutdown 으로 취소된 job 은 _run 이 실행되지 않음
+            if future.cancelled():
+                self._queued -= 1
+
+    def _run(self, fn: Callable[[str], None], file_path: str):
+        name = threading.current_thread().name
+
+        with self._lock:
+            self._queued -= 1
+            stats = self._workers.setdefault(name, WorkerStats(worker=name))
+            stats.jobs += 1
+            stats.current_file = file_path
+
+        started = time.perf_counter()
+        ok = False
+        try:
+            fn(file_path)
+            ok = True
+        except Exception as e:
+            logger.error(f"[WORKER] {name} failed: {file_path} -> {e}")
+            raise
+        finally:
+            with self._lock:
+                stats.busy_sec += time.perf_counter() - started
+                stats.current_file = None
+                stats.last_finished_at = datetime.now()
+                if ok:
+                    stats.ok += 1
+                else:
+                    stats.failed += 1